@@ -0,0 +1,124 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Returned by LRUCache.get when a key is absent or expired, so that a cached
+# None (a negative entry) can be told apart from a miss
+MISSING: Any = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a cache has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Get the fraction of lookups that were served from the cache.
+
+        Returns:
+            float: Hit ratio between 0 and 1
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """In-process LRU cache with a per-entry time to live.
+
+    The cache is not thread-safe; it is meant to be shared by the coroutines
+    of a single event loop, where no operation yields control.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Number of entries kept before the least recently
+                used one is evicted
+            ttl: Default number of seconds an entry stays valid
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        # Counts invalidations; a value loaded while it changed may be stale
+        self.generation = 0
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of entries, including expired ones not yet purged."""
+        return len(self._entries)
+
+    def get(self, key: K) -> V:
+        """Look up a key and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            V: Cached value, or MISSING if absent or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return MISSING
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store a value, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds the entry stays valid; the cache default if None
+        """
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        """Drop a key if it is cached.
+
+        Args:
+            key: Cache key
+        """
+        self.generation += 1
+        if self._entries.pop(key, MISSING) is not MISSING:
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.generation += 1
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
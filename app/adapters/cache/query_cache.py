@@ -0,0 +1,166 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from app.adapters.cache.lru_cache import CacheStats
+
+V = TypeVar("V")
+
+
+class QueryCache:
+    """In-process cache for query results, bounded by an estimated size.
+
+    Entries are keyed on the table they read from, that table's current
+    generation and a normalized description of the query. A write bumps the
+    table's generation, so every cached result for the table stops matching
+    at once without tracking which rows each result contains; the orphaned
+    entries are evicted as the cache fills up.
+
+    Concurrent lookups of the same missing key share one computation, so an
+    expired popular query hits the database once rather than once per
+    waiting request. If the request running the computation is cancelled,
+    one of the waiting requests runs it again instead.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Upper bound on the estimated size of all entries
+            ttl: Number of seconds an entry stays valid
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self.size_bytes = 0
+        self._clock = clock
+        self._generations: dict[str, int] = {}
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def generation(self, table: str) -> int:
+        """Get the current generation of a table.
+
+        Args:
+            table: Table name
+
+        Returns:
+            int: Number of writes recorded for the table
+        """
+        return self._generations.get(table, 0)
+
+    def bump(self, table: str) -> None:
+        """Record a write, invalidating every cached result for a table.
+
+        Args:
+            table: Table name
+        """
+        self._generations[table] = self.generation(table) + 1
+
+    async def get_or_compute(
+        self,
+        table: str,
+        query: Hashable,
+        compute: Callable[[], Awaitable[V]],
+        sizeof: Callable[[V], int],
+    ) -> V:
+        """Return a cached result, computing and storing it on a miss.
+
+        Args:
+            table: Table the query reads from
+            query: Normalized, hashable description of the query
+            compute: Coroutine function running the query
+            sizeof: Estimates the size in bytes of a result
+
+        Returns:
+            V: Query result
+        """
+        while True:
+            key = (table, self.generation(table), query)
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, size, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return value  # type: ignore[no-any-return]
+                self._remove(key)
+                self.stats.expirations += 1
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+            # Unlike awaiting the future, waiting on it neither cancels the
+            # computation if this request is cancelled nor raises if the
+            # request computing it is
+            await asyncio.wait((in_flight,))
+            if not in_flight.cancelled():
+                self.stats.hits += 1
+                return in_flight.result()  # type: ignore[no-any-return]
+            # The request computing it was cancelled: look again, computing
+            # it here unless another waiter already took over
+
+        self.stats.misses += 1
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; mark it retrieved in case there are none
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            # A write during the computation may have made the result stale
+            if key[1] == self.generation(table):
+                self._store(key, value, sizeof(value))
+            return value
+        finally:
+            del self._in_flight[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def _store(self, key: Hashable, value: Any, size: int) -> None:
+        """Store an entry, evicting least recently used ones to fit it.
+
+        Args:
+            key: Cache key
+            value: Query result
+            size: Estimated size of the result in bytes
+        """
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = (self._clock() + self.ttl, size, value)
+        self.size_bytes += size
+
+        while self.size_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry and release its size.
+
+        Args:
+            key: Cache key
+        """
+        _, size, _ = self._entries.pop(key)
+        self.size_bytes -= size
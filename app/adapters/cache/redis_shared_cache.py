@@ -0,0 +1,125 @@
+from collections.abc import AsyncIterator
+
+from redis import asyncio as aioredis
+
+from app.adapters.cache.shared_cache import SharedCache
+
+
+class RedisSharedCache(SharedCache):
+    """SharedCache backed by a Redis (or Redis-protocol) server."""
+
+    def __init__(self, url: str) -> None:
+        """Initialize the client; connections are opened on first use.
+
+        Args:
+            url: Redis connection URL
+        """
+        super().__init__()
+        self._redis = aioredis.from_url(url)
+
+    async def get(self, key: str) -> bytes | None:
+        """Get a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bytes | None: Stored value, or None if absent or expired
+        """
+        value: bytes | None = await self._redis.get(key)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    async def get_many(self, *keys: str) -> list[bytes | None]:
+        """Get several values in one round trip.
+
+        Args:
+            *keys: Cache keys
+
+        Returns:
+            list[bytes | None]: Stored values in key order, None where absent
+        """
+        values: list[bytes | None] = await self._redis.mget(keys)
+        found = sum(value is not None for value in values)
+        self.stats.hits += found
+        self.stats.misses += len(values) - found
+        return values
+
+    async def incr(self, key: str) -> int:
+        """Atomically increment a counter that never expires.
+
+        Args:
+            key: Counter key
+
+        Returns:
+            int: Value after the increment
+        """
+        return int(await self._redis.incr(key))
+
+    async def incr_many(self, *keys: str, ttl: float) -> None:
+        """Atomically increment several expiring counters in one round trip.
+
+        Args:
+            *keys: Counter keys
+            ttl: Seconds each counter lives after its last increment
+        """
+        if not keys:
+            return
+        async with self._redis.pipeline(transaction=True) as pipeline:
+            for key in keys:
+                pipeline.incr(key)
+                pipeline.pexpire(key, max(int(ttl * 1000), 1))
+            await pipeline.execute()
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds the value stays valid
+        """
+        await self._redis.set(key, value, px=max(int(ttl * 1000), 1))
+
+    async def delete(self, *keys: str) -> None:
+        """Delete values.
+
+        Args:
+            *keys: Cache keys
+        """
+        if keys:
+            self.stats.invalidations += await self._redis.delete(*keys)
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        """Send a message to every subscriber of a channel.
+
+        Args:
+            channel: Channel name
+            message: Message payload
+        """
+        await self._redis.publish(channel, message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        """Receive the messages published to a channel from now on.
+
+        Args:
+            channel: Channel name
+
+        Yields:
+            bytes: Message payloads
+        """
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._redis.aclose()
@@ -0,0 +1,272 @@
+import abc
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+
+from app.adapters.cache.lru_cache import CacheStats
+
+
+class SharedCache(abc.ABC):
+    """Key-value store with publish/subscribe shared by all worker processes.
+
+    This is the second cache tier: every gunicorn worker reads and writes
+    the same entries, and invalidation messages published by one worker
+    reach the subscribers in all of them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the usage counters."""
+        self.stats = CacheStats()
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Get a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bytes | None: Stored value, or None if absent or expired
+        """
+        pass
+
+    @abc.abstractmethod
+    async def get_many(self, *keys: str) -> list[bytes | None]:
+        """Get several values in one round trip.
+
+        Args:
+            *keys: Cache keys
+
+        Returns:
+            list[bytes | None]: Stored values in key order, None where absent
+        """
+        pass
+
+    @abc.abstractmethod
+    async def incr(self, key: str) -> int:
+        """Atomically increment a counter that never expires.
+
+        Args:
+            key: Counter key
+
+        Returns:
+            int: Value after the increment
+        """
+        pass
+
+    @abc.abstractmethod
+    async def incr_many(self, *keys: str, ttl: float) -> None:
+        """Atomically increment several expiring counters in one round trip.
+
+        Args:
+            *keys: Counter keys
+            ttl: Seconds each counter lives after its last increment
+        """
+        pass
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds the value stays valid
+        """
+        pass
+
+    @abc.abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Delete values.
+
+        Args:
+            *keys: Cache keys
+        """
+        pass
+
+    @abc.abstractmethod
+    async def publish(self, channel: str, message: bytes) -> None:
+        """Send a message to every subscriber of a channel.
+
+        Args:
+            channel: Channel name
+            message: Message payload
+        """
+        pass
+
+    @abc.abstractmethod
+    def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        """Receive the messages published to a channel from now on.
+
+        Args:
+            channel: Channel name
+
+        Returns:
+            AsyncIterator[bytes]: Message payloads, until the connection drops
+        """
+        pass
+
+    @abc.abstractmethod
+    async def close(self) -> None:
+        """Release any connections held by the cache."""
+        pass
+
+
+class InMemorySharedCache(SharedCache):
+    """SharedCache kept in the current process.
+
+    It stands in for a Redis server in tests and single-process development:
+    several repositories given the same instance behave like workers sharing
+    one server.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize an empty store.
+
+        Args:
+            clock: Monotonic time source, replaceable in tests
+        """
+        super().__init__()
+        self._clock = clock
+        self._values: dict[str, tuple[float, bytes]] = {}
+        self._subscribers: dict[str, list[asyncio.Queue[bytes]]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        """Get a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bytes | None: Stored value, or None if absent or expired
+        """
+        entry = self._values.get(key)
+        if entry is None or entry[0] <= self._clock():
+            self._values.pop(key, None)
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return entry[1]
+
+    async def get_many(self, *keys: str) -> list[bytes | None]:
+        """Get several values in one round trip.
+
+        Args:
+            *keys: Cache keys
+
+        Returns:
+            list[bytes | None]: Stored values in key order, None where absent
+        """
+        return [await self.get(key) for key in keys]
+
+    async def incr(self, key: str) -> int:
+        """Atomically increment a counter that never expires.
+
+        Args:
+            key: Counter key
+
+        Returns:
+            int: Value after the increment
+        """
+        return self._incr(key, float("inf"))
+
+    async def incr_many(self, *keys: str, ttl: float) -> None:
+        """Atomically increment several expiring counters in one round trip.
+
+        Args:
+            *keys: Counter keys
+            ttl: Seconds each counter lives after its last increment
+        """
+        for key in keys:
+            self._incr(key, self._clock() + ttl)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds the value stays valid
+        """
+        self._values[key] = (self._clock() + ttl, value)
+
+    async def delete(self, *keys: str) -> None:
+        """Delete values.
+
+        Args:
+            *keys: Cache keys
+        """
+        for key in keys:
+            if self._values.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        """Send a message to every subscriber of a channel.
+
+        Args:
+            channel: Channel name
+            message: Message payload
+        """
+        for queue in self._subscribers.get(channel, []):
+            queue.put_nowait(message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        """Receive the messages published to a channel from now on.
+
+        Args:
+            channel: Channel name
+
+        Yields:
+            bytes: Message payloads
+        """
+        queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._subscribers.setdefault(channel, []).append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers[channel].remove(queue)
+
+    async def close(self) -> None:
+        """Drop every stored value."""
+        self._values.clear()
+
+    def _incr(self, key: str, expires_at: float) -> int:
+        """Increment a counter, treating an expired one as absent.
+
+        Args:
+            key: Counter key
+            expires_at: Clock time the counter expires at
+
+        Returns:
+            int: Value after the increment
+        """
+        entry = self._values.get(key)
+        value = 1
+        if entry is not None and entry[0] > self._clock():
+            value = int(entry[1]) + 1
+        self._values[key] = (expires_at, str(value).encode())
+        return value
+
+
+def create_shared_cache(url: str) -> SharedCache:
+    """Create the shared cache for a URL.
+
+    Args:
+        url: ``memory://`` for an in-process store, or a ``redis://`` /
+            ``rediss://`` URL
+
+    Returns:
+        SharedCache: Cache instance
+
+    Raises:
+        ValueError: If the URL scheme is not supported
+    """
+    if url.startswith("memory://"):
+        return InMemorySharedCache()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        # Imported here so the redis package is only needed when configured
+        from app.adapters.cache.redis_shared_cache import RedisSharedCache
+
+        return RedisSharedCache(url)
+    raise ValueError(f"Unsupported shared cache URL: {url!r}")
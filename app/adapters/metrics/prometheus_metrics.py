@@ -0,0 +1,159 @@
+import os
+from collections.abc import Callable
+from typing import Any
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Finer than the client's default buckets at the low end, where most
+# repository calls and statements finish
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Statement kinds reported by name; anything else is reported as OTHER
+SQL_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests handled",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being handled",
+    ["method", "route"],
+    # Summed over the live workers when they share PROMETHEUS_MULTIPROC_DIR
+    multiprocess_mode="livesum",
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to handle HTTP requests, including sending the response",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+REPOSITORY_CALL_DURATION = Histogram(
+    "repository_call_duration_seconds",
+    "Time spent in repository methods",
+    ["repository", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+SQL_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "Time to execute SQL statements",
+    ["database", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# Children of the metrics above by label values
+_children: dict[tuple[Any, ...], Any] = {}
+
+
+def labelled(metric: Any, *labels: str) -> Any:
+    """Get the child of a metric for some label values.
+
+    The client's ``labels()`` takes a lock on every call; children found
+    here once are looked up in a plain dict afterwards, so recording a
+    value only takes the child's own lock.
+
+    Args:
+        metric: Counter, Gauge or Histogram defined with label names
+        *labels: Label values, in the order the names were given
+
+    Returns:
+        Any: Child to record values on
+    """
+    key = (metric, *labels)
+    child = _children.get(key)
+    if child is None:
+        child = _children[key] = metric.labels(*labels)
+    return child
+
+
+def repository_timer(repository: str) -> Callable[[str, float], None]:
+    """Get a function recording how long a repository's methods take.
+
+    Args:
+        repository: Name of the repository, used as a label
+
+    Returns:
+        Callable[[str, float], None]: Function taking a method name and the
+        seconds a call to it took
+    """
+
+    def observe(method: str, seconds: float) -> None:
+        labelled(REPOSITORY_CALL_DURATION, repository, method).observe(seconds)
+
+    return observe
+
+
+def statement_timer(database: str) -> Callable[[str, float], None]:
+    """Get a function recording how long a database's SQL statements take.
+
+    Args:
+        database: Name of the database, used as a label
+
+    Returns:
+        Callable[[str, float], None]: Function taking a statement's text and
+        the seconds it took
+    """
+
+    def observe(statement: str, seconds: float) -> None:
+        labelled(SQL_STATEMENT_DURATION, database, sql_operation(statement)).observe(
+            seconds
+        )
+
+    return observe
+
+
+def sql_operation(statement: str) -> str:
+    """Get the kind of a SQL statement from its first keyword.
+
+    Args:
+        statement: SQL text
+
+    Returns:
+        str: SELECT, INSERT, UPDATE, DELETE, WITH or OTHER
+    """
+    words = statement[:16].split(None, 1)
+    keyword = words[0].upper() if words else ""
+    return keyword if keyword in SQL_OPERATIONS else "OTHER"
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Render the metrics in the Prometheus text format.
+
+    When PROMETHEUS_MULTIPROC_DIR is set, every worker process writes its
+    values to files in that directory and the result combines all of them,
+    so a scrape served by any worker covers the whole server. Otherwise it
+    covers this process only.
+
+    Returns:
+        tuple[bytes, str]: Metrics and their content type
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,615 @@
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from app.adapters.cache.lru_cache import MISSING, LRUCache
+from app.adapters.cache.query_cache import QueryCache
+from app.adapters.cache.shared_cache import SharedCache
+from app.core.domain.item import Item, ItemRecord
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.item_sort import ItemSort
+from app.core.domain.item_stats import ItemStats
+from app.core.domain.pagination import Page
+from app.core.domain.result_version import ResultVersion
+from app.core.ports.item_repository import ItemRepository
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+ITEMS_TABLE = "items"
+INVALIDATION_CHANNEL = "items:invalidate"
+# Bumped by writes that cannot name the items they changed; shared entries
+# written under an older generation are ignored
+GENERATION_KEY = "items:generation"
+# Per-item counters outlive the shared entries stamped with them by this
+# factor, so an expired counter cannot revive an entry it retired
+VERSION_TTL_FACTOR = 2
+# Stored in the shared cache for IDs that do not exist
+NOT_FOUND = b"null"
+# Rough footprint of one cached Item excluding its string contents, used to
+# keep the query cache within its byte budget
+ITEM_SIZE_BYTES = 1200
+
+
+class CachedItemRepository(ItemRepository):
+    """Read-through cache in front of another ItemRepository.
+
+    Lookups by ID are served from a shared LRU cache, including lookups of
+    IDs that do not exist (negative entries, kept for a shorter time). List,
+    search, page and count queries are served from a query cache keyed on
+    the normalized query and the items table's generation.
+
+    With a shared cache, entity lookups that miss the in-process cache try
+    the shared tier before the database, so a hot item is read from the
+    database once per node rather than once per worker.
+
+    Every write, once it has completed, drops the entity entries it may have
+    changed (by ID when the affected IDs are known, otherwise all of them)
+    and bumps the table generation. With a shared cache it also bumps the
+    version of each written item (or the shared generation, which retires
+    every entry) and publishes the invalidation, which
+    listen_for_invalidations applies to the in-process caches of every
+    worker.
+
+    A read that overlaps a write may load the old row, so no read caches
+    what it loaded across an invalidation: shared entries are stamped with
+    the generation and item version seen before the database read and only
+    served while both are current, and in-process entries are not stored
+    if the cache was invalidated during the read. Any cache can be left
+    out, in which case those reads pass through.
+
+    Sparse field reads use the port's defaults, which project the cached
+    full items instead of selecting fewer columns.
+    """
+
+    def __init__(
+        self,
+        repository: ItemRepository,
+        cache: LRUCache[Any, Item | None] | None,
+        negative_ttl: float | None = None,
+        query_cache: QueryCache | None = None,
+        shared_cache: SharedCache | None = None,
+        shared_ttl: float = 60.0,
+    ) -> None:
+        """Initialize the decorator.
+
+        Args:
+            repository: Repository to read through to
+            cache: Entity cache shared by every request in the process
+            negative_ttl: Seconds a "not found" result stays cached; the
+                cache's default TTL if None
+            query_cache: Query result cache shared by every request in the
+                process
+            shared_cache: Entity cache shared by every worker process
+            shared_ttl: Seconds an item stays in the shared cache
+        """
+        self.repository = repository
+        self.cache = cache
+        self.negative_ttl = negative_ttl
+        self.query_cache = query_cache
+        self.shared_cache = shared_cache
+        self.shared_ttl = shared_ttl
+        self.version_ttl = VERSION_TTL_FACTOR * max(shared_ttl, negative_ttl or 0)
+
+    async def get(self, id: Any) -> Item | None:
+        """Get an item by ID, from the cache when possible.
+
+        Args:
+            id: Item ID
+
+        Returns:
+            Item | None: Item if found, None otherwise
+        """
+        if self.cache is not None:
+            cached = self.cache.get(id)
+            if cached is not MISSING:
+                # Hand out copies so callers cannot mutate the cached entry
+                return None if cached is None else cached.model_copy()
+
+        generation = 0 if self.cache is None else self.cache.generation
+        item = await self._get_shared(id)
+        # A write during the read may have made the item stale
+        if self.cache is not None and self.cache.generation == generation:
+            if item is None:
+                self.cache.set(id, None, ttl=self.negative_ttl)
+            else:
+                self.cache.set(id, item.model_copy())
+        return item
+
+    async def _get_shared(self, id: Any) -> Item | None:
+        """Get an item from the shared cache, falling back to the database.
+
+        Args:
+            id: Item ID
+
+        Returns:
+            Item | None: Item if found, None otherwise
+        """
+        if self.shared_cache is None:
+            return await self.repository.get(id)
+
+        # Shared entries are "<generation>.<version>:<item JSON or null>"
+        key = _shared_key(id)
+        generation, version, raw = await self.shared_cache.get_many(
+            GENERATION_KEY, _version_key(id), key
+        )
+        stamp = (generation or b"0") + b"." + (version or b"0") + b":"
+        if raw is not None and raw.startswith(stamp):
+            payload = raw[len(stamp) :]
+            if payload == NOT_FOUND:
+                return None
+            return Item.model_validate_json(payload)
+
+        # If a write commits after this read, it bumps a version in the
+        # stamp, so the entry is never served even if stored after the bump
+        item = await self.repository.get(id)
+        if item is None:
+            ttl = self.shared_ttl if self.negative_ttl is None else self.negative_ttl
+            await self.shared_cache.set(key, stamp + NOT_FOUND, ttl)
+        else:
+            payload = item.model_dump_json().encode()
+            await self.shared_cache.set(key, stamp + payload, self.shared_ttl)
+        return item
+
+    async def get_all(self, filters: ItemFilter | None = None) -> list[Item]:
+        """Get all items, with optional filtering.
+
+        Args:
+            filters: Criteria the items must match, if any
+
+        Returns:
+            list[Item]: List of items
+        """
+        return await self._query(
+            ("get_all", filters), lambda: self.repository.get_all(filters)
+        )
+
+    async def get_page(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> Page[Item]:
+        """Get one page of items.
+
+        Args:
+            limit: Maximum number of items to return
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            Page[Item]: Items on the page and the cursor for the next one
+        """
+        sort = sort or ItemSort()
+        return await self._query(
+            ("get_page", limit, after, filters, sort),
+            lambda: self.repository.get_page(limit, after, filters, sort),
+        )
+
+    async def get_page_version(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> ResultVersion:
+        """Summarize the page get_page would return, without loading it.
+
+        Args:
+            limit: Maximum number of items on the page
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            ResultVersion: Version of the page
+        """
+        sort = sort or ItemSort()
+        return await self._query(
+            ("get_page_version", limit, after, filters, sort),
+            lambda: self.repository.get_page_version(limit, after, filters, sort),
+        )
+
+    async def find_by_name_version(
+        self, name: str, limit: int | None = None
+    ) -> ResultVersion:
+        """Summarize the result find_by_name would return, without loading it.
+
+        Args:
+            name: Item name to search for
+            limit: Maximum number of items to consider, if given
+
+        Returns:
+            ResultVersion: Version of the search result
+        """
+        return await self._query(
+            ("find_by_name_version", name, limit),
+            lambda: self.repository.find_by_name_version(name, limit),
+        )
+
+    def stream_all(
+        self, chunk_size: int, filters: ItemFilter | None = None
+    ) -> AsyncIterator[ItemRecord]:
+        """Iterate over all items without loading them at once.
+
+        Args:
+            chunk_size: Number of rows to fetch per round trip
+            filters: Criteria the items must match, if any
+
+        Returns:
+            AsyncIterator[ItemRecord]: Items in ID order
+        """
+        return self.repository.stream_all(chunk_size, filters)
+
+    async def find_by_name(self, name: str, limit: int | None = None) -> list[Item]:
+        """Find items by name (partial match), best matches first.
+
+        Args:
+            name: Item name to search for
+            limit: Maximum number of items to return, if given
+
+        Returns:
+            list[Item]: List of matching items, ordered by relevance
+        """
+        return await self._query(
+            ("find_by_name", name, limit),
+            lambda: self.repository.find_by_name(name, limit),
+        )
+
+    async def find_active_items(self) -> list[Item]:
+        """Find all active items.
+
+        Returns:
+            list[Item]: List of active items
+        """
+        return await self._query(
+            ("find_active_items",), self.repository.find_active_items
+        )
+
+    async def count(self, item_filter: ItemFilter) -> int:
+        """Count the items matching a filter.
+
+        Args:
+            item_filter: Criteria selecting the items to count
+
+        Returns:
+            int: Number of matching items
+        """
+        return await self._query(
+            ("count", item_filter), lambda: self.repository.count(item_filter)
+        )
+
+    async def get_stats(
+        self,
+        bucket_width: float,
+        filters: ItemFilter | None = None,
+        max_buckets: int | None = None,
+    ) -> ItemStats:
+        """Compute aggregate statistics over the matching items.
+
+        Args:
+            bucket_width: Width of the price histogram buckets
+            filters: Criteria the items must match, if any
+            max_buckets: Most buckets the histogram may span, empty ones
+                included; no limit if None
+
+        Returns:
+            ItemStats: Counts, price summary and price histogram
+
+        Raises:
+            TooManyBucketsError: If the histogram would span more than
+                ``max_buckets`` buckets
+        """
+        return await self._query(
+            ("get_stats", bucket_width, filters, max_buckets),
+            lambda: self.repository.get_stats(bucket_width, filters, max_buckets),
+        )
+
+    async def create(self, entity: Item) -> Item:
+        """Create a new item and invalidate the caches.
+
+        Args:
+            entity: Item to create
+
+        Returns:
+            Item: Created item
+        """
+        item = await self.repository.create(entity)
+        await self._written([item.id])
+        return item
+
+    async def create_many(self, entities: list[Item], chunk_size: int) -> list[Item]:
+        """Create many items and invalidate the caches.
+
+        Args:
+            entities: Items to create
+            chunk_size: Maximum number of rows to send per INSERT statement
+
+        Returns:
+            list[Item]: Created items, in the same order as ``entities``
+        """
+        items = await self.repository.create_many(entities, chunk_size)
+        await self._written([item.id for item in items])
+        return items
+
+    async def update(self, id: Any, entity: Item) -> Item | None:
+        """Update an existing item and invalidate the caches.
+
+        Args:
+            id: Item ID
+            entity: Updated item data
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+        """
+        item = await self.repository.update(id, entity)
+        await self._written([id])
+        return item
+
+    async def patch(self, id: Any, changes: dict[str, Any]) -> Item | None:
+        """Update only the given fields of an item and invalidate the caches.
+
+        Args:
+            id: Item ID
+            changes: Field name to new value mapping
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+        """
+        item = await self.repository.patch(id, changes)
+        await self._written([id])
+        return item
+
+    async def apply_discount(self, id: Any, discount_percent: float) -> Item | None:
+        """Discount an item's price and invalidate the caches.
+
+        Args:
+            id: Item ID
+            discount_percent: Discount percentage (0-100)
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+        """
+        item = await self.repository.apply_discount(id, discount_percent)
+        await self._written([id])
+        return item
+
+    async def apply_discount_batch(
+        self,
+        item_filter: ItemFilter,
+        discount_percent: float,
+        after_id: Any | None,
+        chunk_size: int,
+    ) -> tuple[int, Any | None]:
+        """Discount the next chunk of matching items and invalidate the caches.
+
+        Args:
+            item_filter: Criteria selecting the items to discount
+            discount_percent: Discount percentage (0-100)
+            after_id: Only consider items with a greater ID, if given
+            chunk_size: Maximum number of items to discount
+
+        Returns:
+            tuple[int, Any | None]: Number of items discounted and the ID the
+            next chunk starts after, or None when no matching items remain
+        """
+        result = await self.repository.apply_discount_batch(
+            item_filter, discount_percent, after_id, chunk_size
+        )
+        # The affected IDs are not known individually
+        await self._written(None)
+        return result
+
+    async def update_many(
+        self, changes: dict[Any, dict[str, Any]], chunk_size: int
+    ) -> list[Any]:
+        """Apply partial updates to many items and invalidate the caches.
+
+        Args:
+            changes: Mapping of item ID to the fields to change for that item
+            chunk_size: Maximum number of rows to send per statement
+
+        Returns:
+            list[Any]: IDs from ``changes`` that did not match any item
+        """
+        not_found = await self.repository.update_many(changes, chunk_size)
+        await self._written(list(changes))
+        return not_found
+
+    async def delete(self, id: Any) -> bool:
+        """Delete an item by ID and invalidate the caches.
+
+        Args:
+            id: Item ID
+
+        Returns:
+            bool: True if deleted, False if not found
+        """
+        deleted = await self.repository.delete(id)
+        await self._written([id])
+        return deleted
+
+    async def delete_many(
+        self,
+        chunk_size: int,
+        ids: list[Any] | None = None,
+        filters: ItemFilter | None = None,
+    ) -> int:
+        """Delete many items and invalidate the caches.
+
+        Args:
+            chunk_size: Maximum number of rows to delete per statement
+            ids: IDs of the items to delete; all matching items if None
+            filters: Criteria the items must match, if any
+
+        Returns:
+            int: Number of items deleted
+        """
+        deleted = await self.repository.delete_many(chunk_size, ids, filters)
+        await self._written(ids)
+        return deleted
+
+    async def _query(self, query: Hashable, compute: Callable[[], Awaitable[R]]) -> R:
+        """Serve a read from the query cache when it is enabled.
+
+        Args:
+            query: Normalized, hashable description of the read
+            compute: Coroutine function performing the read
+
+        Returns:
+            R: Copy of the (possibly cached) result
+        """
+        if self.query_cache is None:
+            return await compute()
+
+        result = await self.query_cache.get_or_compute(
+            ITEMS_TABLE, query, compute, _estimate_size
+        )
+        return _copy(result)
+
+    async def _written(self, ids: list[Any] | None) -> None:
+        """Invalidate cached data after a write, in every worker.
+
+        Args:
+            ids: IDs of the items the write touched, or None if unknown
+        """
+        invalidate_local(self.cache, self.query_cache, ids)
+        if self.shared_cache is None:
+            return
+
+        if ids is None:
+            await self.shared_cache.incr(GENERATION_KEY)
+        else:
+            await self.shared_cache.incr_many(
+                *(_version_key(id) for id in ids), ttl=self.version_ttl
+            )
+        await self.shared_cache.publish(
+            INVALIDATION_CHANNEL, json.dumps({"ids": ids}).encode()
+        )
+
+
+def invalidate_local(
+    cache: LRUCache[Any, Item | None] | None,
+    query_cache: QueryCache | None,
+    ids: list[Any] | None,
+) -> None:
+    """Invalidate the in-process caches of this worker.
+
+    Args:
+        cache: Entity cache, if enabled
+        query_cache: Query result cache, if enabled
+        ids: IDs of the items that changed, or None if unknown
+    """
+    if query_cache is not None:
+        query_cache.bump(ITEMS_TABLE)
+    if cache is None:
+        return
+    if ids is None:
+        cache.clear()
+        return
+    for id in ids:
+        cache.invalidate(id)
+
+
+async def listen_for_invalidations(
+    shared_cache: SharedCache,
+    cache: LRUCache[Any, Item | None] | None,
+    query_cache: QueryCache | None,
+    retry_delay: float = 1.0,
+) -> None:
+    """Apply invalidations published by any worker to this worker's caches.
+
+    Runs until cancelled. Whenever the subscription is (re)established the
+    local caches are cleared, since messages may have been missed meanwhile.
+
+    Args:
+        shared_cache: Shared cache carrying the invalidation channel
+        cache: This worker's entity cache, if enabled
+        query_cache: This worker's query result cache, if enabled
+        retry_delay: Seconds to wait before resubscribing after an error
+    """
+    while True:
+        invalidate_local(cache, query_cache, None)
+        try:
+            async for message in shared_cache.subscribe(INVALIDATION_CHANNEL):
+                invalidate_local(cache, query_cache, json.loads(message)["ids"])
+        except Exception:
+            logger.exception("Cache invalidation subscription failed; retrying")
+        await asyncio.sleep(retry_delay)
+
+
+def _shared_key(id: Any) -> str:
+    """Get the shared cache key for an item.
+
+    Args:
+        id: Item ID
+
+    Returns:
+        str: Cache key
+    """
+    return f"{ITEMS_TABLE}:{id}"
+
+
+def _version_key(id: Any) -> str:
+    """Get the shared cache key counting the writes to an item.
+
+    Args:
+        id: Item ID
+
+    Returns:
+        str: Counter key
+    """
+    return f"{ITEMS_TABLE}:{id}:version"
+
+
+def _items_of(result: Any) -> list[Item]:
+    """Get the items held by a cached result.
+
+    Args:
+        result: List of items, page of items or scalar
+
+    Returns:
+        list[Item]: Items in the result, empty for scalars
+    """
+    if isinstance(result, Page):
+        return result.items
+    if isinstance(result, list):
+        return result
+    return []
+
+
+def _estimate_size(result: Any) -> int:
+    """Estimate the memory held by a cached result.
+
+    Args:
+        result: List of items, page of items or scalar
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    return 64 + sum(
+        ITEM_SIZE_BYTES + len(item.name) + len(item.description or "")
+        for item in _items_of(result)
+    )
+
+
+def _copy(result: R) -> R:
+    """Copy the items in a cached result so callers cannot mutate the cache.
+
+    Args:
+        result: List of items, page of items or scalar
+
+    Returns:
+        R: Result holding copies of the items
+    """
+    if isinstance(result, Page):
+        items = [item.model_copy() for item in result.items]
+        return Page(items=items, next_cursor=result.next_cursor)  # type: ignore[return-value]
+    if isinstance(result, list):
+        return [item.model_copy() for item in result]  # type: ignore[return-value]
+    return result
@@ -1,24 +1,102 @@
 import re
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
+from app.adapters.metrics.prometheus_metrics import statement_timer
+from app.adapters.repositories.pool import InstrumentedQueuePool
+from app.adapters.repositories.query_accounting import track_queries
+from app.adapters.repositories.replicas import ReadReplicas
 from app.adapters.repositories.sqlalchemy_models import Base
 from app.core.config import settings
 
-# Handle both standard PostgreSQL URLs and asyncpg URLs
-db_url = settings.DATABASE_URL
-if db_url.startswith("postgresql://") and not db_url.startswith("postgresql+"):
-    # Convert to asyncpg URL for better async performance
-    db_url = re.sub(r"^postgresql://", "postgresql+asyncpg://", db_url)
+
+def async_url(url: str) -> str:
+    """Point a plain PostgreSQL URL at the asyncpg driver.
+
+    Args:
+        url: Database URL, with or without a driver
+
+    Returns:
+        str: URL to create an async engine with
+    """
+    # Handle both standard PostgreSQL URLs and asyncpg URLs
+    if url.startswith("postgresql://") and not url.startswith("postgresql+"):
+        # Convert to asyncpg URL for better async performance
+        return re.sub(r"^postgresql://", "postgresql+asyncpg://", url)
+    return url
+
+
+def engine_options(url: str) -> dict[str, Any]:
+    """Build the create_async_engine arguments for a database URL.
+
+    Server databases get an InstrumentedQueuePool sized by the settings;
+    SQLite keeps the pool SQLAlchemy picks for its driver.
+
+    Args:
+        url: Database URL
+
+    Returns:
+        dict[str, Any]: Keyword arguments for create_async_engine
+    """
+    options: dict[str, Any] = {
+        "echo": settings.DEBUG,
+        "future": True,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return options
+
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE_SECONDS,
+    )
+    if parsed.get_driver_name() == "asyncpg":
+        # SQLAlchemy's prepared statement cache and asyncpg's own
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
+
+def create_engine(url: str, database: str) -> AsyncEngine:
+    """Create an engine whose statements are charged to the current request.
+
+    Statements are also traced, and timed in the metrics with
+    METRICS_ENABLED.
+
+    Args:
+        url: Database URL
+        database: Name of the database in logs, traces and metrics
+
+    Returns:
+        AsyncEngine: Engine configured by the settings
+    """
+    url = async_url(url)
+    engine = create_async_engine(url, **engine_options(url))
+    track_queries(
+        engine,
+        database,
+        settings.DATABASE_SLOW_QUERY_SECONDS,
+        observe=statement_timer(database) if settings.METRICS_ENABLED else None,
+    )
+    return engine
+
 
 # Create async engine
-engine = create_async_engine(
-    db_url,
-    echo=settings.DEBUG,
-    future=True,
-    pool_pre_ping=True,  # Enable connection health checks
-)
+engine = create_engine(settings.DATABASE_URL, "primary")
 
 # Create async session factory
 # Use async_sessionmaker for better typing support with AsyncSession
@@ -27,6 +105,19 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Engines for DATABASE_READ_URLS, each with its own pool
+read_engines = [create_engine(url, "replica") for url in settings.DATABASE_READ_URLS]
+read_replicas = (
+    ReadReplicas(
+        [
+            async_sessionmaker(bind=read_engine, expire_on_commit=False)
+            for read_engine in read_engines
+        ]
+    )
+    if read_engines
+    else None
+)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Get a database session.
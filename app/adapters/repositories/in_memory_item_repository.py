@@ -0,0 +1,746 @@
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from datetime import UTC, datetime
+from itertools import islice
+from typing import Any
+
+from app.core.domain.item import Item, ItemRecord
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.item_sort import ItemSort
+from app.core.domain.item_stats import ItemStats, bucket_index
+from app.core.domain.pagination import Page
+from app.core.domain.result_version import ResultVersion
+from app.core.ports.item_repository import ItemRepository
+
+# Length of the name fragments in the search index
+NGRAM_SIZE = 3
+
+
+def _utcnow() -> datetime:
+    """Get the current UTC time as a naive datetime, as the database stores it."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class InMemoryItemRepository(ItemRepository):
+    """ItemRepository that keeps every item in process memory.
+
+    Items are held in a dict keyed by ID, with secondary indexes kept in
+    step on every write:
+
+    - a sorted list of IDs, for keyset pagination and ID-ordered scans;
+      pages in other orders keep the first matches in a heap instead
+    - a hash index on ``is_active``
+    - a sorted ``(price, id)`` index, for price range filters
+    - an n-gram index on the lowercased name, for find_by_name
+
+    No method awaits while it reads or changes the indexes, so each call
+    runs to completion before another coroutine on the event loop can see
+    the state. load() builds the new indexes separately and swaps them in
+    at once. Items are copied on the way in and out, so callers cannot
+    change stored items behind the indexes' back.
+
+    One instance is meant to be shared by the whole process.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Item | ItemRecord] = (),
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        """Initialize the repository.
+
+        Args:
+            items: Stored items to start with, as from a snapshot
+            clock: Source of creation and update timestamps
+        """
+        self._clock = clock
+        # Items put or discarded while load_from streams, by ID; None for
+        # a discarded item
+        self._journal: dict[int, Item | None] | None = None
+        self._next_id = 1
+        self._items: dict[int, Item] = {}
+        self._ids: list[int] = []
+        self._by_active: dict[bool, set[int]] = {True: set(), False: set()}
+        self._by_price: list[tuple[float, int]] = []
+        self._by_ngram: dict[str, set[int]] = {}
+        self.load(items)
+
+    def load(self, items: Iterable[Item | ItemRecord]) -> None:
+        """Replace every stored item with a snapshot.
+
+        Args:
+            items: Stored items, each with its ID and timestamps set
+        """
+        stored: dict[int, Item] = {}
+        for entry in items:
+            item = (
+                Item.from_trusted(entry._asdict())
+                if isinstance(entry, ItemRecord)
+                else entry.model_copy()
+            )
+            stored[item.id] = item
+
+        by_active: dict[bool, set[int]] = {True: set(), False: set()}
+        by_ngram: dict[str, set[int]] = {}
+        for item in stored.values():
+            by_active[item.is_active].add(item.id)
+            for ngram in _ngrams(item.name):
+                by_ngram.setdefault(ngram, set()).add(item.id)
+        ids = sorted(stored)
+        by_price = sorted((item.price, item.id) for item in stored.values())
+
+        # Swap the new state in as one step
+        (
+            self._items,
+            self._ids,
+            self._by_active,
+            self._by_price,
+            self._by_ngram,
+            self._next_id,
+        ) = (stored, ids, by_active, by_price, by_ngram, ids[-1] + 1 if ids else 1)
+
+    async def load_from(self, repository: ItemRepository, chunk_size: int) -> int:
+        """Replace every stored item with the contents of another repository.
+
+        Items stored with put() or discard() while the rows stream in are
+        applied again once they are loaded, unless the stream read a later
+        version of the item, so a reload never undoes those writes.
+
+        Args:
+            repository: Repository to copy the items from
+            chunk_size: Number of rows to fetch per round trip
+
+        Returns:
+            int: Number of items loaded
+        """
+        self._journal = journal = {}
+        try:
+            records = [record async for record in repository.stream_all(chunk_size)]
+        finally:
+            self._journal = None
+        self.load(records)
+
+        for id, item in journal.items():
+            current = self._items.get(id)
+            if item is None:
+                self.discard(id)
+            elif current is None or current.version < item.version:
+                self.put(item)
+        return len(records)
+
+    def put(self, item: Item) -> None:
+        """Store an item written elsewhere as is, replacing any with its ID.
+
+        Args:
+            item: Stored item, with its ID and timestamps set
+        """
+        if self._journal is not None:
+            self._journal[item.id] = item.model_copy()
+        current = self._items.get(item.id)
+        if current is None:
+            insort(self._ids, item.id)
+            self._next_id = max(self._next_id, item.id + 1)
+        else:
+            self._unindex(current)
+        self._items[item.id] = item.model_copy()
+        self._index(item)
+
+    def discard(self, id: Any) -> None:
+        """Drop an item deleted elsewhere, if it is stored.
+
+        Args:
+            id: Item ID
+        """
+        if self._journal is not None:
+            self._journal[id] = None
+        item = self._items.get(id)
+        if item is not None:
+            self._remove(item)
+
+    def replace_range(
+        self, after_id: int | None, last_id: int, items: Iterable[Item]
+    ) -> None:
+        """Store the items written elsewhere in an ID range in place of ours.
+
+        Items stored in the range and missing from ``items`` are dropped.
+
+        Args:
+            after_id: The range starts after this ID; at the first if None
+            last_id: Last ID of the range
+            items: Stored items with IDs in the range, each with its ID and
+                timestamps set
+        """
+        current = {item.id: item for item in items}
+        start = 0 if after_id is None else bisect_right(self._ids, after_id)
+        stale = self._ids[start : bisect_right(self._ids, last_id)]
+        for id in stale:
+            if id not in current:
+                self.discard(id)
+        for item in current.values():
+            self.put(item)
+
+    async def get(self, id: Any) -> Item | None:
+        """Get an item by ID.
+
+        Args:
+            id: Item ID
+
+        Returns:
+            Item | None: Item if found, None otherwise
+        """
+        item = self._items.get(id)
+        return None if item is None else item.model_copy()
+
+    async def get_all(self, filters: ItemFilter | None = None) -> list[Item]:
+        """Get all items, with optional filtering.
+
+        Args:
+            filters: Criteria the items must match, if any
+
+        Returns:
+            list[Item]: List of items, in ID order
+        """
+        return [item.model_copy() for item in self._scan(filters)]
+
+    async def get_page(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> Page[Item]:
+        """Get one page of items using keyset pagination.
+
+        Args:
+            limit: Maximum number of items to return
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            Page[Item]: Items on the page and the cursor for the next one
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was returned
+                for another sort order
+        """
+        sort = sort or ItemSort()
+        window = self._page_window(limit, after, filters, sort)
+        items = [item.model_copy() for item in window[:limit]]
+        next_cursor = sort.encode_cursor(items[-1]) if len(window) > limit else None
+
+        return Page(items=items, next_cursor=next_cursor)
+
+    async def get_page_version(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> ResultVersion:
+        """Summarize the page get_page would return.
+
+        Args:
+            limit: Maximum number of items on the page
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            ResultVersion: Version of the page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was returned
+                for another sort order
+        """
+        window = self._page_window(limit, after, filters, sort or ItemSort())
+        return _version(window[:limit], more=len(window) > limit)
+
+    def stream_all(
+        self, chunk_size: int, filters: ItemFilter | None = None
+    ) -> AsyncIterator[ItemRecord]:
+        """Iterate over all items in ID order.
+
+        Iterates over the items that match when iteration starts; items
+        deleted or changed to no longer match while the iteration is
+        suspended are skipped.
+
+        Args:
+            chunk_size: Unused; items are already in memory
+            filters: Criteria the items must match, if any
+
+        Returns:
+            AsyncIterator[ItemRecord]: Items in ID order
+        """
+        ids = [item.id for item in self._scan(filters)]
+        return self._stream(ids, filters)
+
+    async def _stream(
+        self, ids: list[int], filters: ItemFilter | None
+    ) -> AsyncIterator[ItemRecord]:
+        """Yield the items that still exist and match, as records."""
+        for id in ids:
+            item = self._items.get(id)
+            if item is not None and _matches(item, filters):
+                yield ItemRecord._make(
+                    getattr(item, field) for field in ItemRecord._fields
+                )
+
+    async def create(self, entity: Item) -> Item:
+        """Create a new item.
+
+        Args:
+            entity: Item to create
+
+        Returns:
+            Item: Created item
+        """
+        return self._insert(entity).model_copy()
+
+    async def create_many(self, entities: list[Item], chunk_size: int) -> list[Item]:
+        """Create many items at once.
+
+        Args:
+            entities: Items to create
+            chunk_size: Unused; items are stored directly
+
+        Returns:
+            list[Item]: Created items, in the same order as ``entities``
+        """
+        return [self._insert(entity).model_copy() for entity in entities]
+
+    async def update(self, id: Any, entity: Item) -> Item | None:
+        """Update an existing item.
+
+        Args:
+            id: Item ID
+            entity: Updated item data
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+        """
+        update_data = entity.model_dump(
+            exclude={"id", "created_at", "updated_at", "version"}, exclude_none=True
+        )
+
+        return await self.patch(id, update_data)
+
+    async def patch(self, id: Any, changes: dict[str, Any]) -> Item | None:
+        """Update only the given fields of an item.
+
+        Args:
+            id: Item ID
+            changes: Field name to new value mapping
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+        """
+        item = self._items.get(id)
+        if item is None:
+            return None
+        if not changes:
+            return item.model_copy()
+
+        return self._replace(item, changes).model_copy()
+
+    async def apply_discount(self, id: Any, discount_percent: float) -> Item | None:
+        """Discount an item's price.
+
+        Args:
+            id: Item ID
+            discount_percent: Discount percentage (0-100)
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+
+        Raises:
+            ValueError: If the discount is outside 0-100
+        """
+        factor = Item.discount_factor(discount_percent)
+        item = self._items.get(id)
+        if item is None:
+            return None
+
+        return self._replace(item, {"price": item.price * factor}).model_copy()
+
+    async def apply_discount_batch(
+        self,
+        item_filter: ItemFilter,
+        discount_percent: float,
+        after_id: Any | None,
+        chunk_size: int,
+    ) -> tuple[int, Any | None]:
+        """Discount the next chunk of matching items.
+
+        Args:
+            item_filter: Criteria selecting the items to discount
+            discount_percent: Discount percentage (0-100)
+            after_id: Only consider items with a greater ID, if given
+            chunk_size: Maximum number of items to discount
+
+        Returns:
+            tuple[int, Any | None]: Number of items discounted and the ID the
+            next chunk starts after, or None when no matching items remain
+
+        Raises:
+            ValueError: If the discount is outside 0-100
+        """
+        factor = Item.discount_factor(discount_percent)
+        chunk = list(islice(self._scan(item_filter, after_id), chunk_size))
+        if not chunk:
+            return 0, None
+
+        for item in chunk:
+            self._replace(item, {"price": item.price * factor})
+
+        return len(chunk), chunk[-1].id
+
+    async def count(self, item_filter: ItemFilter) -> int:
+        """Count the items matching a filter.
+
+        Args:
+            item_filter: Criteria selecting the items to count
+
+        Returns:
+            int: Number of matching items
+        """
+        return sum(1 for _ in self._scan(item_filter))
+
+    async def get_stats(
+        self,
+        bucket_width: float,
+        filters: ItemFilter | None = None,
+        max_buckets: int | None = None,
+    ) -> ItemStats:
+        """Compute aggregate statistics over the matching items.
+
+        Args:
+            bucket_width: Width of the price histogram buckets
+            filters: Criteria the items must match, if any
+            max_buckets: Most buckets the histogram may span, empty ones
+                included; no limit if None
+
+        Returns:
+            ItemStats: Counts, price summary and price histogram
+
+        Raises:
+            TooManyBucketsError: If the histogram would span more than
+                ``max_buckets`` buckets
+        """
+        buckets: dict[int, list[Any]] = {}
+        for item in self._scan(filters):
+            index = bucket_index(item.price, bucket_width)
+            if (bucket := buckets.get(index)) is None:
+                buckets[index] = [index, 1, int(item.is_active), *(item.price,) * 3]
+                continue
+            bucket[1] += 1
+            bucket[2] += item.is_active
+            bucket[3] = min(bucket[3], item.price)
+            bucket[4] = max(bucket[4], item.price)
+            bucket[5] += item.price
+
+        return ItemStats.from_buckets(
+            bucket_width,
+            (tuple(buckets[index]) for index in sorted(buckets)),
+            max_buckets,
+        )
+
+    async def update_many(
+        self, changes: dict[Any, dict[str, Any]], chunk_size: int
+    ) -> list[Any]:
+        """Apply partial updates to many items at once.
+
+        Args:
+            changes: Mapping of item ID to the fields to change for that item
+            chunk_size: Unused; items are updated directly
+
+        Returns:
+            list[Any]: IDs from ``changes`` that did not match any item
+        """
+        not_found = []
+        for id, item_changes in changes.items():
+            item = self._items.get(id)
+            if item is None:
+                not_found.append(id)
+            elif item_changes:
+                self._replace(item, item_changes)
+
+        return not_found
+
+    async def delete(self, id: Any) -> bool:
+        """Delete an item by ID.
+
+        Args:
+            id: Item ID
+
+        Returns:
+            bool: True if deleted, False otherwise
+        """
+        item = self._items.get(id)
+        if item is None:
+            return False
+
+        self._remove(item)
+        return True
+
+    async def delete_many(
+        self,
+        chunk_size: int,
+        ids: list[Any] | None = None,
+        filters: ItemFilter | None = None,
+    ) -> int:
+        """Delete many items by ID, by filter, or both.
+
+        Args:
+            chunk_size: Unused; items are deleted directly
+            ids: IDs of the items to delete; all matching items if None
+            filters: Criteria the items must match, if any
+
+        Returns:
+            int: Number of items deleted
+        """
+        if ids is None:
+            doomed = list(self._scan(filters))
+        else:
+            doomed = [
+                item
+                for id in dict.fromkeys(ids)
+                if (item := self._items.get(id)) is not None and _matches(item, filters)
+            ]
+
+        for item in doomed:
+            self._remove(item)
+        return len(doomed)
+
+    async def find_by_name(self, name: str, limit: int | None = None) -> list[Item]:
+        """Find items by name (partial match), best matches first.
+
+        Terms of at least NGRAM_SIZE characters are looked up in the n-gram
+        index; shorter ones scan every item. Shorter names rank first.
+
+        Args:
+            name: Item name to search for
+            limit: Maximum number of items to return, if given
+
+        Returns:
+            list[Item]: List of matching items, ordered by relevance
+        """
+        return [item.model_copy() for item in self._search(name, limit)]
+
+    async def find_by_name_version(
+        self, name: str, limit: int | None = None
+    ) -> ResultVersion:
+        """Summarize the result find_by_name would return.
+
+        Args:
+            name: Item name to search for
+            limit: Maximum number of items to consider, if given
+
+        Returns:
+            ResultVersion: Version of the search result
+        """
+        return _version(self._search(name, limit))
+
+    async def find_active_items(self) -> list[Item]:
+        """Find all active items.
+
+        Returns:
+            list[Item]: List of active items, in ID order
+        """
+        return [self._items[id].model_copy() for id in sorted(self._by_active[True])]
+
+    def _insert(self, entity: Item) -> Item:
+        """Store a new item under the next ID and index it."""
+        now = self._clock()
+        item = entity.model_copy(
+            update={
+                "id": self._next_id,
+                "created_at": now,
+                "updated_at": now,
+                "version": 1,
+            }
+        )
+        self._next_id += 1
+        self._items[item.id] = item
+        # IDs only grow, so appending keeps the list sorted
+        self._ids.append(item.id)
+        self._index(item)
+        return item
+
+    def _replace(self, item: Item, changes: dict[str, Any]) -> Item:
+        """Store a changed copy of an item and re-index it."""
+        updated = item.model_copy(
+            update={
+                **changes,
+                "updated_at": self._clock(),
+                "version": item.version + 1,
+            }
+        )
+        self._unindex(item)
+        self._items[updated.id] = updated
+        self._index(updated)
+        return updated
+
+    def _remove(self, item: Item) -> None:
+        """Drop an item and its index entries."""
+        self._unindex(item)
+        del self._items[item.id]
+        del self._ids[bisect_left(self._ids, item.id)]
+
+    def _index(self, item: Item) -> None:
+        """Add an item to the secondary indexes."""
+        self._by_active[item.is_active].add(item.id)
+        insort(self._by_price, (item.price, item.id))
+        for ngram in _ngrams(item.name):
+            self._by_ngram.setdefault(ngram, set()).add(item.id)
+
+    def _unindex(self, item: Item) -> None:
+        """Remove an item from the secondary indexes."""
+        self._by_active[item.is_active].discard(item.id)
+        del self._by_price[bisect_left(self._by_price, (item.price, item.id))]
+        for ngram in _ngrams(item.name):
+            postings = self._by_ngram[ngram]
+            postings.discard(item.id)
+            if not postings:
+                del self._by_ngram[ngram]
+
+    def _scan(
+        self, filters: ItemFilter | None, after_id: int | None = None
+    ) -> Iterator[Item]:
+        """Yield the items matching a filter in ID order.
+
+        Candidates come from the secondary indexes where the filter allows
+        it; otherwise every item is checked.
+
+        Args:
+            filters: Criteria the items must match, if any
+            after_id: Only yield items with a greater ID, if given
+
+        Yields:
+            Item: Matching items
+        """
+        candidates = None if filters is None else self._candidates(filters)
+        ids = self._ids if candidates is None else sorted(candidates)
+        start = 0 if after_id is None else bisect_right(ids, after_id)
+        for id in ids[start:]:
+            item = self._items[id]
+            if _matches(item, filters):
+                yield item
+
+    def _page_window(
+        self,
+        limit: int,
+        after: str | None,
+        filters: ItemFilter | None,
+        sort: ItemSort,
+    ) -> list[Item]:
+        """Get up to ``limit + 1`` matching items after a cursor, in sort order.
+
+        Ascending ID order reads the sorted ID list directly; other orders
+        keep the best ``limit + 1`` matches in a heap.
+        """
+        last = None if after is None else sort.decode_cursor(after)
+        if sort == ItemSort():
+            after_id = None if last is None else last[0]
+            return list(islice(self._scan(filters, after_id), limit + 1))
+
+        matches: Iterable[Item] = self._scan(filters)
+        if last is not None:
+            if sort.descending:
+                matches = (item for item in matches if sort.key(item) < last)
+            else:
+                matches = (item for item in matches if sort.key(item) > last)
+        top = heapq.nlargest if sort.descending else heapq.nsmallest
+        return top(limit + 1, matches, key=sort.key)
+
+    def _candidates(self, item_filter: ItemFilter) -> set[int] | None:
+        """Narrow down the items that can match a filter using the indexes.
+
+        Args:
+            item_filter: Criteria selecting a set of items
+
+        Returns:
+            set[int] | None: IDs that may match, or None if no index applies
+        """
+        narrowed: list[set[int]] = []
+        if item_filter.is_active is not None:
+            narrowed.append(self._by_active[item_filter.is_active])
+        if item_filter.min_price is not None or item_filter.max_price is not None:
+            low = (
+                0
+                if item_filter.min_price is None
+                else bisect_left(self._by_price, (item_filter.min_price,))
+            )
+            high = (
+                len(self._by_price)
+                if item_filter.max_price is None
+                else bisect_right(self._by_price, (item_filter.max_price, float("inf")))
+            )
+            narrowed.append({id for _, id in self._by_price[low:high]})
+        for text in (item_filter.name_prefix, item_filter.name_contains):
+            if text is not None and (ngrams := _ngrams(text)):
+                narrowed.extend(self._by_ngram.get(ngram, set()) for ngram in ngrams)
+
+        if not narrowed:
+            return None
+        narrowed.sort(key=len)
+        return set.intersection(*narrowed)
+
+    def _search(self, name: str, limit: int | None) -> list[Item]:
+        """Find items whose name contains ``name``, shorter names first."""
+        term = name.casefold()
+        ngrams = _ngrams(name)
+        if ngrams:
+            postings = sorted(
+                (self._by_ngram.get(ngram, set()) for ngram in ngrams), key=len
+            )
+            ids: Iterable[int] = set.intersection(*postings)
+        else:
+            ids = self._items
+
+        matches = [
+            item
+            for item in (self._items[id] for id in ids)
+            if term in item.name.casefold()
+        ]
+        matches.sort(key=lambda item: (len(item.name), item.id))
+        return matches if limit is None else matches[:limit]
+
+
+def _ngrams(text: str) -> set[str]:
+    """Split lowercased text into its overlapping NGRAM_SIZE fragments."""
+    folded = text.casefold()
+    return {folded[i : i + NGRAM_SIZE] for i in range(len(folded) - NGRAM_SIZE + 1)}
+
+
+def _matches(item: Item, item_filter: ItemFilter | None) -> bool:
+    """Check an item against a filter; no filter matches every item."""
+    if item_filter is None:
+        return True
+
+    bounds = (
+        (item.price, item_filter.min_price, item_filter.max_price),
+        (item.created_at, item_filter.created_from, item_filter.created_to),
+        (item.updated_at, item_filter.updated_from, item_filter.updated_to),
+    )
+    return (
+        (item_filter.is_active is None or item.is_active is item_filter.is_active)
+        and (
+            item_filter.name_prefix is None
+            or item.name.startswith(item_filter.name_prefix)
+        )
+        and (
+            item_filter.name_contains is None
+            or item_filter.name_contains.casefold() in item.name.casefold()
+        )
+        and all(
+            (low is None or value >= low) and (high is None or value <= high)
+            for value, low, high in bounds
+        )
+    )
+
+
+def _version(items: list[Item], more: bool = False) -> ResultVersion:
+    """Summarize a result from the ID and version of its items."""
+    return ResultVersion.of(((item.id, item.version) for item in items), more)
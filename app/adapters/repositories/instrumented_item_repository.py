@@ -0,0 +1,6 @@
+from app.core.ports.item_repository import ItemRepository
+from app.core.tracing import instrumented
+
+# Wraps any ItemRepository; construct with the repository and, to time the
+# calls, a function taking a method name and the seconds a call took
+InstrumentedItemRepository = instrumented(ItemRepository, layer="repository")
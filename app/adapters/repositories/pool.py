@@ -0,0 +1,135 @@
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from app.core.request_timing import current_request_timings
+
+
+@dataclass
+class PoolStats:
+    """Counters describing how a connection pool has been used.
+
+    Attributes:
+        connects: New database connections opened
+        checkouts: Connections handed out
+        checkins: Connections returned
+        invalidations: Connections discarded after an error or a failed ping
+        timeouts: Checkouts that gave up after the pool timeout
+        wait_seconds_total: Time spent getting connections, summed
+        wait_seconds_max: Longest single wait for a connection
+    """
+
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
+@dataclass(frozen=True)
+class PoolStatus:
+    """Point-in-time state of a connection pool.
+
+    Attributes:
+        size: Connections the pool keeps open
+        max_overflow: Connections it may open beyond that under load
+        checked_out: Connections in use
+        idle: Open connections waiting in the pool
+        overflow: Connections currently open beyond ``size``
+        stats: Usage counters since the pool was created
+    """
+
+    size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    stats: PoolStats
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that counts its traffic and times checkouts.
+
+    The time each checkout takes, which is the wait for a free connection
+    plus opening a new one when the pool may grow, is added to the stats
+    and to the timings of the request making it.
+    """
+
+    def __init__(
+        self, creator: Any, pool_size: int = 5, max_overflow: int = 10, **kwargs: Any
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            creator: Function opening a new database connection
+            pool_size: Connections to keep open
+            max_overflow: Connections that may be opened beyond pool_size
+            **kwargs: Other QueuePool arguments
+        """
+        super().__init__(
+            creator, pool_size=pool_size, max_overflow=max_overflow, **kwargs
+        )
+        self.max_overflow = max_overflow
+        self.stats = PoolStats()
+        event.listen(self, "connect", self._on_connect)
+        event.listen(self, "checkin", self._on_checkin)
+        event.listen(self, "invalidate", self._on_invalidate)
+
+    def _do_get(self) -> Any:
+        """Get a connection from the pool, timing the wait."""
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            self._record_wait(time.perf_counter() - start)
+        self.stats.checkouts += 1
+        return connection
+
+    def _record_wait(self, seconds: float) -> None:
+        """Add one checkout's wait to the stats and the current request."""
+        self.stats.wait_seconds_total += seconds
+        self.stats.wait_seconds_max = max(self.stats.wait_seconds_max, seconds)
+        if (timings := current_request_timings()) is not None:
+            timings.pool_wait += seconds
+
+    def _on_connect(self, *args: Any) -> None:
+        """Count a new database connection."""
+        self.stats.connects += 1
+
+    def _on_checkin(self, *args: Any) -> None:
+        """Count a connection returned to the pool."""
+        self.stats.checkins += 1
+
+    def _on_invalidate(self, *args: Any) -> None:
+        """Count a discarded connection."""
+        self.stats.invalidations += 1
+
+
+def pool_status(pool: Pool) -> PoolStatus | None:
+    """Describe the state of a connection pool.
+
+    Args:
+        pool: Pool of an engine
+
+    Returns:
+        PoolStatus | None: State of the pool, or None if it is not an
+        InstrumentedQueuePool
+    """
+    if not isinstance(pool, InstrumentedQueuePool):
+        return None
+    return PoolStatus(
+        size=pool.size(),
+        max_overflow=pool.max_overflow,
+        checked_out=pool.checkedout(),
+        idle=pool.checkedin(),
+        overflow=max(pool.overflow(), 0),
+        stats=PoolStats(**vars(pool.stats)),
+    )
@@ -0,0 +1,132 @@
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.domain.span import SpanKind
+from app.core.request_timing import current_request_timings
+from app.core.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+# Stands in for every bound value in the slow query log
+REDACTED = "?"
+
+
+def track_queries(
+    engine: AsyncEngine,
+    database: str,
+    slow_query_seconds: float,
+    observe: Callable[[str, float], None] | None = None,
+) -> None:
+    """Time each SQL statement an engine executes and report it everywhere.
+
+    One set of listeners times every statement once, then:
+
+    - adds one to the current request's statement count and the time to
+      its database time
+    - logs it as a warning if it is slower than the threshold, with its
+      bound values replaced so that no data ends up in the logs
+    - records it as a span named after the database when the request is
+      traced, with the statement text and never the bound values
+    - passes it to ``observe``, if given
+
+    Failed statements are reported too, and end their span with an error.
+
+    Args:
+        engine: Engine to listen to
+        database: Name of the database, such as "primary"
+        slow_query_seconds: Log statements taking at least this long; a
+            negative value logs none
+        observe: Function taking the statement text and the seconds it
+            took, such as a metrics recorder
+    """
+    system = engine.dialect.name
+
+    def before_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        span = tracer.start_span(
+            f"SQL {database}",
+            SpanKind.CLIENT,
+            layer="sql",
+            **{"db.system": system, "db.statement": statement},
+        )
+        # A connection runs one statement at a time
+        conn.info["statement"] = (time.perf_counter(), span)
+
+    def finish(
+        conn: Connection,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        error: BaseException | None = None,
+    ) -> None:
+        started = conn.info.pop("statement", None)
+        if started is None:
+            return
+        start, span = started
+        elapsed = time.perf_counter() - start
+        if (timings := current_request_timings()) is not None:
+            timings.db_statements += 1
+            timings.db_time += elapsed
+        if 0 <= slow_query_seconds <= elapsed:
+            logger.warning(
+                "Slow query took %.1f ms: %s; parameters: %s",
+                elapsed * 1000,
+                statement,
+                redact(parameters, executemany),
+            )
+        if span is not None:
+            tracer.end_span(span, error)
+        if observe is not None:
+            observe(statement, elapsed)
+
+    def after_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        finish(conn, statement, parameters, executemany)
+
+    def handle_error(context: ExceptionContext) -> None:
+        if context.connection is None or context.statement is None:
+            return
+        execution = context.execution_context
+        finish(
+            context.connection,
+            context.statement,
+            context.parameters,
+            bool(execution and execution.executemany),
+            context.original_exception,
+        )
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", handle_error)
+
+
+def redact(parameters: Any, executemany: bool = False) -> str:
+    """Describe a statement's bound parameters without their values.
+
+    Args:
+        parameters: Parameters as passed to the DBAPI cursor
+        executemany: Whether they are a sequence of parameter sets
+
+    Returns:
+        str: Parameter names or positions, each with a placeholder value
+    """
+    if executemany:
+        sets = list(parameters)
+        first = redact(sets[0]) if sets else "()"
+        return f"{len(sets)} sets like {first}"
+    if isinstance(parameters, dict):
+        return str(dict.fromkeys(parameters, REDACTED))
+    return str(tuple(REDACTED for _ in parameters or ()))
@@ -0,0 +1,36 @@
+import itertools
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class ReadReplicas:
+    """Hands out sessions on read replicas, taking the replicas in turn.
+
+    Each call to session() opens its session on the next replica, so the
+    requests of a worker spread evenly over all of them.
+    """
+
+    def __init__(
+        self, session_factories: Sequence[async_sessionmaker[AsyncSession]]
+    ) -> None:
+        """Initialize the rotation.
+
+        Args:
+            session_factories: One session factory per replica
+
+        Raises:
+            ValueError: If no session factories are given
+        """
+        if not session_factories:
+            raise ValueError("At least one read replica is required")
+        self.session_factories = list(session_factories)
+        self._rotation = itertools.cycle(self.session_factories)
+
+    def session(self) -> AsyncSession:
+        """Open a session on the next replica.
+
+        Returns:
+            AsyncSession: New session, to be closed by the caller
+        """
+        return next(self._rotation)()
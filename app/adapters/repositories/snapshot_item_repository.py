@@ -0,0 +1,444 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.repositories.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item import Item, ItemRecord
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.item_sort import ItemSort
+from app.core.domain.item_stats import ItemStats
+from app.core.domain.pagination import Page
+from app.core.domain.result_version import ResultVersion
+from app.core.ports.item_repository import ItemRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotItemRepository(ItemRepository):
+    """Serves reads from an in-memory snapshot and sends writes to the database.
+
+    Reads are answered by an InMemoryItemRepository loaded from the
+    database and never run a statement. Writes go to the database
+    repository. Once a write has committed, the snapshot is brought in
+    step with it. Items the write returns are stored as is, and deleted
+    IDs are dropped. After bulk writes that do not return their items, the
+    rows they may have touched are read back from the primary. They are
+    never replayed on the snapshot, which may be missing rows other
+    workers wrote.
+
+    Only this process's snapshot sees a write at once; other workers pick
+    it up when refresh_snapshot next reloads theirs.
+    """
+
+    def __init__(
+        self, snapshot: InMemoryItemRepository, repository: SQLAlchemyItemRepository
+    ) -> None:
+        """Initialize the repository.
+
+        Args:
+            snapshot: In-memory copy of the items that serves reads
+            repository: Database repository, which receives writes
+        """
+        self.snapshot = snapshot
+        self.repository = repository
+
+    async def get(self, id: Any) -> Item | None:
+        """Get an item by ID.
+
+        Args:
+            id: Item ID
+
+        Returns:
+            Item | None: Item if found, None otherwise
+        """
+        return await self.snapshot.get(id)
+
+    async def get_fields(self, id: Any, fields: Sequence[str]) -> dict[str, Any] | None:
+        """Get some fields of an item by ID.
+
+        Args:
+            id: Item ID
+            fields: Names of the Item fields to return
+
+        Returns:
+            dict[str, Any] | None: Requested fields in the given order if
+            found, None otherwise
+        """
+        return await self.snapshot.get_fields(id, fields)
+
+    async def get_all(self, filters: ItemFilter | None = None) -> list[Item]:
+        """Get all items, with optional filtering.
+
+        Args:
+            filters: Criteria the items must match, if any
+
+        Returns:
+            list[Item]: List of items
+        """
+        return await self.snapshot.get_all(filters)
+
+    async def get_page(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> Page[Item]:
+        """Get one page of items.
+
+        Args:
+            limit: Maximum number of items to return
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            Page[Item]: Items on the page and the cursor for the next one
+        """
+        return await self.snapshot.get_page(limit, after, filters, sort)
+
+    async def get_page_fields(
+        self,
+        fields: Sequence[str],
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> Page[dict[str, Any]]:
+        """Get some fields of one page of items.
+
+        Args:
+            fields: Names of the Item fields to return
+            limit: Maximum number of items to return
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            Page[dict[str, Any]]: Requested fields of the items on the page
+            and the cursor for the next one
+        """
+        return await self.snapshot.get_page_fields(fields, limit, after, filters, sort)
+
+    async def get_page_version(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> ResultVersion:
+        """Summarize the page get_page would return, without loading it.
+
+        Args:
+            limit: Maximum number of items on the page
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            ResultVersion: Version of the page
+        """
+        return await self.snapshot.get_page_version(limit, after, filters, sort)
+
+    async def find_by_name_version(
+        self, name: str, limit: int | None = None
+    ) -> ResultVersion:
+        """Summarize the result find_by_name would return, without loading it.
+
+        Args:
+            name: Item name to search for
+            limit: Maximum number of items to consider, if given
+
+        Returns:
+            ResultVersion: Version of the search result
+        """
+        return await self.snapshot.find_by_name_version(name, limit)
+
+    def stream_all(
+        self, chunk_size: int, filters: ItemFilter | None = None
+    ) -> AsyncIterator[ItemRecord]:
+        """Iterate over all items without loading them at once.
+
+        Args:
+            chunk_size: Number of items to produce per step
+            filters: Criteria the items must match, if any
+
+        Returns:
+            AsyncIterator[ItemRecord]: Items in ID order
+        """
+        return self.snapshot.stream_all(chunk_size, filters)
+
+    async def find_by_name(self, name: str, limit: int | None = None) -> list[Item]:
+        """Find items by name (partial match), best matches first.
+
+        Args:
+            name: Item name to search for
+            limit: Maximum number of items to return, if given
+
+        Returns:
+            list[Item]: List of matching items, ordered by relevance
+        """
+        return await self.snapshot.find_by_name(name, limit)
+
+    async def find_by_name_fields(
+        self, fields: Sequence[str], name: str, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Get some fields of the items find_by_name would return.
+
+        Args:
+            fields: Names of the Item fields to return
+            name: Item name to search for
+            limit: Maximum number of items to return, if given
+
+        Returns:
+            list[dict[str, Any]]: Requested fields of the matching items,
+            ordered by relevance
+        """
+        return await self.snapshot.find_by_name_fields(fields, name, limit)
+
+    async def find_active_items(self) -> list[Item]:
+        """Find all active items.
+
+        Returns:
+            list[Item]: List of active items
+        """
+        return await self.snapshot.find_active_items()
+
+    async def count(self, item_filter: ItemFilter) -> int:
+        """Count the items matching a filter.
+
+        Args:
+            item_filter: Criteria selecting the items to count
+
+        Returns:
+            int: Number of matching items
+        """
+        return await self.snapshot.count(item_filter)
+
+    async def get_stats(
+        self,
+        bucket_width: float,
+        filters: ItemFilter | None = None,
+        max_buckets: int | None = None,
+    ) -> ItemStats:
+        """Compute aggregate statistics over the matching items.
+
+        Args:
+            bucket_width: Width of the price histogram buckets
+            filters: Criteria the items must match, if any
+            max_buckets: Most buckets the histogram may span, empty ones
+                included; no limit if None
+
+        Returns:
+            ItemStats: Counts, price summary and price histogram
+
+        Raises:
+            TooManyBucketsError: If the histogram would span more than
+                ``max_buckets`` buckets
+        """
+        return await self.snapshot.get_stats(bucket_width, filters, max_buckets)
+
+    async def create(self, entity: Item) -> Item:
+        """Create a new item in the database and the snapshot.
+
+        Args:
+            entity: Item to create
+
+        Returns:
+            Item: Created item
+        """
+        item = await self.repository.create(entity)
+        self.snapshot.put(item)
+        return item
+
+    async def create_many(self, entities: list[Item], chunk_size: int) -> list[Item]:
+        """Create many items in the database and the snapshot.
+
+        Args:
+            entities: Items to create
+            chunk_size: Maximum number of rows to send per INSERT statement
+
+        Returns:
+            list[Item]: Created items, in the same order as ``entities``
+        """
+        items = await self.repository.create_many(entities, chunk_size)
+        for item in items:
+            self.snapshot.put(item)
+        return items
+
+    async def update(self, id: Any, entity: Item) -> Item | None:
+        """Update an existing item in the database and the snapshot.
+
+        Args:
+            id: Item ID
+            entity: Updated item data
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+        """
+        item = await self.repository.update(id, entity)
+        if item is not None:
+            self.snapshot.put(item)
+        return item
+
+    async def patch(self, id: Any, changes: dict[str, Any]) -> Item | None:
+        """Update only the given fields of an item in the database and the snapshot.
+
+        Args:
+            id: Item ID
+            changes: Field name to new value mapping
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+        """
+        item = await self.repository.patch(id, changes)
+        if item is not None:
+            self.snapshot.put(item)
+        return item
+
+    async def apply_discount(self, id: Any, discount_percent: float) -> Item | None:
+        """Discount an item's price in the database and the snapshot.
+
+        Args:
+            id: Item ID
+            discount_percent: Discount percentage (0-100)
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+        """
+        item = await self.repository.apply_discount(id, discount_percent)
+        if item is not None:
+            self.snapshot.put(item)
+        return item
+
+    async def apply_discount_batch(
+        self,
+        item_filter: ItemFilter,
+        discount_percent: float,
+        after_id: Any | None,
+        chunk_size: int,
+    ) -> tuple[int, Any | None]:
+        """Discount the next chunk of matching items in the database and the snapshot.
+
+        Args:
+            item_filter: Criteria selecting the items to discount
+            discount_percent: Discount percentage (0-100)
+            after_id: Only consider items with a greater ID, if given
+            chunk_size: Maximum number of items to discount
+
+        Returns:
+            tuple[int, Any | None]: Number of items discounted and the ID the
+            next chunk starts after, or None when no matching items remain
+        """
+        discounted, last_id = await self.repository.apply_discount_batch(
+            item_filter, discount_percent, after_id, chunk_size
+        )
+        if last_id is not None:
+            # Copy the range the database discounted
+            items = await self.repository.get_id_range(after_id, last_id)
+            self.snapshot.replace_range(after_id, last_id, items)
+        return discounted, last_id
+
+    async def update_many(
+        self, changes: dict[Any, dict[str, Any]], chunk_size: int
+    ) -> list[Any]:
+        """Apply partial updates to many items in the database and the snapshot.
+
+        Args:
+            changes: Mapping of item ID to the fields to change for that item
+            chunk_size: Maximum number of rows to send per statement
+
+        Returns:
+            list[Any]: IDs from ``changes`` that did not match any item
+        """
+        not_found = await self.repository.update_many(changes, chunk_size)
+        await self._read_back(list(changes), chunk_size)
+        return not_found
+
+    async def delete(self, id: Any) -> bool:
+        """Delete an item by ID from the database and the snapshot.
+
+        Args:
+            id: Item ID
+
+        Returns:
+            bool: True if deleted, False if not found
+        """
+        deleted = await self.repository.delete(id)
+        self.snapshot.discard(id)
+        return deleted
+
+    async def delete_many(
+        self,
+        chunk_size: int,
+        ids: list[Any] | None = None,
+        filters: ItemFilter | None = None,
+    ) -> int:
+        """Delete many items from the database and the snapshot.
+
+        Args:
+            chunk_size: Maximum number of rows to delete per statement
+            ids: IDs of the items to delete; all matching items if None
+            filters: Criteria the items must match, if any
+
+        Returns:
+            int: Number of items deleted
+        """
+        deleted = await self.repository.delete_many(chunk_size, ids, filters)
+        if ids is None:
+            # The database deleted the rows that matched there; of those the
+            # snapshot holds, it can only tell which by reading them back
+            ids = [item.id for item in await self.snapshot.get_all(filters)]
+        await self._read_back(ids, chunk_size)
+        return deleted
+
+    async def _read_back(self, ids: list[Any], chunk_size: int) -> None:
+        """Copy items from the primary into the snapshot after a bulk write.
+
+        Args:
+            ids: IDs of the items the write may have changed or deleted
+            chunk_size: Maximum number of IDs to look up per statement
+        """
+        items = await self.repository.get_many(ids, chunk_size)
+        found = {item.id for item in items}
+        for id in ids:
+            if id not in found:
+                self.snapshot.discard(id)
+        for item in items:
+            self.snapshot.put(item)
+
+
+async def refresh_snapshot(
+    snapshot: InMemoryItemRepository,
+    session_factory: async_sessionmaker[AsyncSession],
+    chunk_size: int,
+    interval: float,
+) -> None:
+    """Reload a snapshot from the database periodically.
+
+    Runs until cancelled. This is how a worker's snapshot picks up writes
+    made through other workers; writes this worker makes during a reload
+    are kept, as load_from describes. A failed reload is logged and
+    retried at the next interval.
+
+    Args:
+        snapshot: Snapshot to reload
+        session_factory: Factory to open the database session with
+        chunk_size: Number of rows to fetch per round trip
+        interval: Seconds between reloads
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with session_factory() as session:
+                await snapshot.load_from(SQLAlchemyItemRepository(session), chunk_size)
+        except Exception:
+            logger.exception("Reloading the item snapshot failed; retrying later")
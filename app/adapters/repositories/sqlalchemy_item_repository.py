@@ -1,23 +1,63 @@
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    String,
+    Update,
+    bindparam,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.adapters.repositories.sqlalchemy_models import ItemModel
-from app.core.domain.item import Item
+from app.adapters.repositories.sqlalchemy_models import ITEMS_NAME_FTS, ItemModel
+from app.core.domain.item import Item, ItemRecord
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.item_sort import ItemSort, ItemSortField
+from app.core.domain.item_stats import ItemStats
+from app.core.domain.pagination import Page
+from app.core.domain.result_version import ResultVersion
 from app.core.ports.item_repository import ItemRepository
 
+# Item columns in ItemRecord field order, so rows convert positionally
+ITEM_COLUMNS = tuple(ItemModel.__table__.c[field] for field in ItemRecord._fields)
+
+# Shortest term the trigram index can match; shorter ones fall back to a scan
+MIN_INDEXED_SEARCH_LENGTH = 3
+
 
 class SQLAlchemyItemRepository(ItemRepository):
-    """SQLAlchemy implementation of the ItemRepository port."""
+    """SQLAlchemy implementation of the ItemRepository port.
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Initialize the repository with a database session.
+    Reads (``get*``, ``find_*``, ``count`` and ``stream_all``) run on the read
+    session, which may be bound to a replica. Writes, and the reads a write
+    makes along the way, run on the primary session.
+    """
+
+    def __init__(
+        self, session: AsyncSession, read_session: AsyncSession | None = None
+    ) -> None:
+        """Initialize the repository with database sessions.
 
         Args:
-            session: SQLAlchemy async session
+            session: SQLAlchemy async session on the primary database
+            read_session: Session to run reads on; the primary session if None
         """
         self.session = session
+        self.read_session = session if read_session is None else read_session
 
     async def get(self, id: Any) -> Item | None:
         """Get an item by ID.
@@ -28,56 +68,513 @@ class SQLAlchemyItemRepository(ItemRepository):
         Returns:
             Item | None: Item if found, None otherwise
         """
-        result = await self.session.execute(select(ItemModel).where(ItemModel.id == id))
-        db_item = result.scalars().first()
+        return await self._get_from(self.read_session, id)
+
+    async def _get_from(self, session: AsyncSession, id: Any) -> Item | None:
+        """Get an item by ID through the given session.
+
+        Args:
+            session: Session to read with
+            id: Item ID
+
+        Returns:
+            Item | None: Item if found, None otherwise
+        """
+        result = await session.execute(select(*ITEM_COLUMNS).where(ItemModel.id == id))
+        row = result.first()
 
-        if db_item is None:
+        if row is None:
             return None
 
-        return Item.model_validate(db_item)
+        return self._to_item(row)
+
+    async def get_many(self, ids: Sequence[Any], chunk_size: int) -> list[Item]:
+        """Get the items with the given IDs from the primary, in ID order.
+
+        Reads through the write session, so the result includes writes
+        this repository has just committed even when reads go to a replica.
+
+        Args:
+            ids: Item IDs; IDs that match no item are left out
+            chunk_size: Maximum number of IDs to look up per statement
+
+        Returns:
+            list[Item]: Items found
+        """
+        items: list[Item] = []
+        for start in range(0, len(ids), chunk_size):
+            result = await self.session.execute(
+                select(*ITEM_COLUMNS).where(
+                    ItemModel.id.in_(ids[start : start + chunk_size])
+                )
+            )
+            items.extend(self._to_item(row) for row in result.all())
+        items.sort(key=lambda item: item.id)
+
+        return items
+
+    async def get_id_range(self, after_id: Any | None, last_id: Any) -> list[Item]:
+        """Get the items in an ID range from the primary, in ID order.
+
+        Args:
+            after_id: Only items with a greater ID, if given
+            last_id: Only items with this ID or a smaller one
+
+        Returns:
+            list[Item]: Items in the range
+        """
+        query = select(*ITEM_COLUMNS).where(ItemModel.id <= last_id)
+        if after_id is not None:
+            query = query.where(ItemModel.id > after_id)
+        result = await self.session.execute(query.order_by(ItemModel.id))
+
+        return [self._to_item(row) for row in result.all()]
+
+    async def get_fields(self, id: Any, fields: Sequence[str]) -> dict[str, Any] | None:
+        """Get some fields of an item by ID, selecting only their columns.
+
+        Args:
+            id: Item ID
+            fields: Names of the Item fields to return
+
+        Returns:
+            dict[str, Any] | None: Requested fields in the given order if
+            found, None otherwise
+        """
+        result = await self.read_session.execute(
+            select(*_columns(fields)).where(ItemModel.id == id)
+        )
+        row = result.first()
+
+        return None if row is None else dict(zip(fields, row, strict=True))
 
-    async def get_all(self, **kwargs: dict[str, Any]) -> list[Item]:
+    async def get_all(self, filters: ItemFilter | None = None) -> list[Item]:
         """Get all items, with optional filtering.
 
         Args:
-            **kwargs: Filter parameters
+            filters: Criteria the items must match, if any
 
         Returns:
             list[Item]: List of items
         """
-        query = select(ItemModel)
+        query = self._apply_filters(select(*ITEM_COLUMNS), filters)
+
+        result = await self.read_session.execute(query)
+
+        return [self._to_item(row) for row in result.all()]
+
+    async def get_page(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> Page[Item]:
+        """Get one page of items using keyset pagination.
+
+        The cursor holds the sort value and ID of the last row on the previous
+        page, so the next page is a range scan on an index leading with the
+        sort column (see ItemModel) and costs the same however deep the page
+        is. A top-k query is just the first page.
+
+        Args:
+            limit: Maximum number of items to return
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            Page[Item]: Items on the page and the cursor for the next one
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was returned
+                for another sort order
+        """
+        sort = sort or ItemSort()
+        query = self._apply_filters(select(*ITEM_COLUMNS), filters)
+
+        # Fetch one extra row to find out whether another page follows
+        query = self._page_window(query, limit + 1, after, sort)
+        result = await self.read_session.execute(query)
+        rows = result.all()
+
+        items = [self._to_item(row) for row in rows[:limit]]
+        next_cursor = sort.encode_cursor(items[-1]) if len(rows) > limit else None
+
+        return Page(items=items, next_cursor=next_cursor)
+
+    async def get_page_version(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> ResultVersion:
+        """Summarize the page get_page would return, without loading it.
+
+        Reads the same ``limit + 1`` row window get_page does, but only the
+        ID and version of each row, so the version matches the one computed
+        from the page get_page returns.
+
+        Args:
+            limit: Maximum number of items on the page
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            ResultVersion: Version of the page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was returned
+                for another sort order
+        """
+        window = self._apply_filters(select(ItemModel.id, ItemModel.version), filters)
+        window = self._page_window(window, limit + 1, after, sort or ItemSort())
+        result = await self.read_session.execute(window)
+        rows = result.all()
+
+        return ResultVersion.of(rows[:limit], more=len(rows) > limit)
+
+    async def get_page_fields(
+        self,
+        fields: Sequence[str],
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> Page[dict[str, Any]]:
+        """Get some fields of one page of items, as get_page would return it.
+
+        Only the requested columns are selected, plus the ID and sort column
+        when the cursor needs them.
+
+        Args:
+            fields: Names of the Item fields to return
+            limit: Maximum number of items to return
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            Page[dict[str, Any]]: Requested fields of the items on the page
+            and the cursor for the next one
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was returned
+                for another sort order
+        """
+        sort = sort or ItemSort()
+        keys = [str(key) for key in {sort.field: None, "id": None}]
+        extra = [key for key in keys if key not in fields]
+        names = [*fields, *extra]
+        query = self._apply_filters(select(*_columns(names)), filters)
 
-        # Apply filters if provided
-        for key, value in kwargs.items():
-            if hasattr(ItemModel, key):
-                query = query.where(getattr(ItemModel, key) == value)
+        query = self._page_window(query, limit + 1, after, sort)
+        result = await self.read_session.execute(query)
+        rows = result.all()
 
-        result = await self.session.execute(query)
-        db_items = result.scalars().all()
+        records = [dict(zip(names, row, strict=True)) for row in rows[:limit]]
+        next_cursor = sort.encode_cursor(records[-1]) if len(rows) > limit else None
+        for record in records:
+            for key in extra:
+                del record[key]
 
-        return [Item.model_validate(db_item) for db_item in db_items]
+        return Page(items=records, next_cursor=next_cursor)
+
+    def _page_window(
+        self, query: Select[Any], size: int, after: str | None, sort: ItemSort
+    ) -> Select[Any]:
+        """Restrict a query to the ``size`` rows that follow a cursor.
+
+        Args:
+            query: Query selecting the matching rows
+            size: Maximum number of rows to select
+            after: Opaque cursor returned with the previous page, if any
+            sort: Order of the rows
+
+        Returns:
+            Select[Any]: Ordered and limited query
+
+        Raises:
+            InvalidCursorError: If the cursor does not belong to ``sort``
+        """
+        keys = [ItemModel.id]
+        if sort.field is not ItemSortField.ID:
+            keys.insert(0, ItemModel.__table__.c[sort.field])
+
+        if after is not None:
+            # Row values compare lexicographically, which both backends
+            # can answer with a range scan on the (column, id) index
+            last = [
+                self._bind(key, value)
+                for key, value in zip(keys, sort.decode_cursor(after), strict=True)
+            ]
+            position = tuple_(*keys) if len(keys) > 1 else keys[0]
+            bound = tuple_(*last) if len(keys) > 1 else last[0]
+            query = query.where(
+                position < bound if sort.descending else position > bound
+            )
+
+        order = [key.desc() for key in keys] if sort.descending else keys
+        return query.order_by(*order).limit(size)
+
+    async def find_by_name_version(
+        self, name: str, limit: int | None = None
+    ) -> ResultVersion:
+        """Summarize the result find_by_name would return, without loading it.
+
+        Args:
+            name: Item name to search for
+            limit: Maximum number of items to consider, if given
+
+        Returns:
+            ResultVersion: Version of the search result
+        """
+        matches = self._search(select(ItemModel.id, ItemModel.version), name, limit)
+
+        return await self._result_version(matches)
+
+    async def _result_version(self, rows: Select[Any]) -> ResultVersion:
+        """Aggregate a query over (id, version) into a result version.
+
+        Args:
+            rows: Query selecting the ID and version of each row
+
+        Returns:
+            ResultVersion: Version of the rows
+        """
+        subquery = rows.subquery()
+        result = await self.read_session.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(subquery.c.id), 0),
+                func.coalesce(func.sum(subquery.c.version), 0),
+            )
+        )
+        count, checksum, revision = result.one()
+
+        return ResultVersion(
+            count=count, checksum=int(checksum), revision=int(revision)
+        )
+
+    async def stream_all(
+        self, chunk_size: int, filters: ItemFilter | None = None
+    ) -> AsyncIterator[ItemRecord]:
+        """Iterate over all items using a server-side cursor.
+
+        Rows are fetched ``chunk_size`` at a time through
+        ``AsyncSession.stream``. They are plain column rows rather than ORM
+        entities, so nothing is added to the identity map and each chunk is
+        released once its records have been consumed.
+
+        Args:
+            chunk_size: Number of rows to fetch per round trip
+            filters: Criteria the items must match, if any
+
+        Yields:
+            ItemRecord: Items in ID order
+        """
+        query = (
+            self._apply_filters(select(*ITEM_COLUMNS), filters)
+            .order_by(ItemModel.id)
+            .execution_options(yield_per=chunk_size)
+        )
+
+        result = await self.read_session.stream(query)
+        async for rows in result.partitions(chunk_size):
+            for row in rows:
+                yield ItemRecord._make(row)
+
+    @staticmethod
+    def _to_item(row: Row[Any]) -> Item:
+        """Build a domain item from a row of ITEM_COLUMNS without validation.
+
+        The database already enforces the item constraints, so rows read
+        back from it are trusted.
+
+        Args:
+            row: Row selected with ITEM_COLUMNS
+
+        Returns:
+            Item: Domain item
+        """
+        return Item.from_trusted(dict(zip(ItemRecord._fields, row, strict=True)))
+
+    @staticmethod
+    def _model_to_item(db_item: ItemModel) -> Item:
+        """Build a domain item from a loaded ORM entity without validation.
+
+        Args:
+            db_item: Item entity with every column loaded
+
+        Returns:
+            Item: Domain item
+        """
+        return Item.from_trusted(
+            {column.key: getattr(db_item, column.key) for column in ITEM_COLUMNS}
+        )
+
+    def _apply_filters(
+        self, query: Select[Any], filters: ItemFilter | None
+    ) -> Select[Any]:
+        """Restrict a query to the items matching a filter.
+
+        Args:
+            query: Query selecting from the items table
+            filters: Criteria the items must match, if any
+
+        Returns:
+            Select[Any]: Filtered query
+        """
+        if filters is None:
+            return query
+        return query.where(*self._item_filter_clauses(filters))
+
+    def _item_filter_clauses(
+        self, item_filter: ItemFilter
+    ) -> list[ColumnElement[bool]]:
+        """Compile an item filter into SQL conditions.
+
+        Every condition can be served by an index on ``items``: the status,
+        price and timestamp ones by the composite indexes on ItemModel, and
+        the name prefix by the index on ``name``.
+
+        Args:
+            item_filter: Criteria selecting a set of items
+
+        Returns:
+            list[ColumnElement[bool]]: Conditions to AND together
+        """
+        clauses: list[ColumnElement[bool]] = []
+        if item_filter.is_active is not None:
+            clauses.append(ItemModel.is_active.is_(item_filter.is_active))
+        if item_filter.name_prefix is not None:
+            clauses.append(self._name_prefix_clause(item_filter.name_prefix))
+        if item_filter.name_contains is not None:
+            clauses.append(
+                ItemModel.name.icontains(item_filter.name_contains, autoescape=True)
+            )
+        bounds = (
+            (ItemModel.price, item_filter.min_price, item_filter.max_price),
+            (ItemModel.created_at, item_filter.created_from, item_filter.created_to),
+            (ItemModel.updated_at, item_filter.updated_from, item_filter.updated_to),
+        )
+        for field, low, high in bounds:
+            if low is not None:
+                clauses.append(field >= self._bind(field, low))
+            if high is not None:
+                clauses.append(field <= self._bind(field, high))
+        return clauses
+
+    def _bind(self, column: ColumnElement[Any], value: Any) -> ColumnElement[Any]:
+        """Bind a value to compare against a column.
+
+        SQLite keeps timestamps as text, and those written by ``func.now()``
+        have no fractional seconds while bound datetimes always have six
+        digits, so equal times would compare as unequal strings. ``str()`` of
+        a datetime leaves out zero microseconds, matching both forms.
+
+        Args:
+            column: Column the value is compared with
+            value: Value to compare
+
+        Returns:
+            ColumnElement[Any]: Bound parameter
+        """
+        if isinstance(value, datetime) and self.session.bind.dialect.name == "sqlite":
+            return literal(str(value), String)
+        return literal(value, column.type)
+
+    def _name_prefix_clause(self, prefix: str) -> ColumnElement[bool]:
+        """Build a case-sensitive name prefix condition that can use an index.
+
+        SQLite only uses an index for a prefix match with GLOB, since LIKE
+        there is case-insensitive. Elsewhere it is ``LIKE 'prefix%'``, which
+        PostgreSQL serves from the text_pattern_ops index.
+
+        Args:
+            prefix: Text the names must start with
+
+        Returns:
+            ColumnElement[bool]: Prefix condition
+        """
+        if self.session.bind.dialect.name == "sqlite":
+            # Wrap GLOB wildcards in brackets so they match literally
+            pattern = "".join(f"[{c}]" if c in "*?[" else c for c in prefix)
+            return ItemModel.name.op("GLOB")(pattern + "*")
+        return ItemModel.name.startswith(prefix, autoescape=True)
 
     async def create(self, entity: Item) -> Item:
         """Create a new item.
 
+        Where the backend supports it this is a single
+        ``INSERT ... RETURNING`` statement; other backends re-select the row
+        for its generated columns.
+
         Args:
             entity: Item to create
 
         Returns:
             Item: Created item
         """
-        db_item = ItemModel(
-            name=entity.name,
-            description=entity.description,
-            price=entity.price,
-            is_active=entity.is_active,
+        values = entity.model_dump(
+            include={"name", "description", "price", "is_active"}
         )
-
+        if self.session.bind.dialect.insert_returning:
+            result = await self.session.execute(
+                insert(ItemModel).values(**values).returning(*ITEM_COLUMNS)
+            )
+            row = result.one()
+            await self.session.commit()
+            return self._to_item(row)
+
+        db_item = ItemModel(**values)
         self.session.add(db_item)
         await self.session.commit()
         await self.session.refresh(db_item)
 
-        return Item.model_validate(db_item)
+        return self._model_to_item(db_item)
+
+    async def create_many(self, entities: list[Item], chunk_size: int) -> list[Item]:
+        """Create many items in a single transaction.
+
+        On backends that can return rows from a multi-row INSERT (PostgreSQL,
+        SQLite 3.35+) each chunk is one ``INSERT ... VALUES (...), (...)
+        RETURNING`` statement. Other backends fall back to the ORM unit of
+        work, which inserts row by row but still commits once.
+
+        Args:
+            entities: Items to create
+            chunk_size: Maximum number of rows to send per INSERT statement
+
+        Returns:
+            list[Item]: Created items, in the same order as ``entities``
+        """
+        rows = [
+            entity.model_dump(include={"name", "description", "price", "is_active"})
+            for entity in entities
+        ]
+        created: list[Item] = []
+
+        if self.session.bind.dialect.insert_executemany_returning:
+            statement = insert(ItemModel).returning(
+                *ITEM_COLUMNS, sort_by_parameter_order=True
+            )
+            for start in range(0, len(rows), chunk_size):
+                result = await self.session.execute(
+                    statement, rows[start : start + chunk_size]
+                )
+                created.extend(self._to_item(row) for row in result.all())
+        else:
+            db_items = [ItemModel(**row) for row in rows]
+            self.session.add_all(db_items)
+            await self.session.flush()
+            created = [self._model_to_item(db_item) for db_item in db_items]
+
+        await self.session.commit()
+
+        return created
 
     async def update(self, id: Any, entity: Item) -> Item | None:
         """Update an existing item.
@@ -89,29 +586,263 @@ class SQLAlchemyItemRepository(ItemRepository):
         Returns:
             Item | None: Updated item if found, None otherwise
         """
-        # Check if item exists
-        result = await self.session.execute(select(ItemModel).where(ItemModel.id == id))
-        db_item = result.scalars().first()
+        update_data = entity.model_dump(
+            exclude={"id", "created_at", "updated_at", "version"}, exclude_none=True
+        )
 
-        if db_item is None:
-            return None
+        return await self.patch(id, update_data)
 
-        # Update item
-        update_data = entity.model_dump(
-            exclude={"id", "created_at", "updated_at"}, exclude_none=True
+    async def patch(self, id: Any, changes: dict[str, Any]) -> Item | None:
+        """Update only the given fields of an item.
+
+        Where the backend supports it this is a single
+        ``UPDATE ... RETURNING`` statement, and "no row returned" means the
+        item does not exist. Other backends re-select the row afterwards.
+
+        Args:
+            id: Item ID
+            changes: Field name to new value mapping
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+        """
+        if not changes:
+            return await self._get_from(self.session, id)
+
+        statement = update(ItemModel).where(ItemModel.id == id).values(**changes)
+
+        return await self._update_returning(id, statement)
+
+    async def apply_discount(self, id: Any, discount_percent: float) -> Item | None:
+        """Discount an item's price in a single atomic statement.
+
+        The new price is computed by the database as ``price * factor``, so
+        concurrent discounts compound instead of overwriting each other.
+
+        Args:
+            id: Item ID
+            discount_percent: Discount percentage (0-100)
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+
+        Raises:
+            ValueError: If the discount is outside 0-100
+        """
+        factor = Item.discount_factor(discount_percent)
+        statement = (
+            update(ItemModel)
+            .where(ItemModel.id == id)
+            .values(price=ItemModel.price * factor)
         )
 
-        await self.session.execute(
-            update(ItemModel).where(ItemModel.id == id).values(**update_data)
+        return await self._update_returning(id, statement)
+
+    async def apply_discount_batch(
+        self,
+        item_filter: ItemFilter,
+        discount_percent: float,
+        after_id: Any | None,
+        chunk_size: int,
+    ) -> tuple[int, Any | None]:
+        """Discount the next chunk of matching items in one transaction.
+
+        The chunk is an ID range: the upper bound is the ID of the
+        ``chunk_size``-th matching item after ``after_id``, and a single
+        set-based UPDATE discounts the matching items in that range.
+
+        Args:
+            item_filter: Criteria selecting the items to discount
+            discount_percent: Discount percentage (0-100)
+            after_id: Only consider items with a greater ID, if given
+            chunk_size: Maximum number of items to discount
+
+        Returns:
+            tuple[int, Any | None]: Number of items discounted and the ID the
+            next chunk starts after, or None when no matching items remain
+
+        Raises:
+            ValueError: If the discount is outside 0-100
+        """
+        factor = Item.discount_factor(discount_percent)
+        clauses = self._item_filter_clauses(item_filter)
+        if after_id is not None:
+            clauses.append(ItemModel.id > after_id)
+
+        chunk = (
+            select(ItemModel.id)
+            .where(*clauses)
+            .order_by(ItemModel.id)
+            .limit(chunk_size)
+            .subquery()
         )
+        last_id = await self.session.scalar(select(func.max(chunk.c.id)))
+        if last_id is None:
+            return 0, None
 
+        result = await self.session.execute(
+            update(ItemModel)
+            .where(*clauses, ItemModel.id <= last_id)
+            .values(price=ItemModel.price * factor),
+            execution_options={"synchronize_session": False},
+        )
         await self.session.commit()
 
-        # Get updated item
-        result = await self.session.execute(select(ItemModel).where(ItemModel.id == id))
-        updated_db_item = result.scalars().first()
+        return result.rowcount, last_id
 
-        return Item.model_validate(updated_db_item)
+    async def count(self, item_filter: ItemFilter) -> int:
+        """Count the items matching a filter.
+
+        Args:
+            item_filter: Criteria selecting the items to count
+
+        Returns:
+            int: Number of matching items
+        """
+        query = (
+            select(func.count())
+            .select_from(ItemModel)
+            .where(*self._item_filter_clauses(item_filter))
+        )
+        return (await self.read_session.scalar(query)) or 0
+
+    async def get_stats(
+        self,
+        bucket_width: float,
+        filters: ItemFilter | None = None,
+        max_buckets: int | None = None,
+    ) -> ItemStats:
+        """Compute aggregate statistics over the matching items.
+
+        Runs a single query grouped by price bucket. Each group carries its
+        count, active count, price range and price total, and the overall
+        figures are combined from those few rows, so the matching rows are
+        read once and never leave the database. With ``max_buckets`` at most
+        one group more than that is fetched, which is enough to tell that
+        the histogram is too wide.
+
+        Args:
+            bucket_width: Width of the price histogram buckets
+            filters: Criteria the items must match, if any
+            max_buckets: Most buckets the histogram may span, empty ones
+                included; no limit if None
+
+        Returns:
+            ItemStats: Counts, price summary and price histogram
+
+        Raises:
+            TooManyBucketsError: If the histogram would span more than
+                ``max_buckets`` buckets
+        """
+        bucket = self._price_bucket(bucket_width).label("bucket")
+        query = self._apply_filters(
+            select(
+                bucket,
+                func.count(),
+                func.sum(case((ItemModel.is_active, 1), else_=0)),
+                func.min(ItemModel.price),
+                func.max(ItemModel.price),
+                func.sum(ItemModel.price),
+            ),
+            filters,
+        )
+        query = query.group_by(bucket).order_by(bucket)
+        if max_buckets is not None:
+            query = query.limit(max_buckets + 1)
+        result = await self.read_session.execute(query)
+
+        return ItemStats.from_buckets(
+            bucket_width,
+            ((int(row[0]), *row[1:]) for row in result.all()),
+            max_buckets,
+        )
+
+    def _price_bucket(self, bucket_width: float) -> ColumnElement[Any]:
+        """Build the expression giving the histogram bucket of each price.
+
+        SQLite only has floor() when built with its math functions, so there
+        the quotient is cast to an integer instead, which truncates the
+        same way for the positive prices items have.
+
+        Args:
+            bucket_width: Width of the price histogram buckets
+
+        Returns:
+            ColumnElement[Any]: Bucket index expression
+        """
+        quotient = ItemModel.price / bucket_width
+        if self.session.bind.dialect.name == "sqlite":
+            return cast(quotient, Integer)
+        return func.floor(quotient)
+
+    async def _update_returning(self, id: Any, statement: Update) -> Item | None:
+        """Run a single-row UPDATE and return the updated item.
+
+        Args:
+            id: Item ID the statement is restricted to
+            statement: UPDATE statement for that item
+
+        Returns:
+            Item | None: Updated item if a row matched, None otherwise
+        """
+        if self.session.bind.dialect.update_returning:
+            result = await self.session.execute(statement.returning(*ITEM_COLUMNS))
+            row = result.first()
+            await self.session.commit()
+            return None if row is None else self._to_item(row)
+
+        result = await self.session.execute(statement)
+        await self.session.commit()
+        if result.rowcount == 0:
+            return None
+        return await self._get_from(self.session, id)
+
+    async def update_many(
+        self, changes: dict[Any, dict[str, Any]], chunk_size: int
+    ) -> list[Any]:
+        """Apply partial updates to many items in a single transaction.
+
+        Items whose changes touch the same set of columns share one
+        ``UPDATE ... WHERE id = :id`` statement, executed with many parameter
+        sets (executemany) in chunks of ``chunk_size``.
+
+        Args:
+            changes: Mapping of item ID to the fields to change for that item
+            chunk_size: Maximum number of rows to send per statement
+
+        Returns:
+            list[Any]: IDs from ``changes`` that did not match any item
+        """
+        ids = list(changes)
+        existing: set[Any] = set()
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            result = await self.session.execute(
+                select(ItemModel.id).where(ItemModel.id.in_(chunk))
+            )
+            existing.update(result.scalars().all())
+
+        # Group rows by the columns they change so each group is one statement
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for id, values in changes.items():
+            columns = tuple(sorted(values))
+            if id in existing and columns:
+                groups.setdefault(columns, []).append({"_id": id, **values})
+
+        connection = await self.session.connection()
+        table = ItemModel.__table__
+        for columns, params in groups.items():
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam("_id"))
+                .values({column: bindparam(column) for column in columns})
+            )
+            for start in range(0, len(params), chunk_size):
+                await connection.execute(statement, params[start : start + chunk_size])
+
+        await self.session.commit()
+
+        return [id for id in ids if id not in existing]
 
     async def delete(self, id: Any) -> bool:
         """Delete an item by ID.
@@ -129,22 +860,135 @@ class SQLAlchemyItemRepository(ItemRepository):
         # If no rows were deleted, the item wasn't found
         return result.rowcount > 0
 
-    async def find_by_name(self, name: str) -> list[Item]:
-        """Find items by name (partial match).
+    async def delete_many(
+        self,
+        chunk_size: int,
+        ids: list[Any] | None = None,
+        filters: ItemFilter | None = None,
+    ) -> int:
+        """Delete many items by ID, by filter, or both.
+
+        An ID list is deleted with ``DELETE ... WHERE id IN (...)`` in chunks
+        of ``chunk_size`` and committed once. A filter-only delete removes
+        matching rows ``chunk_size`` at a time, lowest IDs first, committing
+        after each chunk so no transaction locks the whole set.
+
+        Args:
+            chunk_size: Maximum number of rows to delete per statement
+            ids: IDs of the items to delete; all matching items if None
+            filters: Criteria the items must match, if any
+
+        Returns:
+            int: Number of items deleted
+        """
+        clauses = [] if filters is None else self._item_filter_clauses(filters)
+        deleted = 0
+
+        if ids is not None:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start : start + chunk_size]
+                result = await self.session.execute(
+                    delete(ItemModel).where(ItemModel.id.in_(chunk), *clauses),
+                    execution_options={"synchronize_session": False},
+                )
+                deleted += result.rowcount
+            await self.session.commit()
+            return deleted
+
+        while True:
+            batch = (
+                select(ItemModel.id)
+                .where(*clauses)
+                .order_by(ItemModel.id)
+                .limit(chunk_size)
+            )
+            result = await self.session.execute(
+                delete(ItemModel).where(ItemModel.id.in_(batch)),
+                execution_options={"synchronize_session": False},
+            )
+            await self.session.commit()
+            deleted += result.rowcount
+            if result.rowcount < chunk_size:
+                return deleted
+
+    async def find_by_name(self, name: str, limit: int | None = None) -> list[Item]:
+        """Find items by name (partial match), best matches first.
+
+        Uses the trigram index on ``name`` where the database has one, so
+        the search does not scan the table.
 
         Args:
             name: Item name to search for
+            limit: Maximum number of items to return, if given
 
         Returns:
-            list[Item]: List of matching items
+            list[Item]: List of matching items, ordered by relevance
         """
-        result = await self.session.execute(
-            select(ItemModel).where(ItemModel.name.ilike(f"%{name}%"))
+        result = await self.read_session.execute(
+            self._search(select(*ITEM_COLUMNS), name, limit)
+        )
+
+        return [self._to_item(row) for row in result.all()]
+
+    async def find_by_name_fields(
+        self, fields: Sequence[str], name: str, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Get some fields of the items find_by_name would return.
+
+        Only the requested columns are selected.
+
+        Args:
+            fields: Names of the Item fields to return
+            name: Item name to search for
+            limit: Maximum number of items to return, if given
+
+        Returns:
+            list[dict[str, Any]]: Requested fields of the matching items,
+            ordered by relevance
+        """
+        result = await self.read_session.execute(
+            self._search(select(*_columns(fields)), name, limit)
         )
 
-        db_items = result.scalars().all()
+        return [dict(zip(fields, row, strict=True)) for row in result.all()]
 
-        return [Item.model_validate(db_item) for db_item in db_items]
+    def _search(self, query: Select[Any], name: str, limit: int | None) -> Select[Any]:
+        """Restrict an items query to a ranked name search.
+
+        PostgreSQL matches with ILIKE, which the pg_trgm GIN index serves,
+        and ranks by trigram similarity. SQLite matches through the FTS5
+        trigram index and ranks by bm25. Elsewhere, and for terms too short
+        for trigrams, it scans with ILIKE and ranks shorter names first.
+
+        Args:
+            query: Query selecting from the items table
+            name: Item name to search for
+            limit: Maximum number of rows to return, if given
+
+        Returns:
+            Select[Any]: Query returning matching rows, best first
+        """
+        dialect = self.session.bind.dialect.name
+
+        if dialect == "sqlite" and len(name) >= MIN_INDEXED_SEARCH_LENGTH:
+            # A quoted FTS5 string matches as a substring under trigrams
+            phrase = '"' + name.replace('"', '""') + '"'
+            query = (
+                query.join(ITEMS_NAME_FTS, ITEMS_NAME_FTS.c.rowid == ItemModel.id)
+                .where(ITEMS_NAME_FTS.c.name.op("MATCH")(phrase))
+                .order_by(ITEMS_NAME_FTS.c.rank)
+            )
+        else:
+            query = query.where(ItemModel.name.icontains(name, autoescape=True))
+            if dialect == "postgresql":
+                query = query.order_by(func.similarity(ItemModel.name, name).desc())
+            else:
+                query = query.order_by(func.length(ItemModel.name))
+
+        query = query.order_by(ItemModel.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
 
     async def find_active_items(self) -> list[Item]:
         """Find all active items.
@@ -152,10 +996,13 @@ class SQLAlchemyItemRepository(ItemRepository):
         Returns:
             list[Item]: List of active items
         """
-        result = await self.session.execute(
-            select(ItemModel).where(ItemModel.is_active.is_(True))
+        result = await self.read_session.execute(
+            select(*ITEM_COLUMNS).where(ItemModel.is_active.is_(True))
         )
 
-        db_items = result.scalars().all()
+        return [self._to_item(row) for row in result.all()]
+
 
-        return [Item.model_validate(db_item) for db_item in db_items]
+def _columns(fields: Sequence[str]) -> list[Column[Any]]:
+    """Get the item columns for the given Item field names, in order."""
+    return [ItemModel.__table__.c[field] for field in fields]
@@ -0,0 +1,79 @@
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repositories.sqlalchemy_models import JobModel
+from app.core.domain.job import Job
+from app.core.ports.job_repository import JobRepository
+
+
+class SQLAlchemyJobRepository(JobRepository):
+    """SQLAlchemy implementation of the JobRepository port."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository with a database session.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+
+    async def get(self, id: Any) -> Job | None:
+        """Get a job by ID.
+
+        Args:
+            id: Job ID
+
+        Returns:
+            Job | None: Job if found, None otherwise
+        """
+        result = await self.session.execute(select(JobModel).where(JobModel.id == id))
+        db_job = result.scalars().first()
+
+        if db_job is None:
+            return None
+
+        return Job.model_validate(db_job)
+
+    async def create(self, entity: Job) -> Job:
+        """Create a new job.
+
+        Args:
+            entity: Job to create
+
+        Returns:
+            Job: Created job
+        """
+        db_job = JobModel(
+            name=entity.name,
+            status=entity.status.value,
+            total=entity.total,
+            processed=entity.processed,
+            error=entity.error,
+        )
+
+        self.session.add(db_job)
+        await self.session.commit()
+        await self.session.refresh(db_job)
+
+        return Job.model_validate(db_job)
+
+    async def patch(self, id: Any, changes: dict[str, Any]) -> Job | None:
+        """Update only the given fields of a job.
+
+        Args:
+            id: Job ID
+            changes: Field name to new value mapping
+
+        Returns:
+            Job | None: Updated job if found, None otherwise
+        """
+        result = await self.session.execute(
+            update(JobModel).where(JobModel.id == id).values(**changes)
+        )
+        await self.session.commit()
+
+        if result.rowcount == 0:
+            return None
+        return await self.get(id)
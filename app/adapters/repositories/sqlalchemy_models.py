@@ -1,4 +1,18 @@
-from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, func
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    column,
+    event,
+    func,
+    literal_column,
+    table,
+)
 from sqlalchemy.ext.declarative import declarative_base
 
 # Create the declarative base - this is a class factory
@@ -10,11 +24,91 @@ class ItemModel(Base):  # type: ignore[misc, valid-type]
     """SQLAlchemy model for items table."""
 
     __tablename__ = "items"
+    __table_args__ = (
+        # Keyset pagination over a status-filtered list
+        Index("ix_items_is_active_id", "is_active", "id"),
+        # Range filters and sorted pages, with id last so the keyset order
+        # comes straight from the index in either direction
+        Index("ix_items_name_id", "name", "id"),
+        Index("ix_items_price_id", "price", "id"),
+        Index("ix_items_is_active_price_id", "is_active", "price", "id"),
+        Index("ix_items_created_at_id", "created_at", "id"),
+        Index("ix_items_updated_at_id", "updated_at", "id"),
+        # Prefix search on name; SQLite's GLOB already uses ix_items_name_id, but
+        # PostgreSQL needs pattern ops for LIKE outside the C locale
+        Index(
+            "ix_items_name_pattern",
+            "name",
+            postgresql_ops={"name": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+        # Substring search on name; SQLite uses ITEMS_NAME_FTS instead
+        Index(
+            "ix_items_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, index=True)
+    name = Column(String)
     description = Column(String, nullable=True)
     price = Column(Float)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    # Grows by one with every UPDATE, unlike updated_at, whose resolution is
+    # one second on SQLite
+    version = Column(
+        Integer, nullable=False, default=1, onupdate=literal_column("version + 1")
+    )
+
+
+# Trigram full-text index over items.name on SQLite. It is an external
+# content table, so it stores only the index, and triggers keep it in sync
+# with every write to items, including bulk Core statements.
+ITEMS_NAME_FTS = table(
+    "items_name_fts", column("rowid"), column("name"), column("rank")
+)
+
+event.listen(
+    ItemModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+for statement in (
+    "CREATE VIRTUAL TABLE items_name_fts USING fts5("
+    "name, content='items', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER items_name_fts_insert AFTER INSERT ON items BEGIN "
+    "INSERT INTO items_name_fts (rowid, name) VALUES (new.id, new.name); END",
+    "CREATE TRIGGER items_name_fts_delete AFTER DELETE ON items BEGIN "
+    "INSERT INTO items_name_fts (items_name_fts, rowid, name) "
+    "VALUES ('delete', old.id, old.name); END",
+    "CREATE TRIGGER items_name_fts_update AFTER UPDATE OF name ON items BEGIN "
+    "INSERT INTO items_name_fts (items_name_fts, rowid, name) "
+    "VALUES ('delete', old.id, old.name); "
+    "INSERT INTO items_name_fts (rowid, name) VALUES (new.id, new.name); END",
+):
+    event.listen(
+        ItemModel.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    ItemModel.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS items_name_fts").execute_if(dialect="sqlite"),
+)
+
+
+class JobModel(Base):  # type: ignore[misc, valid-type]
+    """SQLAlchemy model for background jobs table."""
+
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String)
+    status = Column(String)
+    total = Column(Integer, default=0)
+    processed = Column(Integer, default=0)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
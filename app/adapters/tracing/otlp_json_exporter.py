@@ -0,0 +1,163 @@
+import json
+import logging
+import queue
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from app.core.domain.span import Span
+from app.core.ports.span_exporter import SpanExporter
+
+logger = logging.getLogger(__name__)
+
+# OTLP status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class OTLPJsonFileExporter(SpanExporter):
+    """Appends traces to a file in the OTLP JSON encoding.
+
+    Each line is one ``ExportTraceServiceRequest`` holding the spans of one
+    trace, the format the OpenTelemetry collector's otlpjsonfile receiver
+    reads, so traces recorded offline can be loaded into any OTLP backend.
+
+    export() only queues the trace. A background thread encodes the queued
+    traces and appends them in batches, one write per batch, so the event
+    loop never waits for the file. Traces arriving while the queue is full
+    are dropped and counted in ``dropped``. Writes go to an append-mode
+    file, so the workers of a server can share it.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        service_name: str,
+        max_queued: int = 2048,
+        max_batch: int = 512,
+    ) -> None:
+        """Initialize the exporter and start its writer thread.
+
+        Args:
+            path: File to append traces to
+            service_name: Name the traces are reported under
+            max_queued: Number of traces that can wait to be written
+            max_batch: Maximum number of traces written at once
+        """
+        self.path = Path(path)
+        self.resource = {"attributes": _attributes({"service.name": service_name})}
+        self.max_batch = max_batch
+        self.dropped = 0
+        # None asks the writer thread to stop
+        self._queue: queue.Queue[Sequence[Span] | None] = queue.Queue(max_queued)
+        self._writer = threading.Thread(
+            target=self._write_batches, name="otlp-json-exporter", daemon=True
+        )
+        self._writer.start()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """Queue the spans of one finished trace to be written.
+
+        Args:
+            spans: Spans of the trace
+        """
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self) -> None:
+        """Write the traces still queued and stop the writer thread."""
+        if not self._writer.is_alive():
+            return
+        self._queue.put(None)
+        self._writer.join()
+
+    def _write_batches(self) -> None:
+        """Append queued traces to the file until asked to stop."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = "".join(self._line(spans) for spans in batch if spans is not None)
+            if lines:
+                try:
+                    with self.path.open("a", encoding="utf-8") as file:
+                        file.write(lines)
+                except OSError:
+                    logger.exception("Writing traces to %s failed", self.path)
+            if None in batch:
+                return
+
+    def _line(self, spans: Sequence[Span]) -> str:
+        """Encode the spans of one trace as a line of OTLP JSON.
+
+        Args:
+            spans: Spans of the trace
+
+        Returns:
+            str: ExportTraceServiceRequest JSON, with a trailing newline
+        """
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": self.resource,
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "app"},
+                            "spans": [_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        return json.dumps(request, separators=(",", ":")) + "\n"
+
+
+def _span(span: Span) -> dict[str, Any]:
+    """Encode a span as an OTLP JSON span.
+
+    IDs are hex strings and 64-bit integers are strings, as the OTLP JSON
+    encoding requires.
+    """
+    encoded: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": int(span.kind),
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": _attributes(span.attributes),
+        "status": (
+            {"code": STATUS_ERROR, "message": span.error}
+            if span.error is not None
+            else {"code": STATUS_OK}
+        ),
+    }
+    if span.parent_id is not None:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+def _attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    """Encode attributes as OTLP key-value pairs."""
+    return [
+        {"key": key, "value": _value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+def _value(value: Any) -> dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
@@ -0,0 +1,128 @@
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response, status
+
+from app.core.domain.base import BaseDomainModel
+from app.core.domain.result_version import ResultVersion
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong entity tag from the values a representation depends on.
+
+    Args:
+        *parts: Values that together determine the response body
+
+    Returns:
+        str: Quoted entity tag
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def entity_etag(entity: BaseDomainModel) -> str:
+    """Build an entity tag for a single domain entity.
+
+    Every field is included because updated_at alone may not change between
+    two writes made within the resolution of the database clock.
+
+    Args:
+        entity: Domain entity the response is built from
+
+    Returns:
+        str: Quoted entity tag
+    """
+    return make_etag(
+        type(entity).__name__,
+        *(getattr(entity, field) for field in type(entity).model_fields),
+    )
+
+
+def result_etag(version: ResultVersion, *params: Any) -> str:
+    """Build an entity tag for a query result.
+
+    Args:
+        version: Version of the query result
+        *params: Query parameters that select the result
+
+    Returns:
+        str: Quoted entity tag
+    """
+    return make_etag(
+        *params, version.count, version.checksum, version.revision, version.more
+    )
+
+
+def not_modified(
+    request: Request, etag: str, last_modified: datetime | None
+) -> Response | None:
+    """Answer a conditional GET if the client's copy is still current.
+
+    If-None-Match takes precedence over If-Modified-Since, as in RFC 9110.
+
+    Args:
+        request: Incoming request
+        etag: Entity tag of the current representation
+        last_modified: Last modification time of the current representation
+
+    Returns:
+        Response | None: A 304 response, or None if the body must be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if not _etag_matches(if_none_match, etag):
+            return None
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or last_modified is None:
+            return None
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return None
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        # HTTP dates have one second resolution
+        if _as_utc(last_modified).replace(microsecond=0) > since:
+            return None
+
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: datetime | None
+) -> None:
+    """Set the ETag and Last-Modified headers on a response.
+
+    Args:
+        response: Response to update
+        etag: Entity tag of the representation
+        last_modified: Last modification time of the representation, if known
+    """
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            _as_utc(last_modified), usegmt=True
+        )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an entity tag.
+
+    Uses the weak comparison RFC 9110 requires for If-None-Match.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag.removeprefix("W/") for tag in candidates)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes from the database as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
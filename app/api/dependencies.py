@@ -1,39 +1,260 @@
-from typing import Annotated
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Annotated, Any
 
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
-from app.adapters.repositories.database import get_session
+from app.adapters.cache.lru_cache import LRUCache
+from app.adapters.cache.query_cache import QueryCache
+from app.adapters.cache.shared_cache import create_shared_cache
+from app.adapters.metrics.prometheus_metrics import repository_timer
+from app.adapters.repositories.cached_item_repository import CachedItemRepository
+from app.adapters.repositories.database import (
+    async_session_factory,
+    engine,
+    get_session,
+    read_replicas,
+)
+from app.adapters.repositories.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from app.adapters.repositories.instrumented_item_repository import (
+    InstrumentedItemRepository,
+)
+from app.adapters.repositories.replicas import ReadReplicas
+from app.adapters.repositories.snapshot_item_repository import (
+    SnapshotItemRepository,
+)
 from app.adapters.repositories.sqlalchemy_item_repository import (
     SQLAlchemyItemRepository,
 )
+from app.adapters.repositories.sqlalchemy_job_repository import (
+    SQLAlchemyJobRepository,
+)
+from app.api.middleware import reads_primary
+from app.core.config import settings
+from app.core.domain.item import Item
 from app.core.ports.item_repository import ItemRepository
+from app.core.ports.job_repository import JobRepository
 from app.core.services.item_service import ItemService
+from app.core.tracing import instrumented
+
+# Shared by every request in this process
+item_cache: LRUCache[Any, Item | None] = LRUCache(
+    max_entries=settings.ITEM_CACHE_MAX_ENTRIES,
+    ttl=settings.ITEM_CACHE_TTL_SECONDS,
+)
+in_memory_item_repository = InMemoryItemRepository()
+item_query_cache = QueryCache(
+    max_bytes=settings.ITEM_QUERY_CACHE_MAX_BYTES,
+    ttl=settings.ITEM_QUERY_CACHE_TTL_SECONDS,
+)
+item_repository_timer = repository_timer("items")
+InstrumentedItemService = instrumented(ItemService, layer="service")
+# Shared by every worker process
+item_shared_cache = (
+    create_shared_cache(settings.ITEM_SHARED_CACHE_URL)
+    if settings.ITEM_SHARED_CACHE_URL
+    else None
+)
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the factory used to open sessions outside a request.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: Session factory
+    """
+    return async_session_factory
+
+
+def get_engine() -> AsyncEngine:
+    """Get the engine requests are served from.
+
+    Returns:
+        AsyncEngine: Database engine
+    """
+    return engine
+
+
+def get_read_replicas() -> ReadReplicas | None:
+    """Get the replicas reads can be sent to.
+
+    Returns:
+        ReadReplicas | None: Replicas from DATABASE_READ_URLS, or None if
+        there are none
+    """
+    return read_replicas
+
+
+async def get_read_session(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    replicas: Annotated[ReadReplicas | None, Depends(get_read_replicas)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get the session a request's reads run on.
+
+    Reads go to the next replica, unless there are none, the request may
+    write, or the client wrote recently; those read from the primary
+    session. So do reads from the in-memory snapshot, which never use it,
+    and reads through the item caches: a cache filled from a lagging
+    replica after a write would serve the old row for its whole TTL, even
+    to the client that wrote it.
+
+    Args:
+        request: Request being handled
+        session: Session on the primary database
+        replicas: Read replicas, if any
+
+    Yields:
+        AsyncSession: Session to read with
+    """
+    if (
+        replicas is None
+        or settings.ITEM_REPOSITORY == "memory"
+        or _item_caches_enabled()
+        or reads_primary(request)
+    ):
+        yield session
+        return
+    async with replicas.session() as read_session:
+        yield read_session
 
 
 async def get_item_repository(
     session: Annotated[AsyncSession, Depends(get_session)],
+    read_session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> ItemRepository:
     """Get an item repository instance.
 
     Args:
         session: Database session
+        read_session: Session for reads, on a replica when one can serve them
+
+    Returns:
+        ItemRepository: Repository selected by ITEM_REPOSITORY; the SQL one
+        sits behind whichever item caches are enabled in the settings, and
+        every call is timed with METRICS_ENABLED and traced with tracing on
+    """
+    repository = _item_repository(session, read_session)
+    if settings.METRICS_ENABLED:
+        return InstrumentedItemRepository(repository, item_repository_timer)
+    if settings.TRACING_SAMPLE_RATE > 0:
+        return InstrumentedItemRepository(repository)
+    return repository
+
+
+def _item_repository(
+    session: AsyncSession, read_session: AsyncSession
+) -> ItemRepository:
+    """Build the item repository selected by the settings, without timing.
+
+    Args:
+        session: Database session
+        read_session: Session for reads
 
     Returns:
         ItemRepository: Repository instance
     """
-    return SQLAlchemyItemRepository(session)
+    if settings.ITEM_REPOSITORY == "memory":
+        # The session only connects if the request writes
+        return SnapshotItemRepository(
+            in_memory_item_repository, SQLAlchemyItemRepository(session)
+        )
+
+    repository = SQLAlchemyItemRepository(session, read_session)
+    if not _item_caches_enabled():
+        return repository
+    return CachedItemRepository(
+        repository,
+        item_cache if settings.ITEM_CACHE_ENABLED else None,
+        negative_ttl=settings.ITEM_CACHE_NEGATIVE_TTL_SECONDS,
+        query_cache=item_query_cache if settings.ITEM_QUERY_CACHE_ENABLED else None,
+        shared_cache=item_shared_cache,
+        shared_ttl=settings.ITEM_SHARED_CACHE_TTL_SECONDS,
+    )
+
+
+def _item_caches_enabled() -> bool:
+    """Check whether any item cache is enabled in the settings.
+
+    Returns:
+        bool: True if item reads go through CachedItemRepository
+    """
+    return (
+        settings.ITEM_CACHE_ENABLED
+        or settings.ITEM_QUERY_CACHE_ENABLED
+        or item_shared_cache is not None
+    )
+
+
+async def get_job_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> JobRepository:
+    """Get a job repository instance.
+
+    Args:
+        session: Database session
+
+    Returns:
+        JobRepository: Repository instance
+    """
+    return SQLAlchemyJobRepository(session)
 
 
 async def get_item_service(
     repository: Annotated[ItemRepository, Depends(get_item_repository)],
+    job_repository: Annotated[JobRepository, Depends(get_job_repository)],
 ) -> ItemService:
     """Get an item service instance.
 
     Args:
         repository: Item repository
+        job_repository: Job repository
+
+    Returns:
+        ItemService: Service instance, traced with tracing on
+    """
+    return _item_service(repository, job_repository)
+
+
+@asynccontextmanager
+async def item_service_scope(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[ItemService]:
+    """Build an item service that outlives the request, for background jobs.
+
+    Items and jobs get separate sessions so that a failed item statement
+    cannot prevent the job from being marked as failed. Everything runs on
+    the primary database.
+
+    Args:
+        session_factory: Factory to open the sessions with
+
+    Yields:
+        ItemService: Service instance
+    """
+    async with session_factory() as item_session, session_factory() as job_session:
+        yield _item_service(
+            await get_item_repository(item_session, item_session),
+            await get_job_repository(job_session),
+        )
+
+
+def _item_service(
+    repository: ItemRepository, job_repository: JobRepository
+) -> ItemService:
+    """Build an item service, traced with tracing on.
+
+    Args:
+        repository: Item repository
+        job_repository: Job repository
 
     Returns:
         ItemService: Service instance
     """
-    return ItemService(repository)
+    service = ItemService(repository, job_repository)
+    if settings.TRACING_SAMPLE_RATE > 0:
+        return InstrumentedItemService(service)
+    return service
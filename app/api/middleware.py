@@ -0,0 +1,271 @@
+import math
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.adapters.metrics.prometheus_metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    labelled,
+)
+from app.core.domain.span import SpanKind
+from app.core.request_timing import (
+    RequestTimings,
+    end_request_timings,
+    start_request_timings,
+)
+from app.core.tracing import tracer
+
+# Holds the time until which a client's reads go to the primary database
+READ_PRIMARY_COOKIE = "read_primary_until"
+# Methods that do not write, whose requests may read from a replica
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Route label of requests matching no route, so that arbitrary paths cannot
+# add label values
+UNMATCHED_ROUTE = "unmatched"
+
+
+class ServerTimingMiddleware:
+    """Report where each request spent its time in a Server-Timing header.
+
+    Written as plain ASGI middleware rather than with BaseHTTPMiddleware, so
+    it adds no task or body buffering to the request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: Application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request, collecting its timings."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings, token = start_request_timings()
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                total = time.perf_counter() - start
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing(timings, total))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request_timings(token)
+
+
+def server_timing(timings: RequestTimings, total: float) -> str:
+    """Format request timings as a Server-Timing header value.
+
+    The entries split the time until the response started: waiting for
+    connections, running SQL statements, encoding the body and, as
+    ``service``, everything else.
+
+    Args:
+        timings: Timings collected for a request
+        total: Seconds from the start of the request to its response
+
+    Returns:
+        str: Header value with durations in milliseconds
+    """
+    service = max(
+        total - timings.pool_wait - timings.db_time - timings.serialization, 0.0
+    )
+    plural = "" if timings.db_statements == 1 else "s"
+    return ", ".join(
+        [
+            f'pool;dur={timings.pool_wait * 1000:.2f};desc="Connection pool wait"',
+            f"db;dur={timings.db_time * 1000:.2f};"
+            f'desc="{timings.db_statements} SQL statement{plural}"',
+            f"serialization;dur={timings.serialization * 1000:.2f};"
+            'desc="Response encoding"',
+            f'service;dur={service * 1000:.2f};desc="Application code"',
+        ]
+    )
+
+
+class ReadYourWritesMiddleware:
+    """Keep a client's reads on the primary database for a while after it writes.
+
+    Every response to a request that may write (any method but GET, HEAD and
+    OPTIONS) sets a cookie holding the time the window ends; reads_primary
+    checks it.
+    """
+
+    def __init__(self, app: ASGIApp, window: float) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: Application to wrap
+            window: Seconds a client's reads stay on the primary after it
+                writes
+        """
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request, marking the client as a recent writer if it may write."""
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                until = time.time() + self.window
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Set-Cookie",
+                    f"{READ_PRIMARY_COOKIE}={until:.3f}; "
+                    f"Max-Age={math.ceil(self.window)}; Path=/; HttpOnly; "
+                    "SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+def reads_primary(connection: HTTPConnection) -> bool:
+    """Tell whether a request must read from the primary database.
+
+    That is the case for requests that may write, whose reads must see their
+    own changes, and for clients whose read-your-writes window is still open.
+
+    Args:
+        connection: Request being handled
+
+    Returns:
+        bool: True to read from the primary, False if a replica will do
+    """
+    if connection.scope.get("method") not in SAFE_METHODS:
+        return True
+    try:
+        until = float(connection.cookies.get(READ_PRIMARY_COOKIE, "0"))
+    except ValueError:
+        return False
+    return until > time.time()
+
+
+class MetricsMiddleware:
+    """Count requests and time them, labelled by method and route template.
+
+    Labelling by template (``/api/items/{item_id}``) rather than path keeps
+    the number of series bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: Application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request, recording its metrics."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = route_template(scope)
+        in_progress = labelled(HTTP_REQUESTS_IN_PROGRESS, method, route)
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            labelled(HTTP_REQUEST_DURATION, method, route).observe(
+                time.perf_counter() - start
+            )
+            labelled(HTTP_REQUESTS, method, route, str(status)).inc()
+            in_progress.dec()
+
+
+class TracingMiddleware:
+    """Run each request in the root span of its trace.
+
+    The span is named after the method and the route template the router
+    matched. Spans opened while handling the request, by the service,
+    the repository and the database, nest under it.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: Application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request inside a span."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        with tracer.span(method, SpanKind.SERVER, layer="route") as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+
+            span.attributes["http.request.method"] = method
+            span.attributes["url.path"] = scope["path"]
+
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.attributes["http.response.status_code"] = message["status"]
+                    if message["status"] >= 500:
+                        span.error = f"HTTP {message['status']}"
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                # Set by FastAPI once the router has matched the request
+                if (route := scope.get("route")) is not None:
+                    span.name = f"{method} {route.path}"
+                    span.attributes["http.route"] = route.path
+
+
+def route_template(scope: Scope) -> str:
+    """Find the path template of the route a request will be handled by.
+
+    The in-progress gauge needs the route before the router has run, so
+    this matches the routes the way the router does.
+
+    Args:
+        scope: ASGI scope of the request, with the application in ``app``
+
+    Returns:
+        str: Path template of the matching route, or UNMATCHED_ROUTE
+    """
+    partial = None
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return str(route.path)
+        if match == Match.PARTIAL and partial is None:
+            # Right path, wrong method; the router answers 405 from here
+            partial = str(route.path)
+    return partial or UNMATCHED_ROUTE
@@ -0,0 +1,41 @@
+import time
+from functools import cache
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.request_timing import current_request_timings
+from app.core.tracing import tracer
+
+
+class ModelResponse(JSONResponse):
+    """JSON response that serializes Pydantic content straight to bytes.
+
+    Routes that return this response directly skip FastAPI's response_model
+    handling, which would dump the content to dicts, validate it again and
+    encode it with the standard library. Content must already be valid;
+    it is serialized by pydantic-core without being validated.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the content to JSON bytes.
+
+        Args:
+            content: Pydantic model, or any value a TypeAdapter can dump
+
+        Returns:
+            bytes: JSON encoded content
+        """
+        start = time.perf_counter()
+        with tracer.span("serialize", layer="serialization"):
+            body = _adapter(type(content)).dump_json(content)
+        if (timings := current_request_timings()) is not None:
+            timings.serialization += time.perf_counter() - start
+        return body
+
+
+@cache
+def _adapter(content_type: type[Any]) -> TypeAdapter[Any]:
+    """Get the serializer for a content type, building it on first use."""
+    return TypeAdapter(content_type)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from app.api.routes.diagnostics import router as diagnostics_router
 from app.api.routes.items import router as items_router
 
 # Main API router
@@ -7,6 +8,7 @@ api_router = APIRouter()
 
 # Include all route modules
 api_router.include_router(items_router)
+api_router.include_router(diagnostics_router)
 
 # Add more routers here as the application grows
 # api_router.include_router(users_router)
@@ -0,0 +1,35 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.adapters.repositories.pool import pool_status
+from app.api.dependencies import get_engine
+from app.api.responses import ModelResponse
+from app.api.schemas import ErrorResponse, PoolStatusResponse
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+
+@router.get(
+    "/pool",
+    response_model=PoolStatusResponse,
+    summary="Get connection pool state",
+    description=(
+        "Get the connections this worker has checked out, idle and in "
+        "overflow, with counters for checkouts, timeouts and time spent "
+        "waiting for a connection."
+    ),
+    responses={404: {"model": ErrorResponse}},
+)
+async def get_pool_status(
+    engine: Annotated[AsyncEngine, Depends(get_engine)],
+) -> ModelResponse:
+    """Get the state of the database connection pool."""
+    state = pool_status(engine.pool)
+    if state is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Connection pool metrics are not collected for this database",
+        )
+    return ModelResponse(PoolStatusResponse.model_validate(state))
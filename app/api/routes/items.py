@@ -1,68 +1,389 @@
-from typing import Annotated
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.api.dependencies import get_item_service
+from app.api.conditional import (
+    entity_etag,
+    make_etag,
+    not_modified,
+    result_etag,
+    set_validators,
+)
+from app.api.dependencies import (
+    get_item_service,
+    get_session_factory,
+    item_service_scope,
+)
+from app.api.responses import ModelResponse
 from app.api.schemas import (
+    BulkItemError,
     ErrorResponse,
+    ItemBulkCreate,
+    ItemBulkCreateResponse,
+    ItemBulkDeleteResponse,
+    ItemBulkDiscount,
+    ItemBulkUpdate,
+    ItemBulkUpdateResponse,
     ItemCreate,
     ItemListResponse,
     ItemResponse,
+    ItemStatsResponse,
     ItemUpdate,
+    JobResponse,
+    sparse_item_list,
 )
+from app.core.config import settings
 from app.core.domain.item import Item
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.item_sort import ItemSort, ItemSortField
+from app.core.domain.item_stats import TooManyBucketsError
+from app.core.domain.pagination import InvalidCursorError
+from app.core.domain.result_version import ResultVersion
 from app.core.services.item_service import ItemService
 
 router = APIRouter(
     prefix="/items", tags=["items"], responses={404: {"model": ErrorResponse}}
 )
 
+# Serializes exported items, which are built from trusted rows unvalidated
+_item_response = TypeAdapter(ItemResponse)
+
+# Sort parameters the list route accepts, e.g. "price" or "-updated_at"
+SORT_PATTERN = "^-?(" + "|".join(ItemSortField) + ")$"
+
+# Fields the ETag of a list is computed from, loaded with any sparse fieldset
+VERSION_FIELDS = ("id", "version")
+
+
+def item_filter_params(
+    active: bool | None = Query(None, description="Filter by active status"),
+    name_prefix: str | None = Query(
+        None, min_length=1, description="Only items whose name starts with this"
+    ),
+    min_price: float | None = Query(None, ge=0, description="Minimum price"),
+    max_price: float | None = Query(None, ge=0, description="Maximum price"),
+    created_from: datetime | None = Query(  # noqa: B008
+        None, description="Only items created at or after this time"
+    ),
+    created_to: datetime | None = Query(  # noqa: B008
+        None, description="Only items created at or before this time"
+    ),
+    updated_from: datetime | None = Query(  # noqa: B008
+        None, description="Only items last updated at or after this time"
+    ),
+    updated_to: datetime | None = Query(  # noqa: B008
+        None, description="Only items last updated at or before this time"
+    ),
+) -> ItemFilter:
+    """Build an item filter from list query parameters.
+
+    Returns:
+        ItemFilter: Filter with timestamps converted to naive UTC
+    """
+    return ItemFilter(
+        is_active=active,
+        name_prefix=name_prefix,
+        min_price=min_price,
+        max_price=max_price,
+        created_from=_naive_utc(created_from),
+        created_to=_naive_utc(created_to),
+        updated_from=_naive_utc(updated_from),
+        updated_to=_naive_utc(updated_to),
+    )
+
+
+def item_fields_param(
+    fields: str | None = Query(
+        None,
+        description=(
+            "Comma-separated item fields to return, e.g. `id,name,price`; "
+            "all fields if omitted"
+        ),
+    ),
+) -> tuple[str, ...] | None:
+    """Parse a sparse fieldset parameter.
+
+    Returns:
+        tuple[str, ...] | None: Requested fields in response order, or None
+        for all fields
+
+    Raises:
+        HTTPException: If a field does not exist
+    """
+    if fields is None:
+        return None
+    requested = {field.strip() for field in fields.split(",")} - {""}
+    if unknown := requested - ItemResponse.model_fields.keys():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    if not requested:
+        return None
+    return tuple(field for field in ItemResponse.model_fields if field in requested)
+
+
+def _with_version_fields(fields: tuple[str, ...]) -> tuple[str, ...]:
+    """Add the fields a result version is computed from to a sparse fieldset."""
+    return fields + tuple(field for field in VERSION_FIELDS if field not in fields)
+
+
+def _items_version(items: list[Item], more: bool = False) -> ResultVersion:
+    """Compute the version of a loaded list of items.
+
+    It equals the version the repository computes without loading them.
+    """
+    return ResultVersion.of(((item.id, item.version) for item in items), more)
+
+
+def _records_version(
+    records: list[dict[str, Any]], fields: tuple[str, ...], more: bool = False
+) -> tuple[list[dict[str, Any]], ResultVersion]:
+    """Compute the version of records loaded with _with_version_fields.
+
+    Args:
+        records: Loaded records, holding the requested and version fields
+        fields: Fields the client requested
+        more: Whether more records follow, as when a page has a next page
+
+    Returns:
+        tuple[list[dict[str, Any]], ResultVersion]: Records holding only the
+        requested fields, and their version
+    """
+    version = ResultVersion.of(
+        ((record["id"], record["version"]) for record in records), more
+    )
+    if any(field not in fields for field in VERSION_FIELDS):
+        records = [{field: record[field] for field in fields} for record in records]
+    return records, version
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    """Convert an aware datetime to the naive UTC form items are stored in."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
 
 @router.get(
     "/",
     response_model=ItemListResponse,
     summary="Get all items",
-    description="Get a list of all items, with optional filtering by active status.",
+    description=(
+        "Get a page of items ordered by ID or by `sort`, with optional filtering "
+        "by active status, name prefix, price range and creation or update "
+        "time. Pass the returned `next_cursor` as `after` to get the next page; "
+        "the first page of a sorted list is its top `limit` items. Pass "
+        "`fields` to load and return only some fields of each item. "
+        "Supports conditional requests with `If-None-Match`."
+    ),
+    responses={400: {"model": ErrorResponse}, 304: {"description": "Not Modified"}},
 )
 async def get_items(
+    request: Request,
     service: Annotated[ItemService, Depends(get_item_service)],
-    active: bool | None = Query(None, description="Filter by active status"),
-) -> ItemListResponse:
-    """Get all items, with optional filtering."""
-    if active is not None:
-        if active:
-            items = await service.get_active_items()
+    filters: Annotated[ItemFilter, Depends(item_filter_params)],
+    fields: Annotated[tuple[str, ...] | None, Depends(item_fields_param)],
+    sort: str = Query(
+        "id",
+        pattern=SORT_PATTERN,
+        description=(
+            "Field to sort by, one of "
+            + ", ".join(f"`{field}`" for field in ItemSortField)
+            + "; prefix with `-` for descending order"
+        ),
+    ),
+    after: str | None = Query(None, description="Cursor from the previous page"),
+    limit: int = Query(
+        settings.ITEMS_PAGE_SIZE,
+        ge=1,
+        le=settings.ITEMS_MAX_PAGE_SIZE,
+        description="Maximum number of items to return",
+    ),
+) -> Response:
+    """Get a page of items, with optional filtering."""
+    try:
+        item_sort = ItemSort.parse(sort)
+        params = ("items", limit, after, filters, item_sort, fields)
+        # No Last-Modified: deleting a row or a row leaving the result does
+        # not move the latest update time forward
+        if request.headers.get("if-none-match") is not None:
+            # Check the client's copy before loading the page itself
+            current = await service.get_items_page_version(
+                limit, after=after, filters=filters, sort=item_sort
+            )
+            cached = not_modified(request, result_etag(current, *params), None)
+            if cached is not None:
+                return cached
+        if fields is None:
+            page = await service.get_items_page(
+                limit, after=after, filters=filters, sort=item_sort
+            )
+            version = _items_version(page.items, page.next_cursor is not None)
+            content: Any = ItemListResponse.from_items(page.items, page.next_cursor)
         else:
-            # Get all items and filter for inactive ones
-            all_items = await service.get_all_items()
-            items = [item for item in all_items if not item.is_active]
-    else:
-        items = await service.get_all_items()
+            sparse = await service.get_items_page_fields(
+                _with_version_fields(fields),
+                limit,
+                after=after,
+                filters=filters,
+                sort=item_sort,
+            )
+            records, version = _records_version(
+                sparse.items, fields, sparse.next_cursor is not None
+            )
+            content = sparse_item_list(records, sparse.next_cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
 
-    # Convert domain items to response format
-    response_items = [ItemResponse.model_validate(item) for item in items]
-    return ItemListResponse(items=response_items, count=len(items))
+    response = ModelResponse(content)
+    set_validators(response, result_etag(version, *params), None)
+    return response
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all items",
+    description=(
+        "Stream every item as newline-delimited JSON, with the same optional "
+        "filters as the item list."
+    ),
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_items(
+    service: Annotated[ItemService, Depends(get_item_service)],
+    filters: Annotated[ItemFilter, Depends(item_filter_params)],
+) -> StreamingResponse:
+    """Export all items as NDJSON."""
+    chunk_size = settings.ITEMS_EXPORT_CHUNK_SIZE
+
+    async def ndjson_lines() -> AsyncIterator[bytes]:
+        # Send one body chunk per database chunk rather than one per item
+        buffer: list[bytes] = []
+        async for item in service.export_items(chunk_size, filters=filters):
+            response_item = ItemResponse.model_construct(**item._asdict())
+            buffer.append(_item_response.dump_json(response_item))
+            if len(buffer) >= chunk_size:
+                yield b"\n".join(buffer) + b"\n"
+                buffer.clear()
+        if buffer:
+            yield b"\n".join(buffer) + b"\n"
+
+    # The session dependency stays open until the stream has been sent
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/stats",
+    response_model=ItemStatsResponse,
+    summary="Get item statistics",
+    description=(
+        "Get the count, active and inactive split, price range, mean price and "
+        "a fixed-width price histogram of the items matching the same filters "
+        "as the item list. Computed in the database; empty buckets are left "
+        "out of the histogram, and a width giving more than "
+        f"{settings.ITEMS_STATS_MAX_BUCKETS} buckets between the lowest and "
+        "highest price is rejected."
+    ),
+    responses={400: {"model": ErrorResponse}},
+)
+async def get_item_stats(
+    service: Annotated[ItemService, Depends(get_item_service)],
+    filters: Annotated[ItemFilter, Depends(item_filter_params)],
+    bucket_width: float = Query(
+        settings.ITEMS_STATS_BUCKET_WIDTH,
+        gt=0,
+        description="Width of the price histogram buckets",
+    ),
+) -> ModelResponse:
+    """Get aggregate statistics over items."""
+    try:
+        stats = await service.get_item_stats(
+            bucket_width, filters, settings.ITEMS_STATS_MAX_BUCKETS
+        )
+    except TooManyBucketsError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    return ModelResponse(ItemStatsResponse.model_validate(stats))
 
 
 @router.get(
     "/{item_id}",
     response_model=ItemResponse,
     summary="Get item by ID",
-    description="Get a specific item by its ID.",
-    responses={404: {"model": ErrorResponse}},
+    description=(
+        "Get a specific item by its ID, optionally only the given `fields`. "
+        "Supports conditional requests with `If-None-Match` and "
+        "`If-Modified-Since`."
+    ),
+    responses={404: {"model": ErrorResponse}, 304: {"description": "Not Modified"}},
 )
 async def get_item(
+    request: Request,
     service: Annotated[ItemService, Depends(get_item_service)],
+    fields: Annotated[tuple[str, ...] | None, Depends(item_fields_param)],
     item_id: int = Path(..., description="The ID of the item to get"),
-) -> ItemResponse:
+) -> Response:
     """Get a specific item by ID."""
+    if fields is not None:
+        return await _get_item_fields(request, service, item_id, fields)
+
     item = await service.get_item(item_id)
     if item is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item with ID {item_id} not found",
         )
-    return ItemResponse.model_validate(item)
+
+    etag = entity_etag(item)
+    if (cached := not_modified(request, etag, item.updated_at)) is not None:
+        return cached
+    response = ModelResponse(ItemResponse.model_validate(item))
+    set_validators(response, etag, item.updated_at)
+    return response
+
+
+async def _get_item_fields(
+    request: Request, service: ItemService, item_id: int, fields: tuple[str, ...]
+) -> Response:
+    """Get some fields of an item, for get_item.
+
+    The entity tag covers only the returned fields, and Last-Modified is
+    sent only if ``updated_at`` is one of them.
+    """
+    record = await service.get_item_fields(item_id, fields)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item with ID {item_id} not found",
+        )
+
+    etag = make_etag("Item", *record.items())
+    last_modified = record.get("updated_at")
+    if (cached := not_modified(request, etag, last_modified)) is not None:
+        return cached
+    response = ModelResponse(record)
+    set_validators(response, etag, last_modified)
+    return response
 
 
 @router.post(
@@ -75,7 +396,7 @@ async def get_item(
 async def create_item(
     item_data: ItemCreate,
     service: Annotated[ItemService, Depends(get_item_service)],
-) -> ItemResponse:
+) -> ModelResponse:
     """Create a new item."""
     # Convert API schema to domain model
     item = Item(
@@ -86,7 +407,94 @@ async def create_item(
     )
 
     created_item = await service.create_item(item)
-    return ItemResponse.model_validate(created_item)
+    return ModelResponse(
+        ItemResponse.model_validate(created_item),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=ItemBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many items",
+    description=(
+        "Create many items in one request. Invalid rows are reported in "
+        "`errors` by their index and do not prevent the other rows from "
+        "being created."
+    ),
+)
+async def create_items(
+    item_data: ItemBulkCreate,
+    service: Annotated[ItemService, Depends(get_item_service)],
+) -> ModelResponse:
+    """Create many items."""
+    items: list[Item] = []
+    errors: list[BulkItemError] = []
+    for index, row in enumerate(item_data.items):
+        try:
+            valid = ItemCreate.model_validate(row)
+        except ValidationError as exc:
+            errors.append(BulkItemError(index=index, detail=_format_errors(exc)))
+            continue
+        items.append(Item(**valid.model_dump()))
+
+    created_items = await service.create_items(
+        items, chunk_size=settings.ITEMS_BULK_CHUNK_SIZE
+    )
+    return ModelResponse(
+        ItemBulkCreateResponse.model_construct(
+            items=[ItemResponse.model_validate(item) for item in created_items],
+            count=len(created_items),
+            errors=errors,
+        ),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.patch(
+    "/bulk",
+    response_model=ItemBulkUpdateResponse,
+    summary="Update many items",
+    description=(
+        "Apply partial updates to many items in one transaction. IDs that do "
+        "not match an item are listed in `not_found`."
+    ),
+)
+async def update_items(
+    item_data: ItemBulkUpdate,
+    service: Annotated[ItemService, Depends(get_item_service)],
+) -> ItemBulkUpdateResponse:
+    """Update many items."""
+    # Later entries for the same ID override earlier ones field by field
+    changes: dict[int, dict[str, Any]] = {}
+    for entry in item_data.items:
+        changes.setdefault(entry.id, {}).update(
+            entry.changes.model_dump(exclude_unset=True, exclude_none=True)
+        )
+
+    not_found = await service.update_items(
+        changes, chunk_size=settings.ITEMS_BULK_CHUNK_SIZE
+    )
+    # Entries left with no changes match an item but do not update it
+    missing = set(not_found)
+    updated = sum(1 for id, values in changes.items() if values and id not in missing)
+    return ItemBulkUpdateResponse(updated=updated, not_found=not_found)
+
+
+def _format_errors(exc: ValidationError) -> str:
+    """Flatten a validation error into a single readable line.
+
+    Args:
+        exc: Validation error raised for one row
+
+    Returns:
+        str: Semicolon-separated ``field: message`` pairs
+    """
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
 
 
 @router.patch(
@@ -100,23 +508,49 @@ async def update_item(
     item_data: ItemUpdate,
     service: Annotated[ItemService, Depends(get_item_service)],
     item_id: int = Path(..., description="The ID of the item to update"),
-) -> ItemResponse:
+) -> ModelResponse:
     """Update an existing item."""
-    # First, get the existing item
-    existing_item = await service.get_item(item_id)
-    if existing_item is None:
+    # Send only the fields that were provided
+    changes = item_data.model_dump(exclude_unset=True, exclude_none=True)
+
+    updated_item = await service.patch_item(item_id, changes)
+    if updated_item is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item with ID {item_id} not found",
         )
+    return ModelResponse(ItemResponse.model_validate(updated_item))
 
-    # Update only the fields that are provided
-    update_data = item_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(existing_item, key, value)
 
-    updated_item = await service.update_item(item_id, existing_item)
-    return ItemResponse.model_validate(updated_item)
+@router.delete(
+    "/",
+    response_model=ItemBulkDeleteResponse,
+    summary="Delete many items",
+    description=(
+        "Delete items by ID, by active status, or both. At least one of "
+        "`ids` or `active` is required."
+    ),
+    responses={400: {"model": ErrorResponse}},
+)
+async def delete_items(
+    service: Annotated[ItemService, Depends(get_item_service)],
+    ids: list[int] | None = Query(  # noqa: B008
+        None, description="IDs of the items to delete"
+    ),
+    active: bool | None = Query(None, description="Filter by active status"),
+) -> ItemBulkDeleteResponse:
+    """Delete many items."""
+    try:
+        deleted = await service.delete_items(
+            settings.ITEMS_BULK_CHUNK_SIZE,
+            ids=ids,
+            filters=ItemFilter(is_active=active),
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    return ItemBulkDeleteResponse(deleted=deleted)
 
 
 @router.delete(
@@ -144,16 +578,47 @@ async def delete_item(
     "/search/",
     response_model=ItemListResponse,
     summary="Search items by name",
-    description="Search for items by name (partial match).",
+    description=(
+        "Search for items by name (partial match), best matches first, "
+        "optionally returning only the given `fields`. Supports conditional "
+        "requests with `If-None-Match`."
+    ),
+    responses={304: {"description": "Not Modified"}},
 )
 async def search_items(
+    request: Request,
     service: Annotated[ItemService, Depends(get_item_service)],
+    fields: Annotated[tuple[str, ...] | None, Depends(item_fields_param)],
     name: str = Query(..., description="Name to search for"),
-) -> ItemListResponse:
+    limit: int = Query(
+        settings.ITEMS_PAGE_SIZE,
+        ge=1,
+        le=settings.ITEMS_MAX_PAGE_SIZE,
+        description="Maximum number of items to return",
+    ),
+) -> Response:
     """Search for items by name."""
-    items = await service.search_items_by_name(name)
-    response_items = [ItemResponse.model_validate(item) for item in items]
-    return ItemListResponse(items=response_items, count=len(items))
+    params = ("search", name, limit, fields)
+    # ETag only, as for the item list
+    if request.headers.get("if-none-match") is not None:
+        current = await service.search_items_by_name_version(name, limit)
+        cached = not_modified(request, result_etag(current, *params), None)
+        if cached is not None:
+            return cached
+
+    if fields is None:
+        items = await service.search_items_by_name(name, limit)
+        version = _items_version(items)
+        content: Any = ItemListResponse.from_items(items)
+    else:
+        loaded = await service.search_items_by_name_fields(
+            _with_version_fields(fields), name, limit
+        )
+        records, version = _records_version(loaded, fields)
+        content = sparse_item_list(records)
+    response = ModelResponse(content)
+    set_validators(response, result_etag(version, *params), None)
+    return response
 
 
 @router.post(
@@ -169,7 +634,7 @@ async def apply_discount(
     discount_percent: float = Query(
         ..., gt=0, le=100, description="Discount percentage (0-100)"
     ),
-) -> ItemResponse:
+) -> ModelResponse:
     """Apply a discount to an item."""
     updated_item = await service.apply_discount_to_item(item_id, discount_percent)
     if updated_item is None:
@@ -177,4 +642,83 @@ async def apply_discount(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item with ID {item_id} not found",
         )
-    return ItemResponse.model_validate(updated_item)
+    return ModelResponse(ItemResponse.model_validate(updated_item))
+
+
+@router.post(
+    "/discount",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Apply discount to matching items",
+    description=(
+        "Start a background job that applies a percentage discount to every "
+        "item matching the filter. Poll `GET /items/discount/{job_id}` for "
+        "progress."
+    ),
+)
+async def apply_bulk_discount(
+    discount: ItemBulkDiscount,
+    background_tasks: BackgroundTasks,
+    service: Annotated[ItemService, Depends(get_item_service)],
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_session_factory)
+    ],
+) -> JobResponse:
+    """Start a bulk discount job."""
+    item_filter = ItemFilter(
+        is_active=discount.active,
+        name_contains=discount.name_contains,
+        min_price=discount.min_price,
+        max_price=discount.max_price,
+    )
+    job = await service.start_bulk_discount(item_filter, discount.discount_percent)
+
+    background_tasks.add_task(
+        _run_bulk_discount,
+        session_factory,
+        job.id,
+        item_filter,
+        discount.discount_percent,
+    )
+    return JobResponse.model_validate(job)
+
+
+@router.get(
+    "/discount/{job_id}",
+    response_model=JobResponse,
+    summary="Get bulk discount job status",
+    description="Get the status and progress of a bulk discount job.",
+    responses={404: {"model": ErrorResponse}},
+)
+async def get_bulk_discount(
+    service: Annotated[ItemService, Depends(get_item_service)],
+    job_id: int = Path(..., description="The ID of the job"),
+) -> JobResponse:
+    """Get the status of a bulk discount job."""
+    job = await service.get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with ID {job_id} not found",
+        )
+    return JobResponse.model_validate(job)
+
+
+async def _run_bulk_discount(
+    session_factory: async_sessionmaker[AsyncSession],
+    job_id: int,
+    item_filter: ItemFilter,
+    discount_percent: float,
+) -> None:
+    """Run a bulk discount job with its own sessions after the response.
+
+    Args:
+        session_factory: Factory to open the job's sessions with
+        job_id: ID of the job to run
+        item_filter: Criteria selecting the items to discount
+        discount_percent: Discount percentage (0-100)
+    """
+    async with item_service_scope(session_factory) as service:
+        await service.run_bulk_discount(
+            job_id, item_filter, discount_percent, settings.ITEMS_BULK_CHUNK_SIZE
+        )
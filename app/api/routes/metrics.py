@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Response
+
+from app.adapters.metrics.prometheus_metrics import render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    """Get the server's metrics in the Prometheus text format.
+
+    Defined without async so that reading the metrics files of every worker
+    runs in the thread pool.
+    """
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -1,6 +1,11 @@
+from collections.abc import Sequence
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+from app.core.config import settings
+from app.core.domain.job import JobStatus
 
 
 class ItemBase(BaseModel):
@@ -45,6 +50,189 @@ class ItemListResponse(BaseModel):
 
     items: list[ItemResponse]
     count: int
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_items(
+        cls, items: Sequence[Any], next_cursor: str | None = None
+    ) -> "ItemListResponse":
+        """Build a list response, validating each item exactly once.
+
+        The items are validated in a single call and the list itself is
+        not validated again.
+
+        Args:
+            items: Domain items, or any objects with the item attributes
+            next_cursor: Cursor for the next page, if any
+
+        Returns:
+            ItemListResponse: Response for the items
+        """
+        response_items = _item_responses.validate_python(items, from_attributes=True)
+        return cls.model_construct(
+            items=response_items, count=len(response_items), next_cursor=next_cursor
+        )
+
+
+_item_responses = TypeAdapter(list[ItemResponse])
+
+
+def sparse_item_list(
+    records: list[dict[str, Any]], next_cursor: str | None = None
+) -> dict[str, Any]:
+    """Build a list response body holding only some fields of each item.
+
+    Args:
+        records: Requested fields of each item, as loaded from the repository
+        next_cursor: Cursor for the next page, if any
+
+    Returns:
+        dict[str, Any]: Body in the shape of ItemListResponse
+    """
+    return {"items": records, "count": len(records), "next_cursor": next_cursor}
+
+
+class PriceBucketResponse(BaseModel):
+    """Schema for one price histogram bucket."""
+
+    lower: float
+    upper: float
+    count: int
+
+    class Config:
+        """Pydantic configuration."""
+
+        from_attributes = True
+
+
+class ItemStatsResponse(BaseModel):
+    """Schema for aggregate item statistics."""
+
+    count: int
+    active: int
+    inactive: int
+    min_price: float | None = None
+    max_price: float | None = None
+    avg_price: float | None = None
+    buckets: list[PriceBucketResponse]
+
+    class Config:
+        """Pydantic configuration."""
+
+        from_attributes = True
+
+
+class PoolStatsResponse(BaseModel):
+    """Schema for connection pool usage counters."""
+
+    connects: int
+    checkouts: int
+    checkins: int
+    invalidations: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+    class Config:
+        """Pydantic configuration."""
+
+        from_attributes = True
+
+
+class PoolStatusResponse(BaseModel):
+    """Schema for the state of the connection pool."""
+
+    size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    stats: PoolStatsResponse
+
+    class Config:
+        """Pydantic configuration."""
+
+        from_attributes = True
+
+
+class ItemBulkCreate(BaseModel):
+    """Schema for creating many items at once.
+
+    Rows are validated one by one so that invalid rows can be reported
+    without rejecting the whole request.
+    """
+
+    items: list[dict[str, Any]] = Field(max_length=settings.ITEMS_MAX_BULK_SIZE)
+
+
+class BulkItemError(BaseModel):
+    """Schema for a row that was rejected by a bulk operation."""
+
+    index: int
+    detail: str
+
+
+class ItemBulkCreateResponse(BaseModel):
+    """Schema for the result of a bulk create."""
+
+    items: list[ItemResponse]
+    count: int
+    errors: list[BulkItemError]
+
+
+class ItemBulkUpdateEntry(BaseModel):
+    """Schema for the changes to apply to one item in a bulk update."""
+
+    id: int
+    changes: ItemUpdate
+
+
+class ItemBulkUpdate(BaseModel):
+    """Schema for updating many items at once."""
+
+    items: list[ItemBulkUpdateEntry] = Field(max_length=settings.ITEMS_MAX_BULK_SIZE)
+
+
+class ItemBulkUpdateResponse(BaseModel):
+    """Schema for the result of a bulk update."""
+
+    updated: int
+    not_found: list[int]
+
+
+class ItemBulkDeleteResponse(BaseModel):
+    """Schema for the result of a bulk delete."""
+
+    deleted: int
+
+
+class ItemBulkDiscount(BaseModel):
+    """Schema for discounting every item that matches a filter."""
+
+    discount_percent: float = Field(gt=0, le=100)
+    active: bool | None = None
+    name_contains: str | None = None
+    min_price: float | None = Field(default=None, ge=0)
+    max_price: float | None = Field(default=None, ge=0)
+
+
+class JobResponse(BaseModel):
+    """Schema for background job status."""
+
+    id: int
+    name: str
+    status: JobStatus
+    total: int
+    processed: int
+    progress: float
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        """Pydantic configuration."""
+
+        from_attributes = True
 
 
 class ErrorResponse(BaseModel):
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any, Self
 
 from pydantic import BaseModel, Field
 
@@ -14,3 +15,25 @@ class BaseDomainModel(BaseModel):
         """Pydantic configuration."""
 
         from_attributes = True  # Allow ORM model -> Pydantic model conversion
+
+    @classmethod
+    def from_trusted(cls, values: dict[str, Any]) -> Self:
+        """Build a model from data that is already known to be valid.
+
+        Skips validation and the default factories, so it is meant for rows
+        read back from the database, which already enforces the constraints.
+        It does what ``model_construct`` does when every field is given,
+        without its per-field default and alias handling.
+
+        Args:
+            values: Value for every field of the model, and nothing else
+
+        Returns:
+            Self: Model holding ``values`` as its fields
+        """
+        model = cls.__new__(cls)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__pydantic_fields_set__", set(values))
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", None)
+        return model
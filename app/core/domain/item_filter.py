@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ItemFilter:
+    """Criteria selecting a set of items.
+
+    Every criterion left as None is ignored; the rest are combined with AND.
+    Ranges include both bounds, and timestamps are naive UTC like the stored
+    ones.
+
+    Attributes:
+        is_active: Only items with this active status
+        name_prefix: Only items whose name starts with this text (case-sensitive)
+        name_contains: Only items whose name contains this text (case-insensitive)
+        min_price: Only items priced at or above this value
+        max_price: Only items priced at or below this value
+        created_from: Only items created at or after this time
+        created_to: Only items created at or before this time
+        updated_from: Only items last updated at or after this time
+        updated_to: Only items last updated at or before this time
+    """
+
+    is_active: bool | None = None
+    name_prefix: str | None = None
+    name_contains: str | None = None
+    min_price: float | None = None
+    max_price: float | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    updated_from: datetime | None = None
+    updated_to: datetime | None = None
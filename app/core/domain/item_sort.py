@@ -0,0 +1,137 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+from app.core.domain.item import Item
+from app.core.domain.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+class ItemSortField(StrEnum):
+    """Columns an item list can be sorted by."""
+
+    ID = "id"
+    NAME = "name"
+    PRICE = "price"
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+
+
+@dataclass(frozen=True)
+class ItemSort:
+    """Order of an item list.
+
+    Ties are broken by ID in the same direction, so every order is total and
+    can be paginated with a keyset cursor holding the sort value and the ID.
+
+    Attributes:
+        field: Column to sort by
+        descending: Whether the largest values come first
+    """
+
+    field: ItemSortField = ItemSortField.ID
+    descending: bool = False
+
+    @classmethod
+    def parse(cls, value: str) -> "ItemSort":
+        """Parse a sort parameter such as ``price`` or ``-updated_at``.
+
+        Args:
+            value: Field name, prefixed with ``-`` for descending order
+
+        Returns:
+            ItemSort: Parsed sort order
+
+        Raises:
+            ValueError: If the field cannot be sorted by
+        """
+        descending = value.startswith("-")
+        return cls(ItemSortField(value.removeprefix("-")), descending)
+
+    def __str__(self) -> str:
+        """Format the sort order the way parse accepts it."""
+        return f"-{self.field}" if self.descending else str(self.field)
+
+    def key(self, item: Item | Mapping[str, Any]) -> tuple[Any, ...]:
+        """Get the keyset position of an item in this order.
+
+        Args:
+            item: Item to locate, or a record holding at least its ID and
+                sort field
+
+        Returns:
+            tuple[Any, ...]: Sort value followed by the ID, or just the ID
+        """
+        names = (self.field, ItemSortField.ID)
+        if self.field is ItemSortField.ID:
+            names = (ItemSortField.ID,)
+        if isinstance(item, Mapping):
+            return tuple(item[name] for name in names)
+        return tuple(getattr(item, name) for name in names)
+
+    def encode_cursor(self, item: Item | Mapping[str, Any]) -> str:
+        """Build the cursor for the page that follows an item.
+
+        Cursors for the default order hold only the ID, as they always have;
+        other cursors also record the order they belong to.
+
+        Args:
+            item: Last item on the current page, or a record holding at
+                least its ID and sort field
+
+        Returns:
+            str: Opaque cursor string
+        """
+        key = [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in self.key(item)
+        ]
+        if self == ItemSort():
+            return encode_cursor(*key)
+        return encode_cursor(str(self), *key)
+
+    def decode_cursor(self, cursor: str) -> tuple[Any, ...]:
+        """Decode a cursor produced by encode_cursor for this order.
+
+        Args:
+            cursor: Opaque cursor string
+
+        Returns:
+            tuple[Any, ...]: Keyset position of the last item on the previous
+            page, in the shape key returns
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to
+                another order
+        """
+        key = decode_cursor(cursor)
+        if self != ItemSort():
+            tag, *key = key
+            if tag != str(self):
+                raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+
+        width = 1 if self.field is ItemSortField.ID else 2
+        if len(key) != width or not _is_int(key[-1]):
+            raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+        try:
+            return (*(self._parse_value(value) for value in key[:-1]), key[-1])
+        except (TypeError, ValueError) as exc:
+            raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+
+    def _parse_value(self, value: Any) -> Any:
+        """Convert a sort value decoded from JSON back to its field type."""
+        if self.field is ItemSortField.PRICE:
+            if isinstance(value, bool) or not isinstance(value, int | float):
+                raise TypeError(value)
+            return float(value)
+        if not isinstance(value, str):
+            raise TypeError(value)
+        if self.field is ItemSortField.NAME:
+            return value
+        return datetime.fromisoformat(value)
+
+
+def _is_int(value: Any) -> bool:
+    """Check for a JSON integer, which bool would otherwise pass for."""
+    return isinstance(value, int) and not isinstance(value, bool)
@@ -0,0 +1,138 @@
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+
+class TooManyBucketsError(ValueError):
+    """Raised when a price histogram would span more buckets than allowed."""
+
+
+def bucket_index(price: float, bucket_width: float) -> int:
+    """Get the index of the histogram bucket a price falls in.
+
+    Args:
+        price: Item price
+        bucket_width: Width of the price buckets
+
+    Returns:
+        int: Index ``n`` of the bucket from ``n * bucket_width`` up
+
+    Raises:
+        TooManyBucketsError: If the width is so small that the index is
+            not a finite number
+    """
+    quotient = price / bucket_width
+    if not math.isfinite(quotient):
+        raise TooManyBucketsError(
+            f"Bucket width {bucket_width:g} is too small for the prices"
+        )
+    return math.floor(quotient)
+
+
+@dataclass(frozen=True)
+class PriceBucket:
+    """Number of items in one fixed-width price range.
+
+    Attributes:
+        lower: Lowest price in the range (inclusive)
+        upper: Upper end of the range (exclusive)
+        count: Number of items priced in the range
+    """
+
+    lower: float
+    upper: float
+    count: int
+
+
+@dataclass(frozen=True)
+class ItemStats:
+    """Aggregate statistics over a set of items.
+
+    Attributes:
+        count: Number of items
+        active: Number of active items
+        inactive: Number of inactive items
+        min_price: Lowest price, None if there are no items
+        max_price: Highest price, None if there are no items
+        avg_price: Mean price, None if there are no items
+        buckets: Price histogram in ascending order; empty buckets are left out
+    """
+
+    count: int = 0
+    active: int = 0
+    inactive: int = 0
+    min_price: float | None = None
+    max_price: float | None = None
+    avg_price: float | None = None
+    buckets: tuple[PriceBucket, ...] = field(default_factory=tuple)
+
+    @classmethod
+    def from_buckets(
+        cls,
+        bucket_width: float,
+        buckets: Iterable[tuple[int, int, int, float, float, float]],
+        max_buckets: int | None = None,
+    ) -> "ItemStats":
+        """Combine per-bucket aggregates into statistics for the whole set.
+
+        Args:
+            bucket_width: Width of the price buckets
+            buckets: One ``(index, count, active, min_price, max_price,
+                price_total)`` tuple per non-empty bucket, in ascending order
+            max_buckets: Most buckets the histogram may span from the lowest
+                price to the highest, empty ones included; no limit if None
+
+        Returns:
+            ItemStats: Statistics over all the buckets
+
+        Raises:
+            TooManyBucketsError: If the histogram spans more than
+                ``max_buckets`` buckets, or a bucket's index does not match
+                its prices, as when it overflowed the database's integers
+        """
+        count = active = 0
+        total = 0.0
+        min_price: float | None = None
+        max_price: float | None = None
+        histogram = []
+        for index, bucket_count, bucket_active, low, high, bucket_total in buckets:
+            count += bucket_count
+            active += bucket_active
+            total += bucket_total
+            min_price = low if min_price is None else min(min_price, low)
+            max_price = high if max_price is None else max(max_price, high)
+            if bucket_index(low, bucket_width) != index:
+                # The database could not hold the index as an integer
+                raise TooManyBucketsError(
+                    f"Bucket width {bucket_width:g} is too small for the prices"
+                )
+            histogram.append(
+                PriceBucket(
+                    lower=index * bucket_width,
+                    upper=(index + 1) * bucket_width,
+                    count=bucket_count,
+                )
+            )
+
+        if (
+            max_buckets is not None
+            and count
+            and (
+                len(histogram) > max_buckets
+                or (max_price - min_price) / bucket_width > max_buckets
+            )
+        ):
+            raise TooManyBucketsError(
+                f"Bucket width {bucket_width:g} gives more than {max_buckets} "
+                "price buckets"
+            )
+
+        return cls(
+            count=count,
+            active=active,
+            inactive=count - active,
+            min_price=min_price,
+            max_price=max_price,
+            avg_price=total / count if count else None,
+            buckets=tuple(histogram),
+        )
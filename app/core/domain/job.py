@@ -0,0 +1,37 @@
+from enum import StrEnum
+
+from app.core.domain.base import BaseDomainModel
+
+
+class JobStatus(StrEnum):
+    """Lifecycle states of a background job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class Job(BaseDomainModel):
+    """Background job domain model.
+
+    Progress is tracked as the number of processed rows out of the number of
+    rows that matched when the job started.
+    """
+
+    name: str
+    status: JobStatus = JobStatus.PENDING
+    total: int = 0
+    processed: int = 0
+    error: str | None = None
+
+    @property
+    def progress(self) -> float:
+        """Get the fraction of the job that has been processed.
+
+        Returns:
+            float: Progress between 0 and 1
+        """
+        if self.status == JobStatus.COMPLETED or self.total == 0:
+            return 1.0 if self.status == JobStatus.COMPLETED else 0.0
+        return min(self.processed / self.total, 1.0)
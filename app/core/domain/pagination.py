@@ -0,0 +1,60 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """A single page of a keyset-paginated result.
+
+    Attributes:
+        items: Entities on this page, in sort order
+        next_cursor: Opaque cursor for the following page, None on the last page
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(*key: Any) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor.
+
+    Args:
+        *key: Sort key values of the last row on a page, ending with its ID
+
+    Returns:
+        str: Opaque cursor string
+    """
+    payload = json.dumps(list(key), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        list[Any]: Keyset values, in the order they were encoded
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+
+    if not isinstance(key, list) or not key:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return key
@@ -0,0 +1,44 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Self
+
+
+@dataclass(frozen=True)
+class ResultVersion:
+    """Summary of a query result that changes whenever the result changes.
+
+    It is computed from the ID and version of each row only, either with a
+    query that reads nothing else or from a result already loaded, so
+    callers can tell whether a result they hold is still current.
+
+    Attributes:
+        count: Number of rows in the result
+        checksum: Sum of the row IDs, which changes when rows are swapped
+        revision: Sum of the row versions, which grows with every write to
+            one of the rows
+        more: Whether more rows follow the result, as when a page has a
+            next page
+    """
+
+    count: int
+    checksum: int
+    revision: int
+    more: bool = False
+
+    @classmethod
+    def of(cls, rows: Iterable[tuple[Any, int]], more: bool = False) -> Self:
+        """Summarize a result from the ID and version of each of its rows.
+
+        Args:
+            rows: ID and version of each row
+            more: Whether more rows follow the result
+
+        Returns:
+            Self: Version of the result
+        """
+        count = checksum = revision = 0
+        for id, version in rows:
+            count += 1
+            checksum += id
+            revision += version
+        return cls(count=count, checksum=checksum, revision=revision, more=more)
@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+
+class SpanKind(IntEnum):
+    """Role of a span in its trace, numbered as in OTLP."""
+
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace.
+
+    Attributes:
+        name: Operation name, such as ``ItemService.get_item``
+        trace_id: 32 hex digits shared by every span of the trace
+        span_id: 16 hex digits identifying this span
+        parent_id: span_id of the enclosing span, None for the root
+        kind: Role of the span
+        start_ns: Start time in nanoseconds since the epoch
+        end_ns: End time in nanoseconds since the epoch, 0 while open
+        attributes: Details of the operation, such as the layer it ran in
+        error: Description of the exception that ended the span, if any
+        trace_spans: Finished spans of the trace, shared by all of them
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    kind: SpanKind = SpanKind.INTERNAL
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    trace_spans: list["Span"] = field(default_factory=list, repr=False, compare=False)
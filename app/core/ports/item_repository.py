@@ -1,24 +1,32 @@
 import abc
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
 
-from app.core.domain.item import Item
+from app.core.domain.item import Item, ItemRecord
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.item_sort import ItemSort
+from app.core.domain.item_stats import ItemStats
+from app.core.domain.pagination import Page
+from app.core.domain.result_version import ResultVersion
 from app.core.ports.repositories import Repository
 
 
-class ItemRepository(Repository[Item]):
+class ItemRepository(Repository[Item, ItemFilter]):
     """Item repository interface.
 
     This is a specific port for the Item entity in the hexagonal architecture.
     """
 
     @abc.abstractmethod
-    async def find_by_name(self, name: str) -> list[Item]:
-        """Find items by name (partial match).
+    async def find_by_name(self, name: str, limit: int | None = None) -> list[Item]:
+        """Find items by name (partial match), best matches first.
 
         Args:
             name: Item name to search for
+            limit: Maximum number of items to return, if given
 
         Returns:
-            list[Item]: List of matching items
+            list[Item]: List of matching items, ordered by relevance
         """
         pass
 
@@ -30,3 +38,303 @@ class ItemRepository(Repository[Item]):
             list[Item]: List of active items
         """
         pass
+
+    @abc.abstractmethod
+    async def get_page(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> Page[Item]:
+        """Get one page of items using keyset pagination.
+
+        Args:
+            limit: Maximum number of items to return
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            Page[Item]: Items on the page and the cursor for the next one
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was returned
+                for another sort order
+        """
+        pass
+
+    @abc.abstractmethod
+    async def get_page_version(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> ResultVersion:
+        """Summarize the page get_page would return, without loading it.
+
+        The summary also covers the row that decides whether a next page
+        exists.
+
+        Args:
+            limit: Maximum number of items on the page
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            ResultVersion: Version of the page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        pass
+
+    @abc.abstractmethod
+    async def find_by_name_version(
+        self, name: str, limit: int | None = None
+    ) -> ResultVersion:
+        """Summarize the result find_by_name would return, without loading it.
+
+        Args:
+            name: Item name to search for
+            limit: Maximum number of items to consider, if given
+
+        Returns:
+            ResultVersion: Version of the search result
+        """
+        pass
+
+    @abc.abstractmethod
+    async def patch(self, id: Any, changes: dict[str, Any]) -> Item | None:
+        """Update only the given fields of an item.
+
+        Args:
+            id: Item ID
+            changes: Field name to new value mapping
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+        """
+        pass
+
+    @abc.abstractmethod
+    async def apply_discount(self, id: Any, discount_percent: float) -> Item | None:
+        """Discount an item's price atomically.
+
+        Args:
+            id: Item ID
+            discount_percent: Discount percentage (0-100)
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+
+        Raises:
+            ValueError: If the discount is outside 0-100
+        """
+        pass
+
+    @abc.abstractmethod
+    async def apply_discount_batch(
+        self,
+        item_filter: ItemFilter,
+        discount_percent: float,
+        after_id: Any | None,
+        chunk_size: int,
+    ) -> tuple[int, Any | None]:
+        """Discount the next chunk of matching items in one transaction.
+
+        Args:
+            item_filter: Criteria selecting the items to discount
+            discount_percent: Discount percentage (0-100)
+            after_id: Only consider items with a greater ID, if given
+            chunk_size: Maximum number of items to discount
+
+        Returns:
+            tuple[int, Any | None]: Number of items discounted and the ID the
+            next chunk starts after, or None when no matching items remain
+
+        Raises:
+            ValueError: If the discount is outside 0-100
+        """
+        pass
+
+    @abc.abstractmethod
+    async def count(self, item_filter: ItemFilter) -> int:
+        """Count the items matching a filter.
+
+        Args:
+            item_filter: Criteria selecting the items to count
+
+        Returns:
+            int: Number of matching items
+        """
+        pass
+
+    @abc.abstractmethod
+    async def get_stats(
+        self,
+        bucket_width: float,
+        filters: ItemFilter | None = None,
+        max_buckets: int | None = None,
+    ) -> ItemStats:
+        """Compute aggregate statistics over the matching items.
+
+        Args:
+            bucket_width: Width of the price histogram buckets; bucket ``n``
+                covers prices from ``n * bucket_width`` up to the next bucket
+            filters: Criteria the items must match, if any
+            max_buckets: Most buckets the histogram may span, empty ones
+                included; no limit if None
+
+        Returns:
+            ItemStats: Counts, price summary and price histogram
+
+        Raises:
+            TooManyBucketsError: If the histogram would span more than
+                ``max_buckets`` buckets
+        """
+        pass
+
+    @abc.abstractmethod
+    async def create_many(self, entities: list[Item], chunk_size: int) -> list[Item]:
+        """Create many items in a single transaction.
+
+        Args:
+            entities: Items to create
+            chunk_size: Maximum number of rows to send per INSERT statement
+
+        Returns:
+            list[Item]: Created items, in the same order as ``entities``
+        """
+        pass
+
+    @abc.abstractmethod
+    async def update_many(
+        self, changes: dict[Any, dict[str, Any]], chunk_size: int
+    ) -> list[Any]:
+        """Apply partial updates to many items in a single transaction.
+
+        Args:
+            changes: Mapping of item ID to the fields to change for that item
+            chunk_size: Maximum number of rows to send per statement
+
+        Returns:
+            list[Any]: IDs from ``changes`` that did not match any item
+        """
+        pass
+
+    @abc.abstractmethod
+    async def delete_many(
+        self,
+        chunk_size: int,
+        ids: list[Any] | None = None,
+        filters: ItemFilter | None = None,
+    ) -> int:
+        """Delete many items by ID, by filter, or both.
+
+        Args:
+            chunk_size: Maximum number of rows to delete per statement
+            ids: IDs of the items to delete; all matching items if None
+            filters: Criteria the items must match, if any
+
+        Returns:
+            int: Number of items deleted
+        """
+        pass
+
+    @abc.abstractmethod
+    def stream_all(
+        self, chunk_size: int, filters: ItemFilter | None = None
+    ) -> AsyncIterator[ItemRecord]:
+        """Iterate over all items, ordered by ID, without loading them at once.
+
+        Implementations fetch rows from the data source in chunks of
+        ``chunk_size`` so memory use does not grow with the table, and yield
+        compact records rather than full domain models.
+
+        Args:
+            chunk_size: Number of rows to fetch per round trip
+            filters: Criteria the items must match, if any
+
+        Returns:
+            AsyncIterator[ItemRecord]: Items in ID order
+        """
+        pass
+
+    async def get_fields(self, id: Any, fields: Sequence[str]) -> dict[str, Any] | None:
+        """Get some fields of an item by ID.
+
+        This loads the whole item; adapters that can read fewer columns
+        override it.
+
+        Args:
+            id: Item ID
+            fields: Names of the Item fields to return
+
+        Returns:
+            dict[str, Any] | None: Requested fields in the given order if
+            found, None otherwise
+        """
+        item = await self.get(id)
+        return None if item is None else _project(item, fields)
+
+    async def get_page_fields(
+        self,
+        fields: Sequence[str],
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> Page[dict[str, Any]]:
+        """Get some fields of one page of items, as get_page would return it.
+
+        This loads whole items; adapters that can read fewer columns
+        override it.
+
+        Args:
+            fields: Names of the Item fields to return
+            limit: Maximum number of items to return
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the items must match, if any
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            Page[dict[str, Any]]: Requested fields of the items on the page
+            and the cursor for the next one
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was returned
+                for another sort order
+        """
+        page = await self.get_page(limit, after, filters, sort)
+        return Page(
+            items=[_project(item, fields) for item in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+    async def find_by_name_fields(
+        self, fields: Sequence[str], name: str, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Get some fields of the items find_by_name would return.
+
+        This loads whole items; adapters that can read fewer columns
+        override it.
+
+        Args:
+            fields: Names of the Item fields to return
+            name: Item name to search for
+            limit: Maximum number of items to return, if given
+
+        Returns:
+            list[dict[str, Any]]: Requested fields of the matching items,
+            ordered by relevance
+        """
+        items = await self.find_by_name(name, limit)
+        return [_project(item, fields) for item in items]
+
+
+def _project(item: Item, fields: Sequence[str]) -> dict[str, Any]:
+    """Pick the given fields of an item, in order."""
+    return {field: getattr(item, field) for field in fields}
@@ -0,0 +1,49 @@
+import abc
+from typing import Any
+
+from app.core.domain.job import Job
+
+
+class JobRepository(abc.ABC):
+    """Job repository interface.
+
+    This is the port background jobs use to record their status so that any
+    worker process can report it.
+    """
+
+    @abc.abstractmethod
+    async def get(self, id: Any) -> Job | None:
+        """Get a job by ID.
+
+        Args:
+            id: Job ID
+
+        Returns:
+            Job | None: Job if found, None otherwise
+        """
+        pass
+
+    @abc.abstractmethod
+    async def create(self, entity: Job) -> Job:
+        """Create a new job.
+
+        Args:
+            entity: Job to create
+
+        Returns:
+            Job: Created job
+        """
+        pass
+
+    @abc.abstractmethod
+    async def patch(self, id: Any, changes: dict[str, Any]) -> Job | None:
+        """Update only the given fields of a job.
+
+        Args:
+            id: Job ID
+            changes: Field name to new value mapping
+
+        Returns:
+            Job | None: Updated job if found, None otherwise
+        """
+        pass
@@ -1,14 +1,19 @@
 from abc import ABC, abstractmethod
 from typing import Any, Generic, TypeVar
 
+from app.core.domain.pagination import Page
+
 T = TypeVar("T")
+F = TypeVar("F")
 
 
-class Repository(Generic[T], ABC):
+class Repository(Generic[T, F], ABC):
     """Abstract base repository interface.
 
     This is a port in the hexagonal architecture that defines
     how the application core interacts with external data sources.
+    ``T`` is the entity type and ``F`` the filter spec type, which
+    implementations compile into their own query language.
     """
 
     @abstractmethod
@@ -24,17 +29,36 @@ class Repository(Generic[T], ABC):
         pass
 
     @abstractmethod
-    async def get_all(self, **kwargs: dict[str, Any]) -> list[T]:
+    async def get_all(self, filters: F | None = None) -> list[T]:
         """Get all entities, with optional filtering.
 
         Args:
-            **kwargs: Filter parameters
+            filters: Criteria the entities must match, if any
 
         Returns:
             list[T]: List of entities
         """
         pass
 
+    @abstractmethod
+    async def get_page(
+        self, limit: int, after: str | None = None, filters: F | None = None
+    ) -> Page[T]:
+        """Get one page of entities using keyset pagination.
+
+        Args:
+            limit: Maximum number of entities to return
+            after: Opaque cursor returned with the previous page, if any
+            filters: Criteria the entities must match, if any
+
+        Returns:
+            Page[T]: Entities on the page and the cursor for the next one
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        pass
+
     @abstractmethod
     async def create(self, entity: T) -> T:
         """Create a new entity.
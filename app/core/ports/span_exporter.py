@@ -0,0 +1,30 @@
+import abc
+from collections.abc import Sequence
+
+from app.core.domain.span import Span
+
+
+class SpanExporter(abc.ABC):
+    """Span exporter interface.
+
+    This is the port finished traces are sent through, to a file, a
+    collector or anywhere else.
+    """
+
+    @abc.abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Send the spans of one finished trace.
+
+        Called on the event loop once the trace's root span ends, so
+        implementations should return quickly.
+
+        Args:
+            spans: Spans of the trace, in the order they ended
+        """
+        pass
+
+    def shutdown(self) -> None:  # noqa: B027
+        """Send any traces still pending and release the exporter's resources.
+
+        Called once when the application stops; does nothing by default.
+        """
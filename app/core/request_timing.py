@@ -0,0 +1,56 @@
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+
+
+@dataclass
+class RequestTimings:
+    """Time one request spent on parts of its work.
+
+    Attributes:
+        pool_wait: Seconds spent waiting for database connections
+        db_statements: Number of SQL statements executed
+        db_time: Seconds spent executing SQL statements
+        serialization: Seconds spent encoding response bodies
+    """
+
+    pool_wait: float = 0.0
+    db_statements: int = 0
+    db_time: float = 0.0
+    serialization: float = 0.0
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def start_request_timings() -> tuple[RequestTimings, Token[RequestTimings | None]]:
+    """Start collecting timings for the current request.
+
+    Code running in the same context, including tasks it starts, adds to
+    the returned timings.
+
+    Returns:
+        tuple[RequestTimings, Token]: Timings for the request, and the token
+        to pass to end_request_timings
+    """
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end_request_timings(token: Token[RequestTimings | None]) -> None:
+    """Stop collecting timings for the current request.
+
+    Args:
+        token: Token returned by start_request_timings
+    """
+    _current.reset(token)
+
+
+def current_request_timings() -> RequestTimings | None:
+    """Get the timings of the request being handled, if any.
+
+    Returns:
+        RequestTimings | None: Timings to add to, or None outside a request
+    """
+    return _current.get()
@@ -1,5 +1,20 @@
-from app.core.domain.item import Item
+import logging
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from app.core.domain.item import Item, ItemRecord
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.item_sort import ItemSort
+from app.core.domain.item_stats import ItemStats
+from app.core.domain.job import Job, JobStatus
+from app.core.domain.pagination import Page
+from app.core.domain.result_version import ResultVersion
 from app.core.ports.item_repository import ItemRepository
+from app.core.ports.job_repository import JobRepository
+
+logger = logging.getLogger(__name__)
+
+BULK_DISCOUNT_JOB = "bulk_discount"
 
 
 class ItemService:
@@ -9,13 +24,20 @@ class ItemService:
     port to interact with the data layer.
     """
 
-    def __init__(self, item_repository: ItemRepository):
-        """Initialize the service with a repository.
+    def __init__(
+        self,
+        item_repository: ItemRepository,
+        job_repository: JobRepository | None = None,
+    ):
+        """Initialize the service with its repositories.
 
         Args:
             item_repository: Repository implementation for items
+            job_repository: Repository implementation for background jobs,
+                required only by the bulk discount methods
         """
         self.repository = item_repository
+        self.job_repository = job_repository
 
     async def get_item(self, item_id: int) -> Item | None:
         """Get an item by ID.
@@ -28,6 +50,20 @@ class ItemService:
         """
         return await self.repository.get(item_id)
 
+    async def get_item_fields(
+        self, item_id: int, fields: Sequence[str]
+    ) -> dict[str, Any] | None:
+        """Get some fields of an item by ID.
+
+        Args:
+            item_id: Item ID
+            fields: Names of the Item fields to return
+
+        Returns:
+            dict[str, Any] | None: Requested fields if found, None otherwise
+        """
+        return await self.repository.get_fields(item_id, fields)
+
     async def get_all_items(self) -> list[Item]:
         """Get all items.
 
@@ -36,6 +72,85 @@ class ItemService:
         """
         return await self.repository.get_all()
 
+    async def get_items_page(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> Page[Item]:
+        """Get one page of items.
+
+        Args:
+            limit: Maximum number of items to return
+            after: Cursor returned with the previous page, if any
+            filters: Only return items matching these criteria, if given
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            Page[Item]: Items on the page and the cursor for the next one
+        """
+        return await self.repository.get_page(limit, after, filters, sort)
+
+    async def get_items_page_fields(
+        self,
+        fields: Sequence[str],
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> Page[dict[str, Any]]:
+        """Get some fields of one page of items.
+
+        Args:
+            fields: Names of the Item fields to return
+            limit: Maximum number of items to return
+            after: Cursor returned with the previous page, if any
+            filters: Only return items matching these criteria, if given
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            Page[dict[str, Any]]: Requested fields of the items on the page
+            and the cursor for the next one
+        """
+        return await self.repository.get_page_fields(
+            fields, limit, after, filters, sort
+        )
+
+    async def get_items_page_version(
+        self,
+        limit: int,
+        after: str | None = None,
+        filters: ItemFilter | None = None,
+        sort: ItemSort | None = None,
+    ) -> ResultVersion:
+        """Get a version of the page get_items_page would return.
+
+        Args:
+            limit: Maximum number of items on the page
+            after: Cursor returned with the previous page, if any
+            filters: Only consider items matching these criteria, if given
+            sort: Order of the items; by ascending ID if None
+
+        Returns:
+            ResultVersion: Version that changes whenever the page does
+        """
+        return await self.repository.get_page_version(limit, after, filters, sort)
+
+    def export_items(
+        self, chunk_size: int, filters: ItemFilter | None = None
+    ) -> AsyncIterator[ItemRecord]:
+        """Stream every item without loading the whole table.
+
+        Args:
+            chunk_size: Number of rows to fetch per round trip
+            filters: Only return items matching these criteria, if given
+
+        Returns:
+            AsyncIterator[ItemRecord]: Items in ID order
+        """
+        return self.repository.stream_all(chunk_size, filters)
+
     async def create_item(self, item: Item) -> Item:
         """Create a new item.
 
@@ -47,6 +162,20 @@ class ItemService:
         """
         return await self.repository.create(item)
 
+    async def create_items(self, items: list[Item], chunk_size: int) -> list[Item]:
+        """Create many items at once.
+
+        Args:
+            items: Items to create
+            chunk_size: Maximum number of rows to insert per statement
+
+        Returns:
+            list[Item]: Created items, in the same order as ``items``
+        """
+        if not items:
+            return []
+        return await self.repository.create_many(items, chunk_size)
+
     async def update_item(self, item_id: int, item: Item) -> Item | None:
         """Update an existing item.
 
@@ -59,6 +188,34 @@ class ItemService:
         """
         return await self.repository.update(item_id, item)
 
+    async def patch_item(self, item_id: int, changes: dict[str, Any]) -> Item | None:
+        """Update only the given fields of an item.
+
+        Args:
+            item_id: Item ID
+            changes: Field name to new value mapping
+
+        Returns:
+            Item | None: Updated item if found, None otherwise
+        """
+        return await self.repository.patch(item_id, changes)
+
+    async def update_items(
+        self, changes: dict[int, dict[str, Any]], chunk_size: int
+    ) -> list[int]:
+        """Apply partial updates to many items at once.
+
+        Args:
+            changes: Mapping of item ID to the fields to change for that item
+            chunk_size: Maximum number of rows to update per statement
+
+        Returns:
+            list[int]: IDs that did not match any item
+        """
+        if not changes:
+            return []
+        return await self.repository.update_many(changes, chunk_size)
+
     async def delete_item(self, item_id: int) -> bool:
         """Delete an item by ID.
 
@@ -70,16 +227,98 @@ class ItemService:
         """
         return await self.repository.delete(item_id)
 
-    async def search_items_by_name(self, name: str) -> list[Item]:
+    async def delete_items(
+        self,
+        chunk_size: int,
+        ids: list[int] | None = None,
+        filters: ItemFilter | None = None,
+    ) -> int:
+        """Delete many items by ID, by filter, or both.
+
+        Args:
+            chunk_size: Maximum number of rows to delete per statement
+            ids: IDs of the items to delete, if given
+            filters: Only delete items matching these criteria, if given
+
+        Returns:
+            int: Number of items deleted
+
+        Raises:
+            ValueError: If neither IDs nor a filter are given
+        """
+        if filters == ItemFilter():
+            filters = None
+        if ids is None and filters is None:
+            raise ValueError("Bulk delete needs a list of IDs or a filter")
+        if ids is not None and not ids:
+            return 0
+        return await self.repository.delete_many(chunk_size, ids, filters)
+
+    async def get_item_stats(
+        self,
+        bucket_width: float,
+        filters: ItemFilter | None = None,
+        max_buckets: int | None = None,
+    ) -> ItemStats:
+        """Get aggregate statistics over items.
+
+        Args:
+            bucket_width: Width of the price histogram buckets
+            filters: Only consider items matching these criteria, if given
+            max_buckets: Most buckets the histogram may span; no limit if None
+
+        Returns:
+            ItemStats: Counts, price summary and price histogram
+
+        Raises:
+            TooManyBucketsError: If the histogram would span more than
+                ``max_buckets`` buckets
+        """
+        return await self.repository.get_stats(bucket_width, filters, max_buckets)
+
+    async def search_items_by_name(
+        self, name: str, limit: int | None = None
+    ) -> list[Item]:
         """Search items by name.
 
         Args:
             name: Item name to search for
+            limit: Maximum number of items to return, if given
+
+        Returns:
+            list[Item]: List of matching items, best matches first
+        """
+        return await self.repository.find_by_name(name, limit)
+
+    async def search_items_by_name_fields(
+        self, fields: Sequence[str], name: str, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Search items by name, returning only some of their fields.
+
+        Args:
+            fields: Names of the Item fields to return
+            name: Item name to search for
+            limit: Maximum number of items to return, if given
+
+        Returns:
+            list[dict[str, Any]]: Requested fields of the matching items,
+            best matches first
+        """
+        return await self.repository.find_by_name_fields(fields, name, limit)
+
+    async def search_items_by_name_version(
+        self, name: str, limit: int | None = None
+    ) -> ResultVersion:
+        """Get a version of the result search_items_by_name would return.
+
+        Args:
+            name: Item name to search for
+            limit: Maximum number of items to consider, if given
 
         Returns:
-            list[Item]: List of matching items
+            ResultVersion: Version that changes whenever the result does
         """
-        return await self.repository.find_by_name(name)
+        return await self.repository.find_by_name_version(name, limit)
 
     async def get_active_items(self) -> list[Item]:
         """Get all active items.
@@ -100,11 +339,98 @@ class ItemService:
 
         Returns:
             Item | None: Updated item if found, None otherwise
+
+        Raises:
+            ValueError: If the discount is outside 0-100
         """
-        item = await self.repository.get(item_id)
-        if not item:
-            return None
+        # Validate before touching the repository
+        Item.discount_factor(discount_percent)
+        return await self.repository.apply_discount(item_id, discount_percent)
 
-        discounted_price = item.apply_discount(discount_percent)
-        item.price = discounted_price
-        return await self.repository.update(item_id, item)
+    async def start_bulk_discount(
+        self, item_filter: ItemFilter, discount_percent: float
+    ) -> Job:
+        """Record a pending bulk discount job for the items matching a filter.
+
+        The job does nothing until run_bulk_discount is called with its ID.
+
+        Args:
+            item_filter: Criteria selecting the items to discount
+            discount_percent: Discount percentage (0-100)
+
+        Returns:
+            Job: Pending job, with the number of matching items as its total
+
+        Raises:
+            ValueError: If the discount is outside 0-100
+        """
+        Item.discount_factor(discount_percent)
+        total = await self.repository.count(item_filter)
+        return await self._jobs().create(Job(name=BULK_DISCOUNT_JOB, total=total))
+
+    async def run_bulk_discount(
+        self,
+        job_id: int,
+        item_filter: ItemFilter,
+        discount_percent: float,
+        chunk_size: int,
+    ) -> Job | None:
+        """Discount the items matching a filter, one chunk per transaction.
+
+        Progress is written to the job after every chunk. Errors mark the job
+        as failed instead of propagating, since nobody awaits the result.
+
+        Args:
+            job_id: ID of the job returned by start_bulk_discount
+            item_filter: Criteria selecting the items to discount
+            discount_percent: Discount percentage (0-100)
+            chunk_size: Maximum number of items to discount per transaction
+
+        Returns:
+            Job | None: Finished job if found, None otherwise
+        """
+        jobs = self._jobs()
+        await jobs.patch(job_id, {"status": JobStatus.RUNNING.value})
+
+        processed = 0
+        after_id = None
+        try:
+            while True:
+                updated, after_id = await self.repository.apply_discount_batch(
+                    item_filter, discount_percent, after_id, chunk_size
+                )
+                if after_id is None:
+                    break
+                processed += updated
+                await jobs.patch(job_id, {"processed": processed})
+        except Exception as exc:
+            logger.exception("Bulk discount job %s failed", job_id)
+            return await jobs.patch(
+                job_id, {"status": JobStatus.FAILED.value, "error": str(exc)}
+            )
+
+        return await jobs.patch(job_id, {"status": JobStatus.COMPLETED.value})
+
+    async def get_job(self, job_id: int) -> Job | None:
+        """Get a background job by ID.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job | None: Job if found, None otherwise
+        """
+        return await self._jobs().get(job_id)
+
+    def _jobs(self) -> JobRepository:
+        """Get the job repository, which bulk jobs cannot run without.
+
+        Returns:
+            JobRepository: Repository for background jobs
+
+        Raises:
+            RuntimeError: If the service was created without one
+        """
+        if self.job_repository is None:
+            raise RuntimeError("ItemService was created without a job repository")
+        return self.job_repository
@@ -0,0 +1,306 @@
+import functools
+import inspect
+import random
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Any, Literal, TypeVar
+
+from app.core.domain.span import Span, SpanKind
+from app.core.ports.span_exporter import SpanExporter
+
+T = TypeVar("T")
+
+# Span the code running in this context belongs to. False marks a trace
+# that was not sampled, so nested code does not start traces of its own.
+_current: ContextVar[Span | Literal[False] | None] = ContextVar(
+    "current_span", default=None
+)
+
+# Returned when there is nothing to record
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+class Tracer:
+    """Records nested spans and exports each sampled trace when it ends.
+
+    Whether a trace is recorded is decided once, when its root span starts;
+    spans inside it follow that decision. With no exporter or a zero sample
+    rate, starting a span costs a context variable lookup and records
+    nothing.
+    """
+
+    def __init__(
+        self, exporter: SpanExporter | None = None, sample_rate: float = 0.0
+    ) -> None:
+        """Initialize the tracer.
+
+        Args:
+            exporter: Where finished traces go; None disables tracing
+            sample_rate: Fraction of traces to record, from 0 to 1
+        """
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    def configure(self, exporter: SpanExporter | None, sample_rate: float) -> None:
+        """Change where traces go and how many are recorded.
+
+        Args:
+            exporter: Where finished traces go; None disables tracing
+            sample_rate: Fraction of traces to record, from 0 to 1
+        """
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    def span(
+        self, name: str, kind: SpanKind = SpanKind.INTERNAL, **attributes: Any
+    ) -> AbstractContextManager[Span | None]:
+        """Open a span for the code run inside the returned context manager.
+
+        The span becomes the parent of spans opened inside it, and ends
+        with an error if an exception leaves it.
+
+        Args:
+            name: Operation name
+            kind: Role of the span
+            **attributes: Details of the operation
+
+        Returns:
+            AbstractContextManager[Span | None]: Context manager yielding
+            the span, or None if the trace is not recorded
+        """
+        parent = _current.get()
+        if parent is False:
+            return _NO_SPAN
+        if parent is None:
+            if self.exporter is None or self.sample_rate <= 0:
+                return _NO_SPAN
+            if random.random() >= self.sample_rate:
+                return _Scope(self, False)
+        return _Scope(self, self._new_span(parent, name, kind, attributes))
+
+    def start_span(
+        self, name: str, kind: SpanKind = SpanKind.INTERNAL, **attributes: Any
+    ) -> Span | None:
+        """Start a span that code run after it does not nest under.
+
+        For operations timed by separate start and end callbacks; pass the
+        span to end_span when the operation finishes.
+
+        Args:
+            name: Operation name
+            kind: Role of the span
+            **attributes: Details of the operation
+
+        Returns:
+            Span | None: Started span, or None if the trace is not recorded
+        """
+        parent = _current.get()
+        if parent is False:
+            return None
+        if parent is None and (
+            self.exporter is None
+            or self.sample_rate <= 0
+            or random.random() >= self.sample_rate
+        ):
+            return None
+        return self._new_span(parent, name, kind, attributes)
+
+    def end_span(self, span: Span, error: BaseException | None = None) -> None:
+        """End a span, exporting its trace if it is the root.
+
+        Args:
+            span: Span to end
+            error: Exception that ended it, if any
+        """
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        span.trace_spans.append(span)
+        if span.parent_id is None and self.exporter is not None:
+            self.exporter.export(span.trace_spans)
+
+    def _new_span(
+        self,
+        parent: Span | None,
+        name: str,
+        kind: SpanKind,
+        attributes: dict[str, Any],
+    ) -> Span:
+        """Create a started span under a parent, or as a new trace's root."""
+        if parent is None:
+            return Span(
+                name=name,
+                trace_id=f"{random.getrandbits(128):032x}",
+                span_id=f"{random.getrandbits(64):016x}",
+                parent_id=None,
+                kind=kind,
+                start_ns=time.time_ns(),
+                attributes=attributes,
+            )
+        return Span(
+            name=name,
+            trace_id=parent.trace_id,
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent.span_id,
+            kind=kind,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+            trace_spans=parent.trace_spans,
+        )
+
+
+class _Scope:
+    """Makes a span, or a trace that is not recorded, current while open."""
+
+    def __init__(self, tracer: Tracer, span: Span | Literal[False]) -> None:
+        self.tracer = tracer
+        self.span = span
+        self.token: Token[Span | Literal[False] | None] | None = None
+
+    def __enter__(self) -> Span | None:
+        self.token = _current.set(self.span)
+        return self.span or None
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self.token is not None:
+            _current.reset(self.token)
+        if self.span:
+            self.tracer.end_span(self.span, exc)
+
+
+# Shared by the whole process; configured at startup
+tracer = Tracer()
+
+
+def instrumented(interface: type[T], layer: str) -> Callable[..., T]:
+    """Build a class that traces and times every call to an interface.
+
+    The class subclasses ``interface``. It is constructed with the object
+    to wrap and, optionally, a function taking a method name and the
+    seconds a call to it took. Each public method of the interface calls
+    the wrapped object's method inside a span named ``Interface.method``
+    and reports how long it took, failed calls included. Methods that
+    return an async iterator, such as a repository's stream_all, are
+    traced and timed from the first item to the last instead. Other
+    attributes are read from the wrapped object.
+
+    Args:
+        interface: Class or port whose public methods to wrap
+        layer: Layer the interface belongs to, recorded on each span
+
+    Returns:
+        Callable[..., T]: Wrapper class
+    """
+    namespace: dict[str, Any] = {
+        "__doc__": f"Traces and times every call to a {interface.__name__}.",
+        "__init__": _init_instrumented,
+        "__getattr__": _wrapped_attribute,
+    }
+    for name, member in inspect.getmembers(interface, inspect.isfunction):
+        if not name.startswith("_"):
+            namespace[name] = _instrumented_method(
+                f"{interface.__name__}.{name}", layer, name, member
+            )
+    return type(f"Instrumented{interface.__name__}", (interface,), namespace)
+
+
+def _init_instrumented(
+    self: Any, wrapped: Any, observe: Callable[[str, float], None] | None = None
+) -> None:
+    """Initialize a wrapper built by instrumented.
+
+    Args:
+        wrapped: Object whose calls to trace and time
+        observe: Function taking a method name and the seconds a call to it
+            took; None to only trace the calls
+    """
+    self._wrapped = wrapped
+    self._observe = observe
+
+
+def _wrapped_attribute(self: Any, name: str) -> Any:
+    """Read an attribute the wrapper does not define from the wrapped object."""
+    if name in ("_wrapped", "_observe"):
+        raise AttributeError(name)
+    return getattr(self._wrapped, name)
+
+
+def _instrumented_method(
+    span_name: str, layer: str, name: str, member: Callable[..., Any]
+) -> Callable[..., Any]:
+    """Build a method calling the wrapped object's method of the same name.
+
+    Args:
+        span_name: Name of the spans to open
+        layer: Layer recorded on the spans
+        name: Method name
+        member: Method of the interface, whose metadata the result copies
+
+    Returns:
+        Callable[..., Any]: Method for the wrapper class
+    """
+    if inspect.iscoroutinefunction(member):
+
+        async def call(self: Any, *args: Any, **kwargs: Any) -> Any:
+            with tracer.span(span_name, layer=layer):
+                start = time.perf_counter()
+                try:
+                    return await getattr(self._wrapped, name)(*args, **kwargs)
+                finally:
+                    if self._observe is not None:
+                        self._observe(name, time.perf_counter() - start)
+
+        return _copy_metadata(call, member)
+
+    def call_sync(self: Any, *args: Any, **kwargs: Any) -> Any:
+        result = getattr(self._wrapped, name)(*args, **kwargs)
+        if isinstance(result, AsyncIterator):
+            return _iterate(result, span_name, layer, name, self._observe)
+        return result
+
+    return _copy_metadata(call_sync, member)
+
+
+def _copy_metadata(method: Callable[..., Any], member: Callable[..., Any]) -> Any:
+    """Give a wrapper method the name and docstring of the method it wraps.
+
+    Unlike functools.wraps with its defaults, this leaves out the wrapped
+    function's attributes, so an abstract method's wrapper is concrete.
+    """
+    return functools.wraps(member, updated=())(method)
+
+
+async def _iterate(
+    iterator: AsyncIterator[T],
+    span_name: str,
+    layer: str,
+    name: str,
+    observe: Callable[[str, float], None] | None,
+) -> AsyncIterator[T]:
+    """Pass an async iterator's items through in a span, timing the iteration.
+
+    The span is not made current: the consumer runs between items, in its
+    own span.
+    """
+    span = tracer.start_span(span_name, layer=layer)
+    start = time.perf_counter()
+    error: Exception | None = None
+    try:
+        async for item in iterator:
+            yield item
+    except Exception as exc:
+        error = exc
+        raise
+    finally:
+        if observe is not None:
+            observe(name, time.perf_counter() - start)
+        if span is not None:
+            tracer.end_span(span, error)
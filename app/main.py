@@ -1,10 +1,36 @@
+import asyncio
+import contextlib
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from app.adapters.repositories.database import init_db
+from app.adapters.repositories.cached_item_repository import listen_for_invalidations
+from app.adapters.repositories.database import (
+    async_session_factory,
+    init_db,
+)
+from app.adapters.repositories.snapshot_item_repository import refresh_snapshot
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.adapters.tracing.otlp_json_exporter import OTLPJsonFileExporter
+from app.api.dependencies import (
+    in_memory_item_repository,
+    item_cache,
+    item_query_cache,
+    item_shared_cache,
+)
+from app.api.middleware import (
+    MetricsMiddleware,
+    ReadYourWritesMiddleware,
+    ServerTimingMiddleware,
+    TracingMiddleware,
+)
 from app.api.router import api_router
+from app.api.routes.metrics import router as metrics_router
 from app.core.config import settings
+from app.core.tracing import tracer
 
 
 def create_application() -> FastAPI:
@@ -32,6 +58,29 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Report pool wait and other timings on every response
+    app.add_middleware(ServerTimingMiddleware)
+
+    if settings.DATABASE_READ_URLS:
+        # Send a client's reads to the primary for a while after it writes
+        app.add_middleware(
+            ReadYourWritesMiddleware, window=settings.DATABASE_READ_STICKY_SECONDS
+        )
+
+    if settings.TRACING_SAMPLE_RATE > 0:
+        tracer.configure(
+            OTLPJsonFileExporter(settings.TRACING_EXPORT_PATH, settings.APP_NAME),
+            settings.TRACING_SAMPLE_RATE,
+        )
+        # Each request's root span covers the other middleware
+        app.add_middleware(TracingMiddleware)
+
+    if settings.METRICS_ENABLED:
+        # Added last so that it times the other middleware too
+        app.add_middleware(MetricsMiddleware)
+        # Scraped at the conventional path, outside the API prefix
+        app.include_router(metrics_router)
+
     # Include API router
     app.include_router(api_router, prefix="/api")
 
@@ -39,6 +88,47 @@ def create_application() -> FastAPI:
     @app.on_event("startup")
     async def startup_event() -> None:
         await init_db()
+        app.state.background_tasks = []
+        if settings.ITEM_REPOSITORY == "memory":
+            # Serve reads from a snapshot of the database
+            async with async_session_factory() as session:
+                await in_memory_item_repository.load_from(
+                    SQLAlchemyItemRepository(session),
+                    chunk_size=settings.ITEMS_EXPORT_CHUNK_SIZE,
+                )
+            if settings.ITEM_MEMORY_REFRESH_SECONDS > 0:
+                # Pick up the writes made through other workers
+                app.state.background_tasks.append(
+                    asyncio.create_task(
+                        refresh_snapshot(
+                            in_memory_item_repository,
+                            async_session_factory,
+                            chunk_size=settings.ITEMS_EXPORT_CHUNK_SIZE,
+                            interval=settings.ITEM_MEMORY_REFRESH_SECONDS,
+                        )
+                    )
+                )
+        if item_shared_cache is not None:
+            # Drop this worker's cached items when any worker writes
+            app.state.background_tasks.append(
+                asyncio.create_task(
+                    listen_for_invalidations(
+                        item_shared_cache, item_cache, item_query_cache
+                    )
+                )
+            )
+
+    @app.on_event("shutdown")
+    async def shutdown_event() -> None:
+        for task in getattr(app.state, "background_tasks", []):
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if item_shared_cache is not None:
+            await item_shared_cache.close()
+        if tracer.exporter is not None:
+            # Waits for the traces still queued to be written
+            await asyncio.to_thread(tracer.exporter.shutdown)
 
     # Add global exception handler
     @app.exception_handler(Exception)
@@ -1,11 +1,23 @@
-from collections.abc import AsyncGenerator, Generator
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
 from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-
+from sqlalchemy.pool import NullPool
+
+from app.adapters.metrics.prometheus_metrics import statement_timer
+from app.adapters.repositories.database import get_session
+from app.adapters.repositories.query_accounting import track_queries
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
 from app.adapters.repositories.sqlalchemy_models import Base
+from app.api.dependencies import get_session_factory
 from app.core.domain.item import Item
 from app.main import app
 
@@ -52,6 +64,111 @@ async def test_db_session(test_db_engine: Any) -> AsyncGenerator[AsyncSession, N
         yield session
 
 
+@pytest.fixture
+def sqlite_session_factory(
+    tmp_path: Path,
+) -> Generator[async_sessionmaker[AsyncSession], None, None]:
+    """Create a session factory bound to a fresh SQLite file.
+
+    The engine uses NullPool so sessions can be opened from any event loop,
+    which lets plain (non-async) tests drive it through asyncio.run and the
+    test client alike.
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        poolclass=NullPool,
+        # Concurrency tests queue many writers on SQLite's single write lock
+        connect_args={"timeout": 60},
+    )
+    track_queries(
+        engine, "test", slow_query_seconds=-1, observe=statement_timer("test")
+    )
+
+    async def create_tables() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def seed_items(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+) -> Callable[[int], None]:
+    """Return a function that inserts items into the SQLite test database.
+
+    Items are named "Item 0", "Item 1", ..., cost ``1.0 + i`` and every third
+    one (starting with the first) is inactive.
+    """
+
+    def seed(count: int) -> None:
+        async def insert_items() -> None:
+            async with sqlite_session_factory() as session:
+                repository = SQLAlchemyItemRepository(session)
+                for i in range(count):
+                    await repository.create(
+                        Item(name=f"Item {i}", price=1.0 + i, is_active=i % 3 != 0)
+                    )
+
+        asyncio.run(insert_items())
+
+    return seed
+
+
+@pytest.fixture
+def max_queries(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+) -> Callable[[int], AbstractContextManager[list[str]]]:
+    """Return a context manager capping the statements run inside it.
+
+    It yields the list of statements sent to the SQLite test database, and
+    fails the test on exit if there are more than the given number, listing
+    them all::
+
+        with max_queries(1):
+            api_client.get("/api/items/1")
+    """
+    engine = sqlite_session_factory.kw["bind"].sync_engine
+
+    @contextmanager
+    def cap(limit: int) -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2])
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert len(statements) <= limit, (
+            f"{len(statements)} statements, expected at most {limit}:\n"
+            + "\n".join(statements)
+        )
+
+    return cap
+
+
+@pytest.fixture
+def api_client(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+) -> Generator[TestClient, None, None]:
+    """Create a test client whose requests use the SQLite test database."""
+
+    async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
+        async with sqlite_session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_session_factory] = lambda: sqlite_session_factory
+    # Not entered as a context manager, so startup does not touch DATABASE_URL
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
 @pytest.fixture
 def sample_item() -> Item:
     """Create a sample item for testing."""
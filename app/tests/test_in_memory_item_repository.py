@@ -0,0 +1,241 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractContextManager
+from datetime import datetime
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.repositories.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from app.adapters.repositories.snapshot_item_repository import (
+    SnapshotItemRepository,
+)
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.api import dependencies
+from app.core.config import settings
+from app.core.domain.item import Item, ItemRecord
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.item_sort import ItemSort, ItemSortField
+from app.core.ports.item_repository import ItemRepository
+from app.core.services.item_service import ItemService
+
+
+async def exercise(repository: ItemRepository) -> dict[str, Any]:
+    """Run the same reads and writes against a repository and collect results."""
+    await repository.create_many(
+        [
+            Item(name=f"Item {i}", price=1.0 + i, is_active=i % 3 != 0)
+            for i in range(12)
+        ],
+        chunk_size=5,
+    )
+    results: dict[str, Any] = {}
+
+    page = await repository.get_page(4, filters=ItemFilter(is_active=True))
+    second = await repository.get_page(4, page.next_cursor, ItemFilter(is_active=True))
+    results["pages"] = [[i.id for i in page.items], [i.id for i in second.items]]
+    ranged = await repository.get_page(
+        10, filters=ItemFilter(name_prefix="Item 1", min_price=2.0, max_price=11.5)
+    )
+    results["ranged"] = [i.id for i in ranged.items]
+    priciest = await repository.get_page(
+        3, sort=ItemSort(ItemSortField.PRICE, descending=True)
+    )
+    after = await repository.get_page(
+        3, priciest.next_cursor, sort=ItemSort(ItemSortField.PRICE, descending=True)
+    )
+    results["sorted"] = [i.id for i in priciest.items + after.items]
+    results["sparse"] = (
+        await repository.get_page_fields(("id", "name"), 2, after=page.next_cursor)
+    ).items
+    results["search"] = sorted(i.id for i in await repository.find_by_name("item 1"))
+    results["count"] = await repository.count(
+        ItemFilter(is_active=True, min_price=3.0, max_price=9.0)
+    )
+    results["batch"] = await repository.apply_discount_batch(
+        ItemFilter(min_price=5.0), 50, after_id=None, chunk_size=3
+    )
+    results["stats"] = await repository.get_stats(5.0, ItemFilter(min_price=2.0))
+    results["not_found"] = await repository.update_many(
+        {2: {"name": "Renamed"}, 99: {"price": 1.0}}, chunk_size=10
+    )
+    results["patched"] = (await repository.patch(3, {"is_active": True})).is_active
+    results["deleted"] = await repository.delete_many(
+        10, filters=ItemFilter(is_active=False)
+    )
+    results["items"] = [
+        (i.id, i.name, round(i.price, 2), i.is_active)
+        for i in await repository.get_all()
+    ]
+    results["records"] = [r.id async for r in repository.stream_all(5)]
+    return results
+
+
+def test_in_memory_repository_matches_sqlalchemy(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Test that both adapters give the same results for the same calls."""
+
+    async def run_sql() -> dict[str, Any]:
+        async with sqlite_session_factory() as session:
+            return await exercise(SQLAlchemyItemRepository(session))
+
+    expected = asyncio.run(run_sql())
+    assert asyncio.run(exercise(InMemoryItemRepository())) == expected
+
+
+def test_in_memory_repository_loads_snapshot_and_keeps_indexes(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Test snapshot loading, and that the indexes follow later writes."""
+
+    async def run() -> None:
+        async with sqlite_session_factory() as session:
+            source = SQLAlchemyItemRepository(session)
+            await source.create(Item(name="Blue Lamp", price=20.0))
+            await source.create(Item(name="Red Chair", price=80.0))
+
+            repository = InMemoryItemRepository()
+            assert await repository.load_from(source, chunk_size=1) == 2
+            assert (await repository.get(2)).name == "Red Chair"
+
+            created = await repository.create(Item(name="Lamp", price=5.0))
+            assert created.id == 3
+            assert [i.id for i in await repository.find_by_name("LAMP")] == [3, 1]
+
+            await repository.patch(1, {"name": "Blue Bulb", "price": 90.0})
+            assert [i.id for i in await repository.find_by_name("lamp")] == [3]
+            assert await repository.count(ItemFilter(min_price=50.0)) == 2
+
+            # Returned items are copies
+            (await repository.get(2)).name = "Changed"
+            assert (await repository.get(2)).name == "Red Chair"
+
+    asyncio.run(run())
+
+
+def test_in_memory_repository_serializes_concurrent_writes() -> None:
+    """Test that concurrent discounts through the service are not lost."""
+
+    async def run() -> float:
+        service = ItemService(InMemoryItemRepository())
+        item = await service.create_item(Item(name="Item", price=1024.0))
+        await asyncio.gather(
+            *(service.apply_discount_to_item(item.id, 50) for _ in range(10))
+        )
+        return (await service.get_item(item.id)).price
+
+    assert asyncio.run(run()) == 1.0
+
+
+def test_memory_mode_reads_the_snapshot_and_writes_the_database(
+    api_client: TestClient,
+    seed_items: Callable[[int], None],
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    max_queries: Callable[[int], AbstractContextManager[list[str]]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that API writes reach the database and the worker's snapshot."""
+    seed_items(3)
+    snapshot = InMemoryItemRepository()
+    monkeypatch.setattr(settings, "ITEM_REPOSITORY", "memory")
+    monkeypatch.setattr(dependencies, "in_memory_item_repository", snapshot)
+
+    async def load() -> None:
+        async with sqlite_session_factory() as session:
+            await snapshot.load_from(SQLAlchemyItemRepository(session), chunk_size=2)
+
+    async def stored() -> list[tuple[int, str, float]]:
+        async with sqlite_session_factory() as session:
+            items = await SQLAlchemyItemRepository(session).get_all()
+        return [(item.id, item.name, item.price) for item in items]
+
+    asyncio.run(load())
+    created = api_client.post("/api/items/", json={"name": "New", "price": 9.0})
+    assert created.status_code == 201
+    assert api_client.patch("/api/items/1", json={"price": 5.0}).status_code == 200
+    assert api_client.delete("/api/items/2").status_code == 204
+
+    assert asyncio.run(stored()) == [
+        (1, "Item 0", 5.0),
+        (3, "Item 2", 3.0),
+        (4, "New", 9.0),
+    ]
+    with max_queries(0):
+        listed = api_client.get("/api/items/").json()["items"]
+    assert [(item["id"], item["price"]) for item in listed] == [
+        (1, 5.0),
+        (3, 3.0),
+        (4, 9.0),
+    ]
+
+
+def test_snapshot_bulk_writes_copy_what_the_database_did(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that bulk writes on a stale snapshot leave it equal to the database."""
+    seed_items(6)
+
+    async def run() -> None:
+        async with sqlite_session_factory() as session:
+            database = SQLAlchemyItemRepository(session)
+            items = await database.get_all()
+            # Item 2 was written by another worker after this snapshot loaded,
+            # and item 5 has since been deleted there
+            snapshot = InMemoryItemRepository(item for item in items if item.id != 2)
+            await database.delete(5)
+            repository = SnapshotItemRepository(snapshot, database)
+
+            after_id = None
+            while True:
+                _, after_id = await repository.apply_discount_batch(
+                    ItemFilter(), 50, after_id, chunk_size=2
+                )
+                if after_id is None:
+                    break
+            await repository.update_many({1: {"name": "One"}, 9: {}}, chunk_size=2)
+            await repository.delete_many(2, filters=ItemFilter(min_price=5.5))
+
+            assert await snapshot.get_all() == await database.get_all()
+
+    asyncio.run(run())
+
+
+def test_reload_keeps_writes_made_while_it_streams() -> None:
+    """Test that a reload does not undo writes applied during its stream."""
+    now = datetime(2024, 1, 1)
+    rows = [
+        ItemRecord(id, f"Item {id}", None, 1.0, True, now, now, version=1)
+        for id in (1, 2, 3)
+    ]
+    snapshot = InMemoryItemRepository(rows)
+    written = Item.from_trusted({**rows[0]._asdict(), "price": 2.0, "version": 2})
+    newer = rows[2]._replace(price=4.0, version=3)
+
+    class Source:
+        async def rows(self) -> AsyncIterator[ItemRecord]:
+            yield rows[0]
+            # This worker writes items 1 to 3 while the reload is streaming
+            snapshot.put(written)
+            snapshot.discard(2)
+            snapshot.put(Item.from_trusted({**rows[2]._asdict(), "version": 2}))
+            yield rows[1]
+            # Another worker wrote item 3 again before the stream read it
+            yield newer
+
+        def stream_all(self, chunk_size: int) -> AsyncIterator[ItemRecord]:
+            return self.rows()
+
+    assert asyncio.run(snapshot.load_from(Source(), chunk_size=1)) == 3
+    stored = asyncio.run(snapshot.get_all())
+    assert [(item.id, item.price, item.version) for item in stored] == [
+        (1, 2.0, 2),
+        (3, 4.0, 3),
+    ]
@@ -0,0 +1,141 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item import Item
+from app.core.domain.item_filter import ItemFilter
+
+
+def test_create_many_returns_items_in_input_order(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Test that chunked bulk inserts return every created row in order."""
+    items = [Item(name=f"Bulk {i}", price=10.0 + i) for i in range(7)]
+
+    async def create() -> tuple[list[Item], list[Item]]:
+        async with sqlite_session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            created = await repository.create_many(items, chunk_size=3)
+            return created, await repository.get_all()
+
+    created, stored = asyncio.run(create())
+
+    assert [item.name for item in created] == [item.name for item in items]
+    assert [item.id for item in created] == list(range(1, 8))
+    assert all(item.created_at is not None for item in created)
+    assert len(stored) == 7
+
+
+def test_bulk_create_route_reports_invalid_rows(api_client: TestClient) -> None:
+    """Test that invalid rows are reported without failing the batch."""
+    rows = [
+        {"name": "Valid", "price": 5.0},
+        {"name": "Free", "price": 0},
+        {"price": 3.0},
+        {"name": "Also valid", "price": 7.5, "is_active": False},
+    ]
+
+    response = api_client.post("/api/items/bulk", json={"items": rows})
+
+    assert response.status_code == 201
+    body = response.json()
+    assert [item["name"] for item in body["items"]] == ["Valid", "Also valid"]
+    assert body["count"] == 2
+    assert [error["index"] for error in body["errors"]] == [1, 2]
+    assert body["errors"][0]["detail"].startswith("price:")
+
+
+def test_update_many_groups_changes_and_reports_missing_ids(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that bulk updates apply each item's own changes only."""
+    seed_items(4)
+    changes = {
+        1: {"price": 100.0},
+        2: {"price": 200.0},
+        3: {"name": "Renamed", "is_active": False},
+        99: {"price": 1.0},
+    }
+
+    async def update() -> tuple[list[Any], dict[int | None, Item]]:
+        async with sqlite_session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            not_found = await repository.update_many(changes, chunk_size=1)
+            return not_found, {item.id: item for item in await repository.get_all()}
+
+    not_found, items = asyncio.run(update())
+
+    assert not_found == [99]
+    assert (items[1].price, items[2].price) == (100.0, 200.0)
+    assert (items[3].name, items[3].is_active, items[3].price) == (
+        "Renamed",
+        False,
+        3.0,
+    )
+    assert items[4].price == 4.0
+
+
+def test_bulk_update_route(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that the bulk update route applies changes and lists unknown IDs."""
+    seed_items(2)
+    payload = {
+        "items": [
+            {"id": 1, "changes": {"price": 9.5}},
+            {"id": 2, "changes": {"description": None}},
+            {"id": 5, "changes": {"price": 1.0}},
+        ]
+    }
+
+    response = api_client.patch("/api/items/bulk", json=payload)
+
+    assert response.status_code == 200
+    # Item 2 exists but is left unchanged: null fields are not applied
+    assert response.json() == {"updated": 1, "not_found": [5]}
+    assert api_client.get("/api/items/1").json()["price"] == 9.5
+
+
+def test_delete_many_by_ids_and_by_filter(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that bulk deletes honour ID lists, filters and chunking."""
+    seed_items(9)
+
+    async def delete() -> tuple[int, int, list[int | None]]:
+        async with sqlite_session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            by_ids = await repository.delete_many(2, ids=[2, 3, 4, 42])
+            by_filter = await repository.delete_many(
+                2, filters=ItemFilter(is_active=False)
+            )
+            remaining = [item.id for item in await repository.get_all()]
+            return by_ids, by_filter, remaining
+
+    by_ids, by_filter, remaining = asyncio.run(delete())
+
+    assert by_ids == 3
+    # Items 1 and 7 were inactive; item 4 was already gone
+    assert by_filter == 2
+    assert sorted(remaining) == [5, 6, 8, 9]
+
+
+def test_bulk_delete_route(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that the bulk delete route needs criteria and reports a count."""
+    seed_items(4)
+
+    assert api_client.delete("/api/items/").status_code == 400
+
+    response = api_client.delete("/api/items/", params={"ids": [1, 2, 3]})
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 3}
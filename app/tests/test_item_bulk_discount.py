@@ -0,0 +1,86 @@
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.adapters.repositories.sqlalchemy_job_repository import (
+    SQLAlchemyJobRepository,
+)
+from app.core.domain.item import Item
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.job import Job, JobStatus
+from app.core.services.item_service import ItemService
+
+
+def test_run_bulk_discount_processes_matching_items_in_chunks(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that a bulk discount touches only matching items and tracks progress."""
+    seed_items(10)
+    # Seeded prices equal IDs and items 1, 4, 7 and 10 are inactive, so this
+    # matches items 3, 5, 6, 8 and 9
+    item_filter = ItemFilter(is_active=True, min_price=3.0, max_price=9.0)
+
+    async def run() -> tuple[Job, Job | None, list[Item]]:
+        async with sqlite_session_factory() as session:
+            service = ItemService(
+                SQLAlchemyItemRepository(session), SQLAlchemyJobRepository(session)
+            )
+            job = await service.start_bulk_discount(item_filter, 50)
+            assert job.id is not None
+            finished = await service.run_bulk_discount(job.id, item_filter, 50, 3)
+            return job, finished, await service.get_all_items()
+
+    job, finished, items = asyncio.run(run())
+
+    assert (job.status, job.total) == (JobStatus.PENDING, 5)
+    assert finished is not None
+    assert finished.status == JobStatus.COMPLETED
+    assert (finished.processed, finished.progress) == (5, 1.0)
+    discounted = [item.id for item in items if item.price != (item.id or 0)]
+    assert discounted == [3, 5, 6, 8, 9]
+
+
+def test_start_bulk_discount_validates_discount(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Test that an out-of-range discount never creates a job."""
+
+    async def start() -> None:
+        async with sqlite_session_factory() as session:
+            service = ItemService(
+                SQLAlchemyItemRepository(session), SQLAlchemyJobRepository(session)
+            )
+            await service.start_bulk_discount(ItemFilter(), 120)
+
+    with pytest.raises(ValueError):
+        asyncio.run(start())
+
+
+def test_bulk_discount_routes(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that the job is accepted at once and its status can be polled."""
+    seed_items(4)
+
+    response = api_client.post(
+        "/api/items/discount", json={"discount_percent": 10, "name_contains": "item"}
+    )
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    # The test client runs background tasks before returning
+    status = api_client.get(f"/api/items/discount/{job_id}").json()
+    assert (status["status"], status["processed"], status["total"]) == (
+        "completed",
+        4,
+        4,
+    )
+    assert api_client.get("/api/items/1").json()["price"] == pytest.approx(0.9)
+    assert api_client.get("/api/items/discount/999").status_code == 404
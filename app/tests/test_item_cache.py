@@ -0,0 +1,282 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.cache.lru_cache import MISSING, LRUCache
+from app.adapters.cache.query_cache import QueryCache
+from app.adapters.cache.shared_cache import InMemorySharedCache
+from app.adapters.repositories.cached_item_repository import (
+    CachedItemRepository,
+    listen_for_invalidations,
+)
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item import Item
+from app.core.domain.item_filter import ItemFilter
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_cache_evicts_and_expires() -> None:
+    """Test LRU eviction order, TTL expiry and the counters."""
+    clock = FakeClock()
+    cache: LRUCache[int, str | None] = LRUCache(max_entries=2, ttl=10, clock=clock)
+
+    cache.set(1, "one")
+    cache.set(2, None, ttl=1)
+    assert cache.get(1) == "one"
+    cache.set(3, "three")  # evicts 2, the least recently used
+
+    assert cache.get(2) is MISSING
+    clock.now = 11
+    assert cache.get(1) is MISSING
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+    assert (cache.stats.evictions, cache.stats.expirations) == (1, 1)
+
+
+def test_cached_repository_reads_through_and_invalidates(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that hits skip the database and writes invalidate entries."""
+    seed_items(2)
+    statements: list[str] = []
+    engine = sqlite_session_factory.kw["bind"].sync_engine
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    cache: LRUCache[Any, Item | None] = LRUCache(max_entries=10, ttl=60)
+
+    async def run() -> list[Item | None]:
+        async with sqlite_session_factory() as session:
+            repository = CachedItemRepository(SQLAlchemyItemRepository(session), cache)
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                first = await repository.get(1)
+                second = await repository.get(1)
+                missing = [await repository.get(99), await repository.get(99)]
+                await repository.patch(1, {"price": 50.0})
+                patched = await repository.get(1)
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+            return [first, second, *missing, patched]
+
+    first, second, missing, missing_again, patched = asyncio.run(run())
+
+    assert first == second
+    assert first is not second
+    assert missing is None and missing_again is None
+    assert patched is not None and patched.price == 50.0
+    # get(1), get(99), the patch and the re-read after invalidation
+    assert len(statements) == 4
+    assert (cache.stats.hits, cache.stats.misses) == (2, 3)
+
+
+def test_query_cache_generation_and_byte_bound() -> None:
+    """Test that writes invalidate by generation and size is bounded."""
+    cache = QueryCache(max_bytes=100, ttl=60)
+    calls: list[str] = []
+
+    async def compute(label: str) -> str:
+        calls.append(label)
+        return label
+
+    async def run() -> None:
+        await cache.get_or_compute("items", "a", lambda: compute("a"), lambda _: 40)
+        await cache.get_or_compute("items", "a", lambda: compute("a"), lambda _: 40)
+        cache.bump("items")
+        await cache.get_or_compute("items", "a", lambda: compute("a"), lambda _: 40)
+        # The pre-bump entry is unreachable and is evicted to make room
+        await cache.get_or_compute("items", "b", lambda: compute("b"), lambda _: 40)
+
+    asyncio.run(run())
+
+    assert calls == ["a", "a", "b"]
+    assert cache.size_bytes <= 100
+    assert cache.stats.evictions == 1
+
+
+def test_query_cache_computes_once_for_concurrent_misses() -> None:
+    """Test that concurrent lookups of a missing key share one computation."""
+    cache = QueryCache(max_bytes=1000, ttl=60)
+    calls = 0
+
+    async def slow_query() -> list[int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [1, 2, 3]
+
+    async def run() -> list[list[int]]:
+        return await asyncio.gather(
+            *(
+                cache.get_or_compute("items", "q", slow_query, lambda _: 10)
+                for _ in range(50)
+            )
+        )
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert all(result == [1, 2, 3] for result in results)
+
+
+def test_query_cache_waiter_survives_cancelled_computation() -> None:
+    """Test that cancelling the computing request does not cancel its waiters."""
+    cache = QueryCache(max_bytes=1000, ttl=60)
+    calls = 0
+
+    async def slow_query() -> list[int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [calls]
+
+    async def run() -> list[int]:
+        leader = asyncio.create_task(
+            cache.get_or_compute("items", "q", slow_query, lambda _: 10)
+        )
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(
+            cache.get_or_compute("items", "q", slow_query, lambda _: 10)
+        )
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.wait((leader,))
+        assert leader.cancelled()
+        return await waiter
+
+    assert asyncio.run(run()) == [2]
+    assert calls == 2
+
+
+def test_cached_repository_query_cache_sees_writes(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that cached list results are refreshed after a write."""
+    seed_items(3)
+
+    async def run() -> tuple[int, int, int]:
+        async with sqlite_session_factory() as session:
+            repository = CachedItemRepository(
+                SQLAlchemyItemRepository(session),
+                None,
+                query_cache=QueryCache(max_bytes=10**6, ttl=60),
+            )
+            before = len(await repository.find_active_items())
+            await repository.patch(1, {"is_active": True})
+            after = len(await repository.find_active_items())
+            cached = len(await repository.find_active_items())
+            return before, after, cached
+
+    assert asyncio.run(run()) == (2, 3, 3)
+
+
+def test_shared_cache_serves_other_workers_and_broadcasts_writes(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test one database read per item across workers, and coherent writes."""
+    seed_items(2)
+    shared = InMemorySharedCache()
+    local_caches: list[LRUCache[Any, Item | None]] = [
+        LRUCache(max_entries=10, ttl=60) for _ in range(2)
+    ]
+    statements: list[str] = []
+    engine = sqlite_session_factory.kw["bind"].sync_engine
+
+    def record(*args: Any) -> None:
+        if args[2].startswith("SELECT"):
+            statements.append(args[2])
+
+    async def run() -> list[float | None]:
+        listeners = [
+            asyncio.create_task(listen_for_invalidations(shared, cache, None))
+            for cache in local_caches
+        ]
+        await asyncio.sleep(0)
+        async with sqlite_session_factory() as session:
+            workers = [
+                CachedItemRepository(
+                    SQLAlchemyItemRepository(session), cache, shared_cache=shared
+                )
+                for cache in local_caches
+            ]
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                prices = [await worker.get(id) for id in (1, 2) for worker in workers]
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+
+            await workers[0].patch(1, {"price": 7.0})
+            await workers[0].delete_many(10, filters=ItemFilter(is_active=True))
+            await asyncio.sleep(0)
+            prices += [await worker.get(1) for worker in workers]
+            prices.append(await workers[1].get(2))
+
+        for listener in listeners:
+            listener.cancel()
+        return [None if item is None else item.price for item in prices]
+
+    prices = asyncio.run(run())
+
+    # Item 2 was cached everywhere, then deleted by a filter naming no IDs
+    assert prices == [1.0, 1.0, 2.0, 2.0, 7.0, 7.0, None]
+    assert len(statements) == 2
+
+
+def test_read_overlapping_a_write_does_not_cache_the_old_row(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that a read loading a row before a write commits caches nothing."""
+    seed_items(1)
+    shared = InMemorySharedCache()
+    cache: LRUCache[Any, Item | None] = LRUCache(max_entries=10, ttl=60)
+    loaded, resume = asyncio.Event(), asyncio.Event()
+
+    class PausedRepository(SQLAlchemyItemRepository):
+        async def get(self, id: Any) -> Item | None:
+            item = await super().get(id)
+            loaded.set()
+            await resume.wait()
+            return item
+
+    async def run() -> list[float]:
+        async with sqlite_session_factory() as read, sqlite_session_factory() as write:
+            reader = CachedItemRepository(
+                PausedRepository(read), cache, shared_cache=shared
+            )
+            writer = CachedItemRepository(
+                SQLAlchemyItemRepository(write), cache, shared_cache=shared
+            )
+            overlapping = asyncio.create_task(reader.get(1))
+            await loaded.wait()
+            await writer.patch(1, {"price": 7.0})
+            resume.set()
+            prices = [(await overlapping).price]  # type: ignore[union-attr]
+
+            other_worker = CachedItemRepository(
+                SQLAlchemyItemRepository(read),
+                LRUCache(max_entries=10, ttl=60),
+                shared_cache=shared,
+            )
+            for repository in (writer, other_worker, writer):
+                prices.append((await repository.get(1)).price)  # type: ignore[union-attr]
+        return prices
+
+    assert asyncio.run(run()) == [1.0, 7.0, 7.0, 7.0]
@@ -0,0 +1,179 @@
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+from fastapi.testclient import TestClient
+
+
+def test_get_item_revalidates_with_etag(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that an unchanged item is answered with 304 until it is written."""
+    seed_items(3)
+
+    first = api_client.get("/api/items/2")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert "Last-Modified" in first.headers
+
+    cached = api_client.get("/api/items/2", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    # Weak comparison and tag lists are accepted
+    listed = api_client.get(
+        "/api/items/2", headers={"If-None-Match": f'"other", W/{etag}'}
+    )
+    assert listed.status_code == 304
+
+    api_client.patch("/api/items/2", json={"price": 50.0})
+    changed = api_client.get("/api/items/2", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["price"] == 50.0
+
+
+def test_get_item_revalidates_with_last_modified(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test If-Modified-Since against the item's update time."""
+    seed_items(1)
+
+    first = api_client.get("/api/items/1")
+    last_modified = first.headers["Last-Modified"]
+
+    cached = api_client.get(
+        "/api/items/1", headers={"If-Modified-Since": last_modified}
+    )
+    assert cached.status_code == 304
+
+    stale = api_client.get(
+        "/api/items/1", headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+    )
+    assert stale.status_code == 200
+
+    garbage = api_client.get("/api/items/1", headers={"If-Modified-Since": "never"})
+    assert garbage.status_code == 200
+
+
+def test_list_and_search_etags_follow_their_result(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that list and search ETags change only when their result does."""
+    seed_items(6)
+
+    page = api_client.get("/api/items/", params={"limit": 2})
+    etag = page.headers["ETag"]
+    assert (
+        api_client.get(
+            "/api/items/", params={"limit": 2}, headers={"If-None-Match": etag}
+        ).status_code
+        == 304
+    )
+
+    # Different parameters never share a tag
+    other = api_client.get("/api/items/", params={"limit": 3})
+    assert other.headers["ETag"] != etag
+
+    search = api_client.get("/api/items/search/", params={"name": "Item"})
+    search_etag = search.headers["ETag"]
+    assert search_etag != etag
+
+    api_client.delete("/api/items/2")
+    after_delete = api_client.get(
+        "/api/items/", params={"limit": 2}, headers={"If-None-Match": etag}
+    )
+    assert after_delete.status_code == 200
+    assert [item["id"] for item in after_delete.json()["items"]] == [1, 3]
+
+    search_again = api_client.get(
+        "/api/items/search/",
+        params={"name": "Item"},
+        headers={"If-None-Match": search_etag},
+    )
+    assert search_again.status_code == 200
+    assert search_again.json()["count"] == 5
+
+
+def test_list_and_search_ignore_if_modified_since(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that a delete is never hidden behind an unchanged update time."""
+    seed_items(3)
+
+    first = api_client.get("/api/items/")
+    assert "Last-Modified" not in first.headers
+    search = api_client.get("/api/items/search/", params={"name": "Item"})
+    assert "Last-Modified" not in search.headers
+
+    api_client.delete("/api/items/1")
+    since = {"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+    after_delete = api_client.get("/api/items/", headers=since)
+    assert after_delete.status_code == 200
+    assert after_delete.json()["count"] == 2
+    search_again = api_client.get(
+        "/api/items/search/", params={"name": "Item"}, headers=since
+    )
+    assert search_again.status_code == 200
+    assert search_again.json()["count"] == 2
+
+
+def test_list_etag_changes_on_every_write(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that edits within one second of each other change the list ETag.
+
+    SQLite stores updated_at with one second resolution, so the tag must
+    not depend on it.
+    """
+    seed_items(2)
+
+    api_client.patch("/api/items/1", json={"price": 2.0})
+    etag = api_client.get("/api/items/").headers["ETag"]
+    search_etag = api_client.get("/api/items/search/", params={"name": "Item"}).headers[
+        "ETag"
+    ]
+    api_client.patch("/api/items/1", json={"price": 7.0})
+
+    changed = api_client.get("/api/items/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["items"][0]["price"] == 7.0
+    search = api_client.get(
+        "/api/items/search/",
+        params={"name": "Item"},
+        headers={"If-None-Match": search_etag},
+    )
+    assert search.status_code == 200
+
+
+def test_loaded_results_carry_the_etag_revalidation_checks(
+    api_client: TestClient,
+    seed_items: Callable[[int], None],
+    max_queries: Callable[[int], AbstractContextManager[list[str]]],
+) -> None:
+    """Test that ETags from loaded pages match the version queries."""
+    seed_items(2)
+    requests = [
+        ("/api/items/", {"limit": 2}),
+        ("/api/items/", {"limit": 2, "fields": "name"}),
+        ("/api/items/search/", {"name": "Item"}),
+        ("/api/items/search/", {"name": "Item", "fields": "price"}),
+    ]
+
+    etags = []
+    for path, params in requests:
+        first = api_client.get(path, params=params)
+        etags.append(first.headers["ETag"])
+        with max_queries(1):
+            cached = api_client.get(
+                path, params=params, headers={"If-None-Match": etags[-1]}
+            )
+        assert cached.status_code == 304
+    path, params = requests[1]
+    assert list(api_client.get(path, params=params).json()["items"][0]) == ["name"]
+
+    # A next page appearing changes the page even though its rows did not
+    api_client.post("/api/items/", json={"name": "Item 3", "price": 3.0})
+    for (path, params), etag in zip(requests, etags, strict=True):
+        changed = api_client.get(path, params=params, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pytest
 
 from app.core.domain.item import Item
@@ -36,3 +38,24 @@ def test_item_apply_discount_invalid() -> None:
     # Test with discount > 100
     with pytest.raises(ValueError):
         item.apply_discount(110)
+
+
+def test_item_from_trusted_matches_validated_item() -> None:
+    """Test that trusted construction builds the same item without validation."""
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    values = {
+        "id": 1,
+        "name": "Test Item",
+        "description": None,
+        "price": 10.0,
+        "is_active": True,
+        "created_at": now,
+        "updated_at": now,
+        "version": 1,
+    }
+
+    item = Item.from_trusted(dict(values))
+
+    assert item == Item.model_validate(values)
+    assert item.model_fields_set == set(values)
+    assert item.model_dump() == values
@@ -0,0 +1,46 @@
+import asyncio
+import json
+from collections.abc import Callable
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item import ItemRecord
+
+
+def test_stream_all_yields_every_item_in_chunks(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that streaming returns all rows in ID order without keeping them."""
+    seed_items(7)
+
+    async def stream() -> tuple[list[ItemRecord], int]:
+        async with sqlite_session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            records = [record async for record in repository.stream_all(3)]
+            return records, len(session.identity_map)
+
+    records, retained = asyncio.run(stream())
+    assert [record.id for record in records] == list(range(1, 8))
+    assert all(isinstance(record, ItemRecord) for record in records)
+    assert retained == 0
+
+
+def test_export_route_streams_ndjson(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that the export route returns one JSON object per line."""
+    seed_items(5)
+
+    response = api_client.get("/api/items/export", params={"active": True})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [2, 3, 5]
+    assert all(row["is_active"] for row in rows)
+    assert rows[0] == api_client.get("/api/items/2").json()
@@ -0,0 +1,92 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item_sort import ItemSort, ItemSortField
+
+
+def test_get_page_fields_selects_only_requested_columns(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that sparse pages read only the requested and cursor columns."""
+    seed_items(5)
+    statements: list[str] = []
+    engine = sqlite_session_factory.kw["bind"].sync_engine
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    async def run() -> list[list[dict[str, Any]]]:
+        async with sqlite_session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            sort = ItemSort(ItemSortField.PRICE, descending=True)
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                first = await repository.get_page_fields(("name",), 3, sort=sort)
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+            second = await repository.get_page_fields(
+                ("name",), 3, first.next_cursor, sort=sort
+            )
+            return [first.items, second.items]
+
+    first, second = asyncio.run(run())
+
+    assert first == [{"name": "Item 4"}, {"name": "Item 3"}, {"name": "Item 2"}]
+    assert second == [{"name": "Item 1"}, {"name": "Item 0"}]
+    select_list = statements[0].split("FROM")[0]
+    assert "description" not in select_list
+    assert "created_at" not in select_list
+
+
+def test_item_routes_return_only_requested_fields(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that the list, search and get routes honour the fields parameter."""
+    seed_items(3)
+    params = {"fields": "price, id,name"}
+
+    listed = api_client.get("/api/items/", params={**params, "limit": 2}).json()
+    assert listed["items"] == [
+        {"name": "Item 0", "price": 1.0, "id": 1},
+        {"name": "Item 1", "price": 2.0, "id": 2},
+    ]
+    assert listed["count"] == 2
+    assert listed["next_cursor"] is not None
+
+    found = api_client.get("/api/items/search/", params={**params, "name": "Item 2"})
+    assert found.json()["items"] == [{"name": "Item 2", "price": 3.0, "id": 3}]
+
+    item = api_client.get("/api/items/1", params={"fields": "updated_at"})
+    assert list(item.json()) == ["updated_at"]
+    assert "last-modified" in item.headers
+    revalidated = api_client.get(
+        "/api/items/1",
+        params={"fields": "updated_at"},
+        headers={"If-None-Match": item.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+    unknown = api_client.get("/api/items/", params={"fields": "id,secret"})
+    assert unknown.status_code == 400
+    assert api_client.get("/api/items/99", params=params).status_code == 404
+
+
+def test_sparse_fields_serialize_like_full_items(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that requesting every field gives the same body as no fieldset."""
+    seed_items(1)
+    every_field = ",".join(api_client.get("/api/items/1").json())
+
+    full = api_client.get("/api/items/1")
+    sparse = api_client.get("/api/items/1", params={"fields": every_field})
+    assert sparse.content == full.content
@@ -0,0 +1,143 @@
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item_sort import ItemSort, ItemSortField
+from app.core.domain.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trip() -> None:
+    """Test that cursors decode to the keyset they were built from."""
+    assert decode_cursor(encode_cursor(42)) == [42]
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+
+
+def test_get_page_walks_all_items_once(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that following next_cursor visits every item exactly once."""
+    seed_items(10)
+
+    async def walk() -> list[int]:
+        async with sqlite_session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            seen: list[int] = []
+            after = None
+            while True:
+                page = await repository.get_page(4, after)
+                seen.extend(item.id for item in page.items if item.id is not None)
+                if page.next_cursor is None:
+                    return seen
+                after = page.next_cursor
+
+    assert asyncio.run(walk()) == list(range(1, 11))
+
+
+def test_get_items_route_paginates_and_filters(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that the list route filters in SQL and returns a next cursor."""
+    seed_items(9)
+
+    first = api_client.get("/api/items/", params={"active": False, "limit": 2})
+    assert first.status_code == 200
+    body = first.json()
+    assert [item["id"] for item in body["items"]] == [1, 4]
+    assert body["count"] == 2
+
+    second = api_client.get(
+        "/api/items/",
+        params={"active": False, "limit": 2, "after": body["next_cursor"]},
+    )
+    assert [item["id"] for item in second.json()["items"]] == [7]
+    assert second.json()["next_cursor"] is None
+
+
+def test_get_items_route_rejects_bad_input(api_client: TestClient) -> None:
+    """Test that malformed cursors and oversized limits are rejected."""
+    assert api_client.get("/api/items/", params={"after": "bogus"}).status_code == 400
+    assert api_client.get("/api/items/", params={"limit": 10**6}).status_code == 422
+
+
+def test_get_items_route_combines_filters(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that prefix, price and time filters are combined with AND."""
+    seed_items(12)
+
+    response = api_client.get(
+        "/api/items/",
+        params={
+            "active": True,
+            "name_prefix": "Item 1",
+            "min_price": 2.0,
+            "max_price": 11.5,
+            "created_to": "2999-01-01T00:00:00+02:00",
+        },
+    )
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()["items"]] == ["Item 1", "Item 10"]
+
+    future = api_client.get("/api/items/", params={"updated_from": "2999-01-01T00:00Z"})
+    assert future.json()["items"] == []
+
+
+def test_get_page_walks_every_sort_order(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that sorted pages visit every item once, in sort order."""
+    seed_items(10)
+
+    async def walk(sort: ItemSort) -> tuple[list[int], list[int]]:
+        async with sqlite_session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            items = await repository.get_all()
+            expected = sorted(items, key=sort.key, reverse=sort.descending)
+            seen: list[int] = []
+            after = None
+            while True:
+                page = await repository.get_page(3, after, sort=sort)
+                seen.extend(item.id for item in page.items if item.id is not None)
+                if page.next_cursor is None:
+                    return seen, [item.id for item in expected if item.id]
+                after = page.next_cursor
+
+    for field in ItemSortField:
+        for descending in (False, True):
+            seen, expected = asyncio.run(walk(ItemSort(field, descending)))
+            assert seen == expected
+
+
+def test_get_items_route_sorts_top_k(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that the list route returns the top items for a sort order."""
+    seed_items(9)
+
+    response = api_client.get(
+        "/api/items/", params={"sort": "-price", "active": True, "limit": 2}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["name"] for item in body["items"]] == ["Item 8", "Item 7"]
+
+    # A cursor only continues the order it was returned for
+    mismatched = api_client.get(
+        "/api/items/", params={"sort": "name", "after": body["next_cursor"]}
+    )
+    assert mismatched.status_code == 400
+    assert api_client.get("/api/items/", params={"sort": "secret"}).status_code == 422
@@ -0,0 +1,26 @@
+import json
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+
+from app.api.responses import ModelResponse
+from app.api.schemas import ItemListResponse
+from app.core.domain.item import Item
+
+
+def test_model_response_matches_standard_encoding() -> None:
+    """Test that the fast path encodes lists the same as FastAPI's default."""
+    now = datetime(2024, 1, 1, 12, 0, 0, 123456)
+    items = [
+        Item(id=i, name=f"Itém {i}", price=1.5 * i, created_at=now, updated_at=now)
+        for i in range(1, 4)
+    ]
+
+    content = ItemListResponse.from_items(items, next_cursor="abc")
+    response = ModelResponse(content, status_code=201)
+
+    assert response.status_code == 201
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(content)
+    assert content.count == 3
+    assert content.items[0].name == "Itém 1"
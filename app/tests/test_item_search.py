@@ -0,0 +1,69 @@
+import asyncio
+from collections.abc import Callable
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item import Item
+
+
+def test_find_by_name_ranks_and_follows_writes(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Test that indexed search ranks matches and stays in sync with writes."""
+    names = ["Blue Lamp", "Lamp", "Desk lamp with shade", "Chair", 'Say "lamp"']
+
+    async def run() -> dict[str, list[str]]:
+        async with sqlite_session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            created = await repository.create_many(
+                [Item(name=name, price=1.0) for name in names], chunk_size=10
+            )
+            results = {"initial": await repository.find_by_name("LAMP")}
+            results["limited"] = await repository.find_by_name("lamp", limit=2)
+            results["quoted"] = await repository.find_by_name('"lamp"')
+            results["short"] = await repository.find_by_name("la")
+
+            await repository.patch(created[3].id, {"name": "Lamp chair"})
+            await repository.update_many(
+                {created[0].id: {"name": "Blue bulb"}}, chunk_size=10
+            )
+            await repository.delete(created[1].id)
+            results["after_writes"] = await repository.find_by_name("lamp")
+            return {
+                key: [item.name for item in items] for key, items in results.items()
+            }
+
+    results = asyncio.run(run())
+    assert set(results["initial"]) == set(names) - {"Chair"}
+    # The exact name is the most relevant match
+    assert results["initial"][0] == "Lamp"
+    assert results["limited"] == results["initial"][:2]
+    assert results["quoted"] == ['Say "lamp"']
+    assert set(results["short"]) == set(results["initial"])
+    assert set(results["after_writes"]) == {
+        "Lamp chair",
+        "Desk lamp with shade",
+        'Say "lamp"',
+    }
+
+
+def test_search_route_limits_results(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that the search route honours the limit and escapes wildcards."""
+    seed_items(12)
+
+    response = api_client.get("/api/items/search/", params={"name": "Item 1"})
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()["items"]][0] == "Item 1"
+    assert response.json()["count"] == 3
+
+    limited = api_client.get("/api/items/search/", params={"name": "Item", "limit": 5})
+    assert limited.json()["count"] == 5
+
+    wildcard = api_client.get("/api/items/search/", params={"name": "%"})
+    assert wildcard.json()["count"] == 0
@@ -0,0 +1,120 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.repositories.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.item_stats import ItemStats, PriceBucket, TooManyBucketsError
+
+
+def test_get_stats_runs_one_grouped_query(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that the statistics come from a single aggregate query."""
+    seed_items(12)
+    statements: list[str] = []
+    engine = sqlite_session_factory.kw["bind"].sync_engine
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    async def run() -> tuple[ItemStats, ItemStats]:
+        async with sqlite_session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                stats = await repository.get_stats(5.0)
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+            empty = await repository.get_stats(5.0, ItemFilter(min_price=100.0))
+            return stats, empty
+
+    stats, empty = asyncio.run(run())
+
+    assert len(statements) == 1
+    assert "GROUP BY" in statements[0]
+    assert stats == ItemStats(
+        count=12,
+        active=8,
+        inactive=4,
+        min_price=1.0,
+        max_price=12.0,
+        avg_price=6.5,
+        buckets=(
+            PriceBucket(lower=0.0, upper=5.0, count=4),
+            PriceBucket(lower=5.0, upper=10.0, count=5),
+            PriceBucket(lower=10.0, upper=15.0, count=3),
+        ),
+    )
+    assert empty == ItemStats()
+
+
+def test_stats_route_applies_list_filters(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that the statistics route takes the same filters as the list."""
+    seed_items(12)
+
+    response = api_client.get(
+        "/api/items/stats",
+        params={"active": True, "max_price": 6.0, "bucket_width": 2.5},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "count": 4,
+        "active": 4,
+        "inactive": 0,
+        "min_price": 2.0,
+        "max_price": 6.0,
+        "avg_price": 4.0,
+        "buckets": [
+            {"lower": 0.0, "upper": 2.5, "count": 1},
+            {"lower": 2.5, "upper": 5.0, "count": 1},
+            {"lower": 5.0, "upper": 7.5, "count": 2},
+        ],
+    }
+    bad_width = api_client.get("/api/items/stats", params={"bucket_width": 0})
+    assert bad_width.status_code == 422
+
+
+def test_stats_reject_widths_giving_too_many_buckets(
+    api_client: TestClient,
+    seed_items: Callable[[int], None],
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Test that a tiny bucket width is rejected instead of shipping every row."""
+    seed_items(12)
+
+    for width in (1e-9, 1e-300):
+        response = api_client.get("/api/items/stats", params={"bucket_width": width})
+        assert response.status_code == 400
+        assert "Bucket width" in response.json()["detail"]
+    # One distinct price fits one bucket, but its index overflows SQLite's
+    # integers
+    one_price = api_client.get(
+        "/api/items/stats", params={"max_price": 1.0, "bucket_width": 1e-300}
+    )
+    assert one_price.status_code == 400
+
+    async def run() -> None:
+        async with sqlite_session_factory() as session:
+            database = SQLAlchemyItemRepository(session)
+            memory = InMemoryItemRepository(await database.get_all())
+            for repository in (database, memory):
+                with pytest.raises(TooManyBucketsError):
+                    await repository.get_stats(1.0, max_buckets=5)
+                stats = await repository.get_stats(1.0, max_buckets=12)
+                assert len(stats.buckets) == 12
+
+    asyncio.run(run())
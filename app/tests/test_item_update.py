@@ -0,0 +1,98 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item import Item
+
+
+def test_patch_is_a_single_statement(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that a partial update runs one UPDATE ... RETURNING."""
+    seed_items(2)
+    statements: list[str] = []
+    engine = sqlite_session_factory.kw["bind"].sync_engine
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    async def patch() -> tuple[Item | None, Item | None]:
+        async with sqlite_session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                updated = await repository.patch(2, {"price": 42.0})
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+            missing = await repository.patch(99, {"price": 1.0})
+            return updated, missing
+
+    updated, missing = asyncio.run(patch())
+
+    assert updated is not None
+    assert (updated.name, updated.price) == ("Item 1", 42.0)
+    assert missing is None
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE items SET price=?")
+    assert "RETURNING" in statements[0]
+
+
+def test_update_route_changes_only_given_fields(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that PATCH keeps omitted fields and 404s on unknown IDs."""
+    seed_items(1)
+
+    response = api_client.patch("/api/items/1", json={"name": "Renamed"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed"
+    assert response.json()["price"] == 1.0
+
+    assert api_client.patch("/api/items/7", json={"price": 2.0}).status_code == 404
+
+
+def test_concurrent_discounts_compound(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+    seed_items: Callable[[int], None],
+) -> None:
+    """Test that parallel discounts on one item are all applied."""
+    seed_items(1)
+    discounts = 200
+
+    async def discount_once() -> None:
+        async with sqlite_session_factory() as session:
+            await SQLAlchemyItemRepository(session).apply_discount(1, 1)
+
+    async def run() -> Item | None:
+        async with sqlite_session_factory() as session:
+            await SQLAlchemyItemRepository(session).patch(1, {"price": 100.0})
+        await asyncio.gather(*(discount_once() for _ in range(discounts)))
+        async with sqlite_session_factory() as session:
+            return await SQLAlchemyItemRepository(session).get(1)
+
+    item = asyncio.run(run())
+
+    assert item is not None
+    assert item.price == pytest.approx(100.0 * 0.99**discounts)
+
+
+def test_apply_discount_rejects_out_of_range(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Test that the repository enforces the 0-100 discount bounds."""
+
+    async def discount() -> None:
+        async with sqlite_session_factory() as session:
+            await SQLAlchemyItemRepository(session).apply_discount(1, 150)
+
+    with pytest.raises(ValueError):
+        asyncio.run(discount())
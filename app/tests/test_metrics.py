@@ -0,0 +1,99 @@
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.metrics.prometheus_metrics import sql_operation
+from app.adapters.repositories.in_memory_item_repository import (
+    InMemoryItemRepository,
+)
+from app.adapters.repositories.instrumented_item_repository import (
+    InstrumentedItemRepository,
+)
+from app.core.domain.item import Item
+from app.core.domain.pagination import InvalidCursorError
+
+
+def sample(name: str, **labels: str) -> float:
+    """Get the current value of a sample, 0 if it has not been recorded."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_endpoint_reports_requests_by_route(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test request, repository and route-template labelled metrics."""
+    seed_items(3)
+    route = {"method": "GET", "route": "/api/items/{item_id}"}
+    before = {
+        "ok": sample("http_requests_total", **route, status="200"),
+        "missing": sample("http_requests_total", **route, status="404"),
+        "timed": sample("http_request_duration_seconds_count", **route),
+        "get": sample(
+            "repository_call_duration_seconds_count", repository="items", method="get"
+        ),
+        "unmatched": sample(
+            "http_requests_total", method="GET", route="unmatched", status="404"
+        ),
+    }
+
+    for path in ("/api/items/1", "/api/items/2", "/api/items/99", "/nowhere"):
+        api_client.get(path)
+
+    assert sample("http_requests_total", **route, status="200") == before["ok"] + 2
+    assert sample("http_requests_total", **route, status="404") == before["missing"] + 1
+    assert sample("http_request_duration_seconds_count", **route) == before["timed"] + 3
+    assert (
+        sample(
+            "repository_call_duration_seconds_count", repository="items", method="get"
+        )
+        == before["get"] + 3
+    )
+    assert (
+        sample("http_requests_total", method="GET", route="unmatched", status="404")
+        == before["unmatched"] + 1
+    )
+    assert sample("http_requests_in_progress", **route) == 0
+
+    response = api_client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'route="/api/items/{item_id}"' in response.text
+
+
+def test_statements_are_timed_by_database_and_operation(
+    sqlite_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Test that statements are timed per database and operation."""
+    labels = {"database": "test", "operation": "SELECT"}
+    before = sample("db_statement_duration_seconds_count", **labels)
+
+    async def run() -> None:
+        async with sqlite_session_factory() as session:
+            await session.execute(text("SELECT 1"))
+            await session.execute(text("  select count(*) FROM items"))
+
+    asyncio.run(run())
+    assert sample("db_statement_duration_seconds_count", **labels) == before + 2
+    assert sql_operation("PRAGMA foreign_keys") == "OTHER"
+
+
+def test_instrumented_repository_times_every_call() -> None:
+    """Test that calls, failed ones and streams included, are reported."""
+    calls: list[str] = []
+    repository = InstrumentedItemRepository(
+        InMemoryItemRepository([Item(id=1, name="Item 1", price=1.0)]),
+        lambda method, seconds: calls.append(method),
+    )
+
+    async def run() -> None:
+        assert (await repository.get(1)) is not None
+        assert [record.id async for record in repository.stream_all(10)] == [1]
+        with pytest.raises(InvalidCursorError):
+            await repository.get_page(10, "not a cursor")
+
+    asyncio.run(run())
+    assert calls == ["get", "stream_all", "get_page"]
@@ -0,0 +1,77 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.adapters.repositories.query_accounting import redact, track_queries
+
+# Most statements each endpoint may run, so that added round trips fail
+QUERY_BUDGETS = [
+    ("GET", "/api/items/1", None, 1),
+    ("GET", "/api/items/1?fields=name,price", None, 1),
+    ("GET", "/api/items/?limit=2&sort=-price", None, 1),
+    ("GET", "/api/items/?limit=2&fields=name", None, 1),
+    ("GET", "/api/items/search/?name=Item", None, 1),
+    ("GET", "/api/items/stats", None, 1),
+    ("POST", "/api/items/", {"name": "New", "price": 1.0}, 1),
+    ("PATCH", "/api/items/1", {"price": 3.0}, 1),
+    ("DELETE", "/api/items/2", None, 1),
+]
+
+
+@pytest.mark.parametrize(("method", "path", "body", "budget"), QUERY_BUDGETS)
+def test_endpoint_query_budget(
+    api_client: TestClient,
+    seed_items: Callable[[int], None],
+    max_queries: Callable[[int], AbstractContextManager[list[str]]],
+    method: str,
+    path: str,
+    body: dict[str, Any] | None,
+    budget: int,
+) -> None:
+    """Test that each endpoint stays within its statement budget."""
+    seed_items(5)
+    with max_queries(budget):
+        response = api_client.request(method, path, json=body)
+    assert response.status_code < 300
+
+
+def test_server_timing_splits_request_time(
+    api_client: TestClient, seed_items: Callable[[int], None]
+) -> None:
+    """Test that the header reports database, encoding and service time."""
+    seed_items(3)
+
+    entries = api_client.get("/api/items/?limit=2").headers["server-timing"]
+
+    names = [entry.split(";")[0] for entry in entries.split(", ")]
+    assert names == ["pool", "db", "serialization", "service"]
+    assert 'desc="1 SQL statement"' in entries
+
+
+def test_slow_query_log_redacts_parameters(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that slow statements are logged without their values."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'slow.db'}")
+    track_queries(engine, "slow", slow_query_seconds=0)
+
+    async def run() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT :secret AS value"), {"secret": "hunter2"})
+        await engine.dispose()
+
+    with caplog.at_level(logging.WARNING):
+        asyncio.run(run())
+
+    assert "SELECT ? AS value" in caplog.text
+    assert "hunter2" not in caplog.text
+    assert redact({"name": "x", "price": 2}) == "{'name': '?', 'price': '?'}"
+    assert redact([("a",), ("b",)], executemany=True) == "2 sets like ('?',)"
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.adapters.cache.lru_cache import LRUCache
+from app.adapters.repositories.replicas import ReadReplicas
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.adapters.repositories.sqlalchemy_models import Base
+from app.api import dependencies
+from app.api.dependencies import get_read_replicas
+from app.api.middleware import READ_PRIMARY_COOKIE, ReadYourWritesMiddleware
+from app.core.config import settings
+from app.core.domain.item import Item
+from app.main import app
+
+
+def replica(path: Path, name: str) -> async_sessionmaker[AsyncSession]:
+    """Create a SQLite "replica" holding a single item with the given name."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def setup() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as session:
+            await SQLAlchemyItemRepository(session).create(Item(name=name, price=1.0))
+
+    asyncio.run(setup())
+    return factory
+
+
+def test_repository_reads_from_replica_and_writes_to_primary(
+    tmp_path: Path, sqlite_session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    """Test that reads use the read session and writes the primary one."""
+    read_factory = replica(tmp_path / "replica.db", "Replica item")
+
+    async def run() -> None:
+        async with sqlite_session_factory() as session, read_factory() as read:
+            repository = SQLAlchemyItemRepository(session, read)
+            created = await repository.create(Item(name="Primary item", price=2.0))
+            assert created.id == 1
+
+            assert [item.name for item in await repository.get_all()] == [
+                "Replica item"
+            ]
+            assert (await repository.get(1)).name == "Replica item"  # type: ignore[union-attr]
+            assert await repository.find_by_name("Primary") == []
+
+            # A write's own read-back comes from the primary
+            patched = await repository.patch(1, {"price": 3.0})
+            assert patched is not None
+            assert (patched.name, patched.price) == ("Primary item", 3.0)
+            assert (await repository.get(1)).price == 1.0  # type: ignore[union-attr]
+
+    asyncio.run(run())
+
+
+def test_reads_rotate_over_replicas_until_the_client_writes(
+    tmp_path: Path, api_client: TestClient
+) -> None:
+    """Test round-robin replica reads and read-your-writes stickiness."""
+    replicas = ReadReplicas(
+        [
+            replica(tmp_path / "replica-a.db", "Replica A"),
+            replica(tmp_path / "replica-b.db", "Replica B"),
+        ]
+    )
+    app.dependency_overrides[get_read_replicas] = lambda: replicas
+
+    names = [api_client.get("/api/items/1").json()["name"] for _ in range(4)]
+    assert names == ["Replica A", "Replica B", "Replica A", "Replica B"]
+
+    # Writes go to the primary, which the replicas do not follow here
+    response = api_client.post("/api/items/", json={"name": "Primary", "price": 5})
+    assert (response.status_code, response.json()["id"]) == (201, 1)
+    assert api_client.get("/api/items/1").json()["name"] == "Replica A"
+
+    api_client.cookies.set(READ_PRIMARY_COOKIE, str(time.time() + 5))
+    assert api_client.get("/api/items/1").json()["name"] == "Primary"
+    api_client.cookies.set(READ_PRIMARY_COOKIE, str(time.time() - 1))
+    assert api_client.get("/api/items/1").json()["name"] == "Replica B"
+
+
+def test_item_caches_are_filled_from_the_primary_only(
+    tmp_path: Path, api_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that with an item cache enabled, reads skip the replicas."""
+    monkeypatch.setattr(settings, "ITEM_CACHE_ENABLED", True)
+    monkeypatch.setattr(dependencies, "item_cache", LRUCache(max_entries=10, ttl=60))
+    replicas = ReadReplicas([replica(tmp_path / "replica.db", "Replica")])
+    app.dependency_overrides[get_read_replicas] = lambda: replicas
+
+    api_client.post("/api/items/", json={"name": "Primary", "price": 5})
+    names = [api_client.get("/api/items/1").json()["name"] for _ in range(2)]
+
+    assert names == ["Primary", "Primary"]
+    assert dependencies.item_cache.stats.hits == 1
+
+
+def test_read_your_writes_middleware_marks_writers() -> None:
+    """Test that only requests that may write get the sticky cookie."""
+    sticky = FastAPI()
+    sticky.add_middleware(ReadYourWritesMiddleware, window=2.5)
+
+    @sticky.get("/")
+    @sticky.post("/")
+    async def endpoint() -> dict[str, str]:
+        return {}
+
+    client = TestClient(sticky)
+    assert "set-cookie" not in client.get("/").headers
+
+    start = time.time()
+    cookie = client.post("/").headers["set-cookie"]
+    assert cookie.startswith(f"{READ_PRIMARY_COOKIE}=")
+    assert "Max-Age=3" in cookie
+    until = float(client.cookies[READ_PRIMARY_COOKIE])
+    assert start + 2.5 <= until <= time.time() + 2.5
@@ -0,0 +1,134 @@
+import json
+import random
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.tracing.otlp_json_exporter import OTLPJsonFileExporter
+from app.api.middleware import TracingMiddleware
+from app.core.config import settings
+from app.core.domain.span import Span, SpanKind
+from app.core.ports.span_exporter import SpanExporter
+from app.core.tracing import Tracer, tracer
+from app.main import app
+
+
+class ListExporter(SpanExporter):
+    """Keeps exported traces in memory."""
+
+    def __init__(self) -> None:
+        self.traces: list[list[Span]] = []
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self.traces.append(list(spans))
+
+
+def test_request_trace_covers_every_layer(
+    api_client: TestClient,
+    seed_items: Callable[[int], None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that route, service, repository and SQL spans nest in one trace."""
+    seed_items(2)
+    exporter = ListExporter()
+    monkeypatch.setattr(tracer, "exporter", exporter)
+    monkeypatch.setattr(tracer, "sample_rate", 1.0)
+    monkeypatch.setattr(settings, "TRACING_SAMPLE_RATE", 1.0)
+
+    response = TestClient(TracingMiddleware(app)).get("/api/items/1")
+    assert response.status_code == 200
+
+    [trace] = exporter.traces
+    spans = {span.name: span for span in trace}
+    assert list(spans) == [
+        "SQL test",
+        "ItemRepository.get",
+        "ItemService.get_item",
+        "serialize",
+        "GET /api/items/{item_id}",
+    ]
+    root = spans["GET /api/items/{item_id}"]
+    assert (root.kind, root.parent_id) == (SpanKind.SERVER, None)
+    assert root.attributes["http.response.status_code"] == 200
+    assert spans["ItemService.get_item"].parent_id == root.span_id
+    assert spans["serialize"].parent_id == root.span_id
+    assert (
+        spans["ItemRepository.get"].parent_id == spans["ItemService.get_item"].span_id
+    )
+    sql = spans["SQL test"]
+    assert sql.parent_id == spans["ItemRepository.get"].span_id
+    assert sql.attributes["db.statement"].startswith("SELECT items.id")
+    assert {span.trace_id for span in trace} == {root.trace_id}
+
+
+def test_sampling_is_decided_at_the_root(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that spans inside an unsampled trace record nothing."""
+    exporter = ListExporter()
+    sampled = Tracer(exporter, sample_rate=0.5)
+
+    monkeypatch.setattr(random, "random", lambda: 0.7)
+    with sampled.span("root") as root:
+        assert root is None
+        monkeypatch.setattr(random, "random", lambda: 0.1)
+        with sampled.span("child") as child:
+            assert child is None
+        assert sampled.start_span("statement") is None
+
+    with sampled.span("root") as root, sampled.span("child") as child:
+        assert root is not None and child is not None
+    assert [[span.name for span in trace] for trace in exporter.traces] == [
+        ["child", "root"]
+    ]
+
+    with Tracer(exporter, sample_rate=0.0).span("off") as span:
+        assert span is None
+    assert len(exporter.traces) == 1
+
+
+def test_otlp_json_file_exporter(tmp_path: Path) -> None:
+    """Test that traces are appended as OTLP JSON lines."""
+    path = tmp_path / "traces.jsonl"
+    exporter = OTLPJsonFileExporter(path, "items-api")
+    local = Tracer(exporter, sample_rate=1.0)
+    with local.span("root", SpanKind.SERVER, layer="route"):
+        with pytest.raises(ValueError), local.span("child", retries=2):
+            raise ValueError("boom")
+    with local.span("second"):
+        pass
+    exporter.shutdown()
+
+    line, second = path.read_text().splitlines()
+    [[span]] = [
+        scope["spans"] for scope in json.loads(second)["resourceSpans"][0]["scopeSpans"]
+    ]
+    assert span["name"] == "second"
+    request = json.loads(line)["resourceSpans"][0]
+    assert request["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "items-api"}}
+    ]
+    child, root = request["scopeSpans"][0]["spans"]
+    assert child["parentSpanId"] == root["spanId"] and "parentSpanId" not in root
+    assert child["traceId"] == root["traceId"] and len(root["traceId"]) == 32
+    assert child["attributes"] == [{"key": "retries", "value": {"intValue": "2"}}]
+    assert child["status"] == {"code": 2, "message": "ValueError: boom"}
+    assert (root["kind"], root["status"]) == (2, {"code": 1})
+    assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+
+
+def test_otlp_json_file_exporter_drops_traces_when_its_queue_is_full(
+    tmp_path: Path,
+) -> None:
+    """Test that export never blocks, even when the writer falls behind."""
+    path = tmp_path / "traces.jsonl"
+    exporter = OTLPJsonFileExporter(path, "items-api", max_queued=1)
+    exporter.shutdown()
+    # The writer has stopped, so the queue fills after one trace
+    local = Tracer(exporter, sample_rate=1.0)
+    for name in ("kept", "dropped"):
+        with local.span(name):
+            pass
+
+    assert exporter.dropped == 1
+    assert not path.exists()
@@ -0,0 +1,50 @@
+"""Compare bulk item creation with creating items one request at a time.
+
+Usage:
+    python -m benchmarks.bench_bulk_create --items 5000 --chunk-size 500
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item import Item
+from benchmarks.common import seeded_engine
+
+
+async def main(count: int, chunk_size: int) -> None:
+    """Run the benchmark and print throughput for each strategy."""
+    items = [Item(name=f"New {i}", price=1.0 + i % 100) for i in range(count)]
+
+    async with seeded_engine(0) as engine:
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        start = time.perf_counter()
+        for item in items:
+            # One session per item mirrors one POST /api/items/ per item
+            async with session_factory() as session:
+                await SQLAlchemyItemRepository(session).create(item)
+        loop_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        async with session_factory() as session:
+            await SQLAlchemyItemRepository(session).create_many(items, chunk_size)
+        bulk_seconds = time.perf_counter() - start
+
+    print(f"{count} items, chunk size {chunk_size}")
+    print(f"  one-item loop  {count / loop_seconds:12.0f} items/s")
+    print(f"  create_many    {count / bulk_seconds:12.0f} items/s")
+    print(f"  speed-up       {loop_seconds / bulk_seconds:12.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.chunk_size))
@@ -0,0 +1,101 @@
+"""Measure per-row CPU and memory of turning item rows into domain objects.
+
+Compares ORM entities validated with ``Item.model_validate`` (the previous
+read path) against column rows built with ``Item.from_trusted`` (get_all)
+and against compact ItemRecord tuples (stream_all).
+
+Usage:
+    python -m benchmarks.bench_hydration --rows 100000
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.adapters.repositories.sqlalchemy_models import ItemModel
+from app.core.domain.item import Item
+from benchmarks.common import seeded_engine
+
+
+async def validated_entities(session: AsyncSession) -> list[Any]:
+    """Load items the way the repository did before trusted hydration."""
+    result = await session.execute(select(ItemModel))
+    return [Item.model_validate(db_item) for db_item in result.scalars().all()]
+
+
+async def trusted_items(session: AsyncSession) -> list[Any]:
+    """Load items through SQLAlchemyItemRepository.get_all."""
+    return await SQLAlchemyItemRepository(session).get_all()
+
+
+async def records(session: AsyncSession) -> list[Any]:
+    """Load items through SQLAlchemyItemRepository.stream_all."""
+    repository = SQLAlchemyItemRepository(session)
+    return [record async for record in repository.stream_all(1000)]
+
+
+async def measure(
+    session_factory: async_sessionmaker[AsyncSession],
+    load: Callable[[AsyncSession], Awaitable[list[Any]]],
+    repeat: int,
+) -> tuple[float, float, float]:
+    """Time a loader and trace the memory its result holds.
+
+    Args:
+        session_factory: Factory for a fresh session per run
+        load: Loader returning every item
+        repeat: Number of timed runs; the fastest is kept
+
+    Returns:
+        tuple[float, float, float]: Fastest seconds, retained bytes and peak
+        bytes
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        async with session_factory() as session:
+            start = time.perf_counter()
+            await load(session)
+            best = min(best, time.perf_counter() - start)
+
+    async with session_factory() as session:
+        tracemalloc.start()
+        result = await load(session)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    del result
+    return best, retained, peak
+
+
+async def main(rows: int, repeat: int) -> None:
+    """Run the benchmark and print per-row CPU time and memory."""
+    async with seeded_engine(rows) as engine:
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        print(f"{rows} rows, best of {repeat}")
+        for label, load in (
+            ("validated ORM", validated_entities),
+            ("trusted Item", trusted_items),
+            ("ItemRecord", records),
+        ):
+            elapsed, retained, peak = await measure(session_factory, load, repeat)
+            print(
+                f"  {label:<14} {elapsed * 1e6 / rows:6.2f} us/row "
+                f"{retained / rows:7.0f} B/row held {peak / rows:7.0f} B/row peak"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,95 @@
+"""Measure database load for GET /api/items/{id} with and without the cache.
+
+Item IDs are drawn from a Zipf distribution, so a small set of hot items
+receives most of the lookups, as in production traffic.
+
+Usage:
+    python -m benchmarks.bench_item_cache --rows 50000 --lookups 50000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.adapters.cache.lru_cache import LRUCache
+from app.adapters.repositories.cached_item_repository import CachedItemRepository
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item import Item
+from app.core.ports.item_repository import ItemRepository
+from benchmarks.common import seeded_engine
+
+
+def zipf_ids(rows: int, lookups: int, exponent: float, seed: int) -> list[int]:
+    """Draw item IDs whose popularity follows a Zipf distribution.
+
+    Args:
+        rows: Number of distinct IDs
+        lookups: Number of IDs to draw
+        exponent: Zipf exponent; larger means more skewed
+        seed: Random seed
+
+    Returns:
+        list[int]: Item IDs
+    """
+    weights = [1 / rank**exponent for rank in range(1, rows + 1)]
+    ids = list(range(1, rows + 1))
+    rng = random.Random(seed)
+    # Spread the hot items over the ID space
+    rng.shuffle(ids)
+    return rng.choices(ids, weights=weights, k=lookups)
+
+
+async def main(rows: int, lookups: int, exponent: float, max_entries: int) -> None:
+    """Run the benchmark and print database queries with and without cache."""
+    ids = zipf_ids(rows, lookups, exponent, seed=42)
+
+    async with seeded_engine(rows) as engine:
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        queries = 0
+
+        def count_query(*args: Any) -> None:
+            nonlocal queries
+            queries += 1
+
+        event.listen(engine.sync_engine, "before_cursor_execute", count_query)
+        cache: LRUCache[Any, Item | None] = LRUCache(max_entries, ttl=300)
+
+        print(f"{rows} rows, {lookups} Zipf({exponent}) lookups")
+        for label in ("uncached", "cached"):
+            queries = 0
+            start = time.perf_counter()
+            async with session_factory() as session:
+                repository: ItemRepository = SQLAlchemyItemRepository(session)
+                if label == "cached":
+                    repository = CachedItemRepository(repository, cache)
+                for id in ids:
+                    await repository.get(id)
+            elapsed = time.perf_counter() - start
+            print(
+                f"  {label:<9} {lookups / elapsed:10.0f} lookups/s "
+                f"{queries / elapsed:10.0f} DB queries/s "
+                f"({queries} queries)"
+            )
+
+        stats = cache.stats
+        print(
+            f"  cache: {max_entries} entries, hit ratio {stats.hit_ratio:.1%}, "
+            f"{stats.evictions} evictions"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=50_000)
+    parser.add_argument("--exponent", type=float, default=1.1)
+    parser.add_argument("--max-entries", type=int, default=5_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.lookups, args.exponent, args.max_entries))
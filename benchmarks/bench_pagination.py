@@ -0,0 +1,62 @@
+"""Compare keyset pagination with loading the whole items table.
+
+Usage:
+    python -m benchmarks.bench_pagination --rows 300000 --limit 100
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.adapters.repositories.sqlalchemy_models import ItemModel
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.pagination import encode_cursor
+from benchmarks.common import best_of, seeded_engine
+
+
+async def main(rows: int, limit: int) -> None:
+    """Run the benchmark and print a table of timings."""
+    async with seeded_engine(rows) as engine:
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            deep_cursor = encode_cursor(rows - limit * 2)
+            deep_offset = rows - limit * 2
+
+            async def offset_page() -> object:
+                query = (
+                    select(ItemModel)
+                    .order_by(ItemModel.id)
+                    .offset(deep_offset)
+                    .limit(limit)
+                )
+                return (await session.execute(query)).scalars().all()
+
+            cases = {
+                "keyset, first page": lambda: repository.get_page(limit),
+                "keyset, last pages": lambda: repository.get_page(limit, deep_cursor),
+                "keyset, active only": lambda: repository.get_page(
+                    limit, deep_cursor, ItemFilter(is_active=True)
+                ),
+                "OFFSET, last pages": offset_page,
+                "get_all (previous route)": repository.get_all,
+            }
+
+            print(f"{rows} rows, page size {limit}")
+            for label, func in cases.items():
+                repeat = 1 if label.startswith("get_all") else 5
+                elapsed, _ = await best_of(func, repeat)
+                print(f"  {label:<26} {elapsed:10.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.limit))
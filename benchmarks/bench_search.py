@@ -0,0 +1,60 @@
+"""Measure name search latency with and without the trigram index.
+
+Compares the previous full-table ``ILIKE '%term%'`` scan against
+SQLAlchemyItemRepository.find_by_name, which uses the FTS5 trigram index
+on SQLite (pg_trgm on PostgreSQL).
+
+Usage:
+    python -m benchmarks.bench_search --rows 1000000
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    ITEM_COLUMNS,
+    SQLAlchemyItemRepository,
+)
+from app.adapters.repositories.sqlalchemy_models import ItemModel
+from benchmarks.common import best_of, seeded_engine
+
+
+async def main(rows: int, limit: int) -> None:
+    """Run the benchmark and print the latency of each search path."""
+    # Seeded names are "Item 00000000", "Item 00000001", ...
+    terms = ["0012345", "99999", f"{rows // 2:08d}", "no such item"]
+
+    async with seeded_engine(rows) as engine:
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        print(f"{rows} rows, limit {limit}")
+        async with session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            for term in terms:
+
+                async def scan(term: str = term) -> list[object]:
+                    result = await session.execute(
+                        select(*ITEM_COLUMNS).where(ItemModel.name.ilike(f"%{term}%"))
+                    )
+                    return list(result.all())
+
+                async def indexed(term: str = term) -> list[object]:
+                    return await repository.find_by_name(term, limit)
+
+                scan_ms, matches = await best_of(scan, repeat=3)
+                indexed_ms, _ = await best_of(indexed, repeat=3)
+                print(
+                    f"  {term!r:<16} {len(matches):6d} matches "
+                    f"scan {scan_ms:8.2f} ms  indexed {indexed_ms:8.2f} ms"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.limit))
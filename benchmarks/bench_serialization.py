@@ -0,0 +1,89 @@
+"""Measure per-item cost of serializing a list response.
+
+Compares the previous list route path, where FastAPI validates the returned
+ItemListResponse against response_model again and encodes it with the
+standard library, against ModelResponse, which validates each item once and
+serializes straight to bytes. No database is involved.
+
+Usage:
+    python -m benchmarks.bench_serialization --items 10000
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from app.api.responses import ModelResponse
+from app.api.schemas import ItemListResponse, ItemResponse
+from app.core.domain.item import Item
+from app.main import app
+from benchmarks.common import best_of
+
+
+def make_items(count: int) -> list[Item]:
+    """Build domain items like those a repository returns.
+
+    Args:
+        count: Number of items
+
+    Returns:
+        list[Item]: Items with IDs and timestamps set
+    """
+    now = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    return [
+        Item(
+            id=i,
+            name=f"Item {i}",
+            description=f"Description for item {i}",
+            price=1.0 + i,
+            is_active=i % 3 != 0,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+async def main(count: int, repeat: int) -> None:
+    """Run the benchmark and print the cost per item of each path."""
+    items = make_items(count)
+    route = next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.path == "/api/items/"
+        and "GET" in route.methods
+    )
+
+    async def before() -> bytes:
+        response_items = [ItemResponse.model_validate(item) for item in items]
+        content = ItemListResponse(items=response_items, count=len(response_items))
+        encoded = await serialize_response(
+            field=route.response_field, response_content=content, is_coroutine=True
+        )
+        return JSONResponse(encoded).body
+
+    async def after() -> bytes:
+        return ModelResponse(ItemListResponse.from_items(items)).body
+
+    print(f"{count} items per response, best of {repeat}")
+    results = {}
+    for label, func in (("before", before), ("after", after)):
+        elapsed, body = await best_of(func, repeat)
+        results[label] = elapsed
+        print(
+            f"  {label:<7} {elapsed:8.1f} ms/response "
+            f"{elapsed * 1000 / count:6.2f} us/item ({len(body)} bytes)"
+        )
+    print(f"  speedup {results['before'] / results['after']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.repeat))
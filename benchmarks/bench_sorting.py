@@ -0,0 +1,91 @@
+"""Show that sorted top-k pages cost the same however large the table grows.
+
+Each table size is seeded separately. Sorted pages read ``limit + 1`` rows
+from the matching (column, id) index, while sorting on the client has to
+load the whole table first.
+
+Usage:
+    python -m benchmarks.bench_sorting --rows 10000 100000 1000000 --limit 20
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.adapters.repositories.sqlalchemy_item_repository import (
+    SQLAlchemyItemRepository,
+)
+from app.core.domain.item_filter import ItemFilter
+from app.core.domain.item_sort import ItemSort, ItemSortField
+from benchmarks.common import best_of, seeded_engine
+
+# Above this many rows the client-side sort takes too long to be worth timing
+MAX_CLIENT_SORT_ROWS = 100_000
+
+
+async def run(rows: int, limit: int) -> dict[str, float | None]:
+    """Time the sorted queries against a table of ``rows`` items."""
+    async with seeded_engine(rows) as engine:
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            repository = SQLAlchemyItemRepository(session)
+            cheapest = ItemSort(ItemSortField.PRICE)
+            active = ItemFilter(is_active=True)
+            # Resume after an item from the middle of the table
+            middle = await repository.get(rows // 2)
+            assert middle is not None
+            cursor = cheapest.encode_cursor(middle)
+
+            async def client_sort() -> object:
+                items = await repository.get_all(active)
+                return sorted(items, key=cheapest.key)[:limit]
+
+            cases = {
+                "cheapest active": lambda: repository.get_page(
+                    limit, filters=active, sort=cheapest
+                ),
+                "recently updated": lambda: repository.get_page(
+                    limit, sort=ItemSort(ItemSortField.UPDATED_AT, descending=True)
+                ),
+                "by name": lambda: repository.get_page(
+                    limit, sort=ItemSort(ItemSortField.NAME)
+                ),
+                "by price, from cursor": lambda: repository.get_page(
+                    limit, cursor, sort=cheapest
+                ),
+                "client-side sort": client_sort,
+            }
+
+            timings: dict[str, float | None] = {}
+            for label, func in cases.items():
+                if func is client_sort and rows > MAX_CLIENT_SORT_ROWS:
+                    timings[label] = None
+                    continue
+                repeat = 1 if func is client_sort else 5
+                timings[label], _ = await best_of(func, repeat)
+            return timings
+
+
+async def main(sizes: list[int], limit: int) -> None:
+    """Run the benchmark and print a table of timings."""
+    results = {rows: await run(rows, limit) for rows in sizes}
+
+    print(f"top {limit} items, ms")
+    print(f"  {'query':<22}" + "".join(f"{rows:>12}" for rows in sizes))
+    for label in results[sizes[0]]:
+        cells = []
+        for rows in sizes:
+            elapsed = results[rows][label]
+            cells.append(f"{'-':>12}" if elapsed is None else f"{elapsed:12.2f}")
+        print(f"  {label:<22}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.limit))
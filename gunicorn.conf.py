@@ -0,0 +1,26 @@
+"""Gunicorn settings, loaded automatically from the working directory.
+
+With PROMETHEUS_MULTIPROC_DIR set, workers write their metrics to files in
+that directory; these hooks start each server with an empty one and drop
+the live-only gauges of workers that exit.
+"""
+
+import os
+import shutil
+from typing import Any
+
+from prometheus_client import multiprocess
+
+
+def on_starting(server: Any) -> None:
+    """Clear metrics left over from a previous run."""
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    """Stop counting an exited worker's in-progress requests."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)